@@ -0,0 +1,68 @@
+-- ============================================================================
+-- Phase 4: 인증 성능 최적화 마이그레이션
+-- ============================================================================
+-- 인증 hot path(로그인/토큰 갱신/로그아웃)의 저장 구조와 인덱스를 최적화합니다.
+-- ============================================================================
+
+-- 1. refresh_tokens.token_hash: SHA-256 hex 문자열 → keyed BLAKE2b 바이너리(32바이트)
+-- 해시 알고리즘이 바뀌므로 기존 토큰은 더 이상 조회할 수 없습니다.
+-- 기존 Refresh Token을 폐기하고(재로그인 필요) 컬럼 타입을 BYTEA로 변경합니다.
+DELETE FROM refresh_tokens;
+
+ALTER TABLE refresh_tokens
+ALTER COLUMN token_hash TYPE BYTEA USING decode(token_hash, 'hex');
+
+COMMENT ON COLUMN refresh_tokens.token_hash IS 'Refresh Token의 keyed BLAKE2b 다이제스트 (32바이트)';
+
+-- 2. 로그인 조회용 커버링 인덱스 (index-only scan)
+-- CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로 psql 등에서 개별 실행합니다.
+-- 소셜 연동 조회는 (provider, provider_user_id)로 최대 한 행만 찾으므로 부분 인덱스 대신
+-- use_yn을 INCLUDE 컬럼으로 두어, use_yn 조건을 리터럴/바인드 어느 쪽으로 보내도
+-- 같은 인덱스로 index-only scan 합니다. (직원 조회는 5번의 부분 인덱스 사용)
+
+-- Google 연동 조회: (provider, provider_user_id, use_yn) → emp_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_social_auth_provider_covering
+ON user_social_auth(provider, provider_user_id) INCLUDE (emp_id, use_yn);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_social_auth_provider;
+ALTER INDEX idx_social_auth_provider_covering RENAME TO idx_social_auth_provider;
+
+-- 통계 갱신 (visibility map 갱신으로 index-only scan의 heap 확인을 줄임)
+VACUUM ANALYZE user_social_auth;
+
+-- 3. 타임스탬프 기본값을 DB 서버 UTC 시각으로 통일
+-- 애플리케이션은 created_at/updated_at 값을 보내지 않고 DB 기본값에 맡깁니다.
+-- CURRENT_TIMESTAMP는 세션 타임존 기준이므로 기존 UTC 데이터와 맞도록 timezone('utc', now())를 사용합니다.
+ALTER TABLE refresh_tokens
+ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE login_history
+ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE user_social_auth
+ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+-- 4. 유효 Refresh Token 조회용 부분 인덱스
+-- 조회 조건(token_hash, is_revoked = false, expires_at > now)을 인덱스만으로 처리합니다.
+-- is_revoked 단독 인덱스(불리언, 낮은 선택도)와 token_hash 단독 인덱스(UNIQUE 제약과 중복)는 제거합니다.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_refresh_token_hash_active
+ON refresh_tokens(token_hash, expires_at)
+WHERE is_revoked = false;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_refresh_token_hash;
+DROP INDEX CONCURRENTLY IF EXISTS idx_refresh_token_revoked;
+
+VACUUM ANALYZE refresh_tokens;
+
+-- 5. 이메일 로그인 조회용 부분 인덱스
+-- 애플리케이션이 use_yn/account_status 조건을 SQL 리터럴로 보내므로 generic plan에서도
+-- 부분 인덱스 조건과 일치합니다. 활성 직원만 담으므로 인덱스 크기도 작습니다.
+-- (이전 버전의 커버링 인덱스 idx_employee_company_email이 있으면 제거)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_employee_login_active
+ON employees(company_code, email)
+WHERE use_yn = 'Y' AND account_status = 'ACTIVE';
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_employee_company_email;
+
+VACUUM ANALYZE employees;
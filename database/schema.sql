@@ -214,7 +214,7 @@ CREATE TABLE IF NOT EXISTS REFRESH_TOKEN (
     TOKEN_ID SERIAL PRIMARY KEY,
     EMP_ID INTEGER NOT NULL,
     COMPANY_CODE VARCHAR(20) NOT NULL,
-    TOKEN_HASH VARCHAR(255) NOT NULL UNIQUE,  -- Refresh Token의 해시값
+    TOKEN_HASH BYTEA NOT NULL UNIQUE,  -- Refresh Token의 keyed BLAKE2b 다이제스트 (32바이트)
     EXPIRES_AT TIMESTAMP NOT NULL,
     DEVICE_INFO VARCHAR(200),  -- 디바이스 정보
     IP_ADDRESS VARCHAR(45),  -- IPv6 지원
@@ -229,12 +229,17 @@ CREATE TABLE IF NOT EXISTS REFRESH_TOKEN (
 );
 
 CREATE INDEX idx_refresh_token_emp ON REFRESH_TOKEN(EMP_ID);
-CREATE INDEX idx_refresh_token_hash ON REFRESH_TOKEN(TOKEN_HASH);
 CREATE INDEX idx_refresh_token_expires ON REFRESH_TOKEN(EXPIRES_AT);
-CREATE INDEX idx_refresh_token_revoked ON REFRESH_TOKEN(IS_REVOKED);
+
+-- 유효 토큰 조회(TOKEN_HASH, IS_REVOKED = FALSE, EXPIRES_AT > now)를 인덱스만으로 처리하는 부분 인덱스
+-- TOKEN_HASH 단독 인덱스(UNIQUE 제약과 중복)와 IS_REVOKED 단독 인덱스(낮은 선택도)는 두지 않습니다.
+-- (migration_phase4.sql 4번과 동일)
+CREATE INDEX idx_refresh_token_hash_active
+ON REFRESH_TOKEN(TOKEN_HASH, EXPIRES_AT)
+WHERE IS_REVOKED = FALSE;
 
 COMMENT ON TABLE REFRESH_TOKEN IS 'Refresh Token 저장소';
-COMMENT ON COLUMN REFRESH_TOKEN.TOKEN_HASH IS 'Refresh Token의 SHA-256 해시값';
+COMMENT ON COLUMN REFRESH_TOKEN.TOKEN_HASH IS 'Refresh Token의 keyed BLAKE2b 다이제스트';
 
 -- ============================================================================
 -- 9. 로그인 이력 (Audit)
@@ -6,11 +6,17 @@ Auth API 엔드포인트 (Phase 2: 고도화)
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Header, Request, status
+import orjson
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPAuthorizationCredentials
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from server.app.core.dependencies import get_db
+from server.app.core.config import settings
+from server.app.core.dependencies import bearer_scheme, get_db, get_read_db
+from server.app.domain.auth.formatters import _EXPIRES_IN_SECONDS, dump_login_response
+from server.app.domain.auth.providers import AuthProvider
 from server.app.domain.auth.schemas import (
     ChangePasswordRequest,
     ChangePasswordResponse,
@@ -21,15 +27,55 @@ from server.app.domain.auth.schemas import (
     LogoutResponse,
     RefreshTokenRequest,
     RefreshTokenResponse,
-    RoleInfo,
     UserInfo,
 )
 from server.app.domain.auth.google_oauth_service import GoogleOAuthService
 from server.app.domain.auth.service import AuthService
-from server.app.shared.exceptions import ApplicationException
-from server.app.shared.utils.jwt import verify_token
+from server.app.domain.auth.tokens import create_user_access_token
+from server.app.shared.exceptions import (
+    ApplicationException,
+    NotFoundException,
+    UnauthorizedException,
+)
+from server.app.shared.utils.jwt import hash_token, is_well_formed_token
+from server.app.shared.utils.jwt_cache import verify_token_cached
+
+router = APIRouter(
+    prefix="/auth",
+    tags=["authentication"],
+    default_response_class=ORJSONResponse,
+)
+
+# 헬스 체크 응답은 고정값이므로 import 시점에 한 번만 직렬화합니다.
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": "auth",
+    "version": "Phase 3",
+    "features": {
+        "login": "enabled",
+        "google_oauth": "enabled",
+        "refresh_token": "enabled",
+        "logout": "enabled",
+        "me": "enabled",
+        "hash_password": "enabled (DEBUG only)",
+    }
+})
+
+# 로그아웃 응답은 고정값이므로 한 번만 생성합니다. (frozen 모델)
+_LOGOUT_RESPONSE = LogoutResponse(
+    message="Successfully logged out",
+    success=True
+)
+
+
+def _login_json_response(response: LoginResponse) -> Response:
+    """
+    로그인 응답을 미리 직렬화된 고정 부분과 이어 붙여 JSON 바이트로 바로 반환합니다.
 
-router = APIRouter(prefix="/auth", tags=["authentication"])
+    Response 객체를 반환하면 FastAPI의 response_model 재검증과
+    dict 변환 + 재인코딩 단계를 건너뜁니다. (response_model은 OpenAPI 문서용으로 유지)
+    """
+    return Response(content=dump_login_response(response), media_type="application/json")
 
 
 @router.post(
@@ -41,7 +87,7 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
     이메일과 비밀번호로 로그인합니다.
 
     **멀티 테넌시**: company_code (숫자)로 회사를 구분합니다.
-    **인증 방식**: 평문 또는 BCRYPT 비밀번호 지원
+    **인증 방식**: 평문, Argon2id 또는 BCRYPT 비밀번호 지원
     **응답**: Access Token + Refresh Token + 사용자 정보 + 권한 목록
 
     **테스트 계정**:
@@ -58,7 +104,7 @@ async def login(
     request: LoginRequest,
     req: Request,
     db: AsyncSession = Depends(get_db),
-) -> LoginResponse:
+) -> Response:
     """일반 로그인 (ID/Password)"""
     service = AuthService(db=db)
 
@@ -75,7 +121,7 @@ async def login(
     if not result.success:
         raise ApplicationException(message=result.error or "Login failed", status_code=401)
 
-    return result.data
+    return _login_json_response(result.data)
 
 
 @router.post(
@@ -107,7 +153,7 @@ async def google_login(
     request: GoogleLoginRequest,
     req: Request,
     db: AsyncSession = Depends(get_db),
-) -> LoginResponse:
+) -> Response:
     """구글 OAuth 로그인"""
     service = GoogleOAuthService(db=db)
 
@@ -124,23 +170,49 @@ async def google_login(
             message=result.error or "Google login failed", status_code=401
         )
 
-    return result.data
+    return _login_json_response(result.data)
 
 
 class HashPasswordRequest(BaseModel):
-        emp_id: int
-        plain_password: str
+    """평문 비밀번호 해싱 요청 (개발용)"""
 
-@router.post("/hash-password")
+    emp_id: int = Field(..., description="직원 ID")
+    plain_password: str = Field(..., description="평문 비밀번호", min_length=1, max_length=100)
+
+
+@router.post(
+    "/hash-password",
+    response_model=ChangePasswordResponse,
+    status_code=status.HTTP_200_OK,
+    summary="평문 비밀번호 해싱 (개발용)",
+    description="""
+    평문으로 저장된 직원 비밀번호를 Argon2id 해시로 바꿉니다.
+
+    **주의**: 인증 없이 임의 직원의 비밀번호를 덮어쓰므로 DEBUG 모드에서만 동작합니다.
+    (운영 환경에서는 404)
+    """,
+)
 async def hash_password_utility(
     request: HashPasswordRequest,
     db: AsyncSession = Depends(get_db),
-):
+) -> ChangePasswordResponse:
+    """평문 비밀번호 해싱 (개발용)"""
+    if not settings.DEBUG:
+        raise NotFoundException(message="Not found")
+
     service = AuthService(db=db)
     success = await service.hash_user_password(
         request.emp_id, request.plain_password
     )
 
+    if not success:
+        raise NotFoundException(
+            message="Active employee not found",
+            details={"emp_id": request.emp_id}
+        )
+
+    return ChangePasswordResponse(message="Password hashed successfully", success=True)
+
 
 @router.post(
     "/refresh",
@@ -164,61 +236,36 @@ async def refresh_token(
     db: AsyncSession = Depends(get_db),
 ) -> RefreshTokenResponse:
     """Access Token 갱신"""
-    service = AuthService(db=db)
-
     # Service에 refresh_access_token 메서드가 있어야 합니다
     # 현재 Phase 1에서는 구현되지 않았으므로 간단히 구현
-    from server.app.domain.auth.providers import AuthProvider
-    from server.app.domain.auth.schemas import AuthProviderInput
-    from server.app.shared.utils.jwt import create_access_token, hash_token, verify_token
 
+    # Refresh Token 검증 (서명/만료/타입 오류는 상세 사유 없이 401로 통일)
     try:
-        # Refresh Token 검증
-        payload = verify_token(request.refresh_token, token_type="refresh")
+        verify_token_cached(request.refresh_token, token_type="refresh")
+    except UnauthorizedException:
+        raise UnauthorizedException(message="Invalid refresh token") from None
 
-        # DB에서 Refresh Token 확인
-        provider = AuthProvider(db)
-        token_hash = hash_token(request.refresh_token)
-        stored_token = await provider.get_refresh_token_by_hash(token_hash)
+    # DB에서 Refresh Token + 사용자 + 권한을 한 번에 확인
+    provider = AuthProvider(db)
+    token_hash = hash_token(request.refresh_token)
+    row = await provider.get_user_with_permissions_by_refresh_hash(token_hash)
 
-        if not stored_token:
-            raise ApplicationException(message="Invalid or revoked refresh token", status_code=401)
+    if not row:
+        raise UnauthorizedException(message="Invalid or revoked refresh token")
 
-        # 사용자 조회
-        emp_id = payload["emp_id"]
-        company_code = payload["company_code"]
+    user, permissions = row
 
-        provider_input = AuthProviderInput(
-            company_code=company_code,
-            emp_id=emp_id
-        )
-        provider_output = await provider.provide(provider_input)
-        user = provider_output.user
-
-        if not user:
-            raise ApplicationException(message="User not found", status_code=401)
-
-        # 새로운 Access Token 생성
-        access_token = create_access_token(data={
-            "sub": str(user.emp_id),
-            "company_code": user.company_code,
-            "emp_id": user.emp_id,
-            "duty_code_id": user.duty_code_id,
-            "permissions": provider_output.permissions,
-            "email": user.email,
-            "name": user.name
-        })
-
-        response = RefreshTokenResponse(
-            access_token=access_token,
-            token_type="bearer",
-            expires_in=30 * 60  # 30분 (초 단위)
-        )
+    # 새로운 Access Token 생성
+    access_token = create_user_access_token(user, permissions)
 
-        return response
+    # 서버에서 만든 값만 담으므로 검증 없이 생성
+    response = RefreshTokenResponse.model_construct(
+        access_token=access_token,
+        token_type="bearer",
+        expires_in=_EXPIRES_IN_SECONDS  # 로그인 응답과 같은 값
+    )
 
-    except Exception as e:
-        raise ApplicationException(message=f"Token refresh failed: {str(e)}", status_code=401)
+    return response
 
 
 @router.post(
@@ -243,23 +290,14 @@ async def logout(
     db: AsyncSession = Depends(get_db),
 ) -> LogoutResponse:
     """로그아웃"""
-    from server.app.domain.auth.providers import AuthProvider
-    from server.app.shared.utils.jwt import hash_token
-
-    try:
+    # JWT 형식이 아닌 토큰은 DB에 존재할 수 없으므로 해시/조회 없이 로그아웃 처리합니다.
+    # 예상치 못한 오류는 전역 예외 핸들러로 전파합니다.
+    if is_well_formed_token(request.refresh_token):
         provider = AuthProvider(db)
         token_hash = hash_token(request.refresh_token)
         await provider.revoke_refresh_token(token_hash)
 
-        response = LogoutResponse(
-            message="Successfully logged out",
-            success=True
-        )
-
-        return response
-
-    except Exception as e:
-        raise ApplicationException(message=f"Logout failed: {str(e)}", status_code=400)
+    return _LOGOUT_RESPONSE
 
 
 @router.get(
@@ -280,70 +318,52 @@ async def logout(
     """,
 )
 async def get_current_user(
-    authorization: Annotated[str | None, Header()] = None,
-    db: AsyncSession = Depends(get_db),
-) -> CurrentUserResponse:
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
+    read_db: AsyncSession = Depends(get_read_db),
+) -> ORJSONResponse:
     """현재 사용자 정보 조회"""
-    if not authorization or not authorization.startswith("Bearer "):
+    if not credentials:
         raise ApplicationException(message="Unauthorized", status_code=401)
 
-    from server.app.domain.auth.providers import AuthProvider
-    from server.app.domain.auth.schemas import AuthProviderInput
-
     # JWT에서 사용자 정보 추출
-    token = authorization.replace("Bearer ", "")
-    payload = verify_token(token, token_type="access")
+    token = credentials.credentials
+    payload = verify_token_cached(token, token_type="access")
     emp_id = payload["emp_id"]
     company_code = payload["company_code"]
 
-    # 사용자 정보 조회
-    provider = AuthProvider(db)
-    provider_input = AuthProviderInput(emp_id=emp_id, company_code=company_code)
-    provider_output = await provider.provide(provider_input)
+    # 사용자 정보 + 권한 + 메뉴를 단일 쿼리로 조회 (조회 전용 세션)
+    provider = AuthProvider(read_db)
+    projection = await provider.get_me_projection(
+        emp_id, company_code, duty_code_id=payload.get("duty_code_id")
+    )
 
-    if not provider_output.user:
+    if projection is None:
         raise ApplicationException(message="User not found", status_code=404)
 
-    user = provider_output.user
-
-    # UserInfo 생성
-    user_info = UserInfo(
-        emp_id=user.emp_id,
-        company_code=user.company_code,
-        email=user.email,
-        name=user.name,
-        emp_no=user.emp_no,
-        dept_id=user.dept_id,
-        duty_code_id=user.duty_code_id,
-        pos_code_id=user.pos_code_id,
-        phone=user.phone,
-        last_login_at=user.last_login_at,
-        use_yn=user.use_yn,
-    )
+    permissions = projection.pop("permissions")
+    menus = projection.pop("menus")
 
-    # 메뉴 권한 조회
-    menus = await provider.get_user_menus(user.duty_code_id, user.company_code)
+    # DB에서 온 신뢰 데이터이므로 검증 없이 UserInfo를 구성합니다.
+    user_info = UserInfo.model_construct(**projection)
 
     # 역할 정보 생성 (간단하게)
+    # 권한 문자열은 DB에서 온 신뢰 데이터이므로 RoleInfo 모델 검증 없이
+    # RoleInfo 스키마와 같은 모양의 dict를 바로 만듭니다.
     roles = [
-        RoleInfo(
-            role_code=perm,
-            role_name=perm,
-            permissions=[perm]
-        )
-        for perm in provider_output.permissions
+        {"role_code": perm, "role_name": perm, "permissions": [perm]}
+        for perm in permissions
     ]
 
-    response = CurrentUserResponse(
-        user=user_info,
-        roles=roles,
-        permissions=provider_output.permissions,
-    )
+    # 이미 검증된 모델로 응답 dict를 직접 구성합니다.
+    # (CurrentUserResponse 재검증 + jsonable_encoder 경로를 건너뜀)
+    payload = {
+        "user": user_info.model_dump(),
+        "roles": roles,
+        "permissions": permissions,
+        "menus": menus,
+    }
 
-    # 메뉴 정보 추가 (response에 menus 필드가 있다면)
-    # response.menus = menus
-
-    return response
+    return ORJSONResponse(content=payload)
 
 
 @router.get(
@@ -352,18 +372,6 @@ async def get_current_user(
     summary="Auth 서비스 헬스 체크",
     description="Auth 도메인의 상태를 확인합니다.",
 )
-async def health_check():
+async def health_check() -> Response:
     """헬스 체크"""
-    return {
-        "status": "healthy",
-        "service": "auth",
-        "version": "Phase 3",
-        "features": {
-            "login": "enabled",
-            "google_oauth": "enabled",
-            "refresh_token": "enabled",
-            "logout": "enabled",
-            "me": "enabled",
-            "hash_password": "enabled (dev only)",
-        }
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
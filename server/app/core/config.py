@@ -64,6 +64,10 @@ class Settings(BaseSettings):
         default=8000,
         description="서버 포트"
     )
+    SERVER_ACCESS_LOG: bool = Field(
+        default=False,
+        description="uvicorn 접근 로그 출력 여부 (운영 환경에서는 비활성화 권장)"
+    )
 
     # ====================
     # Database Settings
@@ -99,13 +103,25 @@ class Settings(BaseSettings):
         description="SQLAlchemy SQL 로깅 활성화"
     )
     DB_POOL_SIZE: int = Field(
-        default=5,
+        default=20,
         description="데이터베이스 커넥션 풀 크기"
     )
     DB_MAX_OVERFLOW: int = Field(
-        default=10,
+        default=40,
         description="데이터베이스 커넥션 풀 최대 오버플로우"
     )
+    DB_QUERY_CACHE_SIZE: int = Field(
+        default=1200,
+        description="SQLAlchemy 컴파일된 SQL 캐시 크기 (0이면 캐시 비활성화)"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=1800,
+        description="커넥션 재생성 주기 (초, 장시간 유휴 연결 끊김 방지)"
+    )
+    DATABASE_READ_URL: Optional[PostgresDsn] = Field(
+        default=None,
+        description="읽기 전용 복제본(Read Replica) URL (미설정 시 기본 DB 사용)"
+    )
 
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
@@ -148,13 +164,43 @@ class Settings(BaseSettings):
         default="HS256",
         description="JWT 서명 알고리즘"
     )
+    JWT_VERIFY_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="JWT 검증 결과 캐시 사용 여부 (폐기 반영이 최대 TTL만큼 늦어질 수 있음)"
+    )
+    JWT_VERIFY_CACHE_TTL_SECONDS: int = Field(
+        default=5,
+        ge=1,
+        le=60,
+        description="JWT 검증 결과 캐시 유지 시간 (초, 상한 60)"
+    )
+    TOKEN_HASH_KEY: str = Field(
+        default="your-token-hash-key-change-in-production",
+        max_length=64,
+        description="Refresh Token 해시(keyed BLAKE2b) 키 (최대 64바이트)"
+    )
+    ARGON2_TIME_COST: int = Field(
+        default=1,
+        ge=1,
+        description="Argon2id 반복 횟수 (t)"
+    )
+    ARGON2_MEMORY_COST: int = Field(
+        default=46 * 1024,
+        ge=8 * 1024,
+        description="Argon2id 메모리 사용량 (KiB, m, 기본 46MiB)"
+    )
+    ARGON2_PARALLELISM: int = Field(
+        default=1,
+        ge=1,
+        description="Argon2id 병렬도 (p)"
+    )
 
     # ====================
     # OAuth Settings
     # ====================
     GOOGLE_CLIENT_ID: Optional[str] = Field(
         default=None,
-        description="구글 OAuth 2.0 클라이언트 ID"
+        description="구글 OAuth 2.0 클라이언트 ID (ID 토큰 aud 검증용, 미설정 시 구글 로그인 거부)"
     )
     GOOGLE_CLIENT_SECRET: Optional[str] = Field(
         default=None,
@@ -184,6 +230,10 @@ class Settings(BaseSettings):
         default="https://oauth2.googleapis.com/tokeninfo",
         description="구글 토큰 검증 URL"
     )
+    GOOGLE_CERTS_URL: str = Field(
+        default="https://www.googleapis.com/oauth2/v3/certs",
+        description="구글 ID 토큰 서명 공개키(JWKS) URL"
+    )
     GOOGLE_API_TIMEOUT: float = Field(
         default=10.0,
         description="구글 API 요청 타임아웃 (초)"
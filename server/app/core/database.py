@@ -3,9 +3,10 @@
 SQLAlchemy 2.0 + asyncpg 기반 비동기 데이터베이스 연결
 """
 
-from typing import AsyncGenerator
+from contextvars import ContextVar
+from typing import AsyncGenerator, Optional
 
-from sqlalchemy import MetaData
+from sqlalchemy import MetaData, event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -19,14 +20,57 @@ from server.app.core.config import settings
 # Database Engine
 # ====================
 
-engine = create_async_engine(
-    str(settings.DATABASE_URL),
-    echo=settings.DB_ECHO,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_pre_ping=True,  # 연결 유효성 자동 검사
+_ENGINE_OPTIONS = {
+    "echo": settings.DB_ECHO,
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_pre_ping": True,  # 연결 유효성 자동 검사
+    "pool_recycle": settings.DB_POOL_RECYCLE,  # 오래된 연결 재생성
+    "query_cache_size": settings.DB_QUERY_CACHE_SIZE,  # 컴파일된 SQL 재사용
+}
+
+engine = create_async_engine(str(settings.DATABASE_URL), **_ENGINE_OPTIONS)
+
+# 읽기 전용 엔진 (Read Replica)
+# DATABASE_READ_URL이 없으면 기본 엔진을 그대로 사용합니다.
+read_engine = (
+    create_async_engine(str(settings.DATABASE_READ_URL), **_ENGINE_OPTIONS)
+    if settings.DATABASE_READ_URL
+    else engine
 )
 
+# ====================
+# Query Counter (개발 모드)
+# ====================
+
+# 요청별 SQL 실행 횟수 (N+1 쿼리 탐지용). DEBUG 모드에서만 리스너를 등록합니다.
+_query_counter: ContextVar[Optional[list[int]]] = ContextVar("query_counter", default=None)
+
+
+def start_query_count() -> list[int]:
+    """
+    현재 컨텍스트(요청)의 SQL 실행 횟수 집계를 시작합니다.
+
+    Returns:
+        list[int]: 집계 값을 담는 단일 원소 리스트 (counter[0])
+    """
+    counter = [0]
+    _query_counter.set(counter)
+    return counter
+
+
+def _count_query(*_args) -> None:
+    """before_cursor_execute 리스너: 집계 중인 요청이면 실행 횟수를 1 증가시킵니다."""
+    counter = _query_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+if settings.DEBUG:
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_query)
+    if read_engine is not engine:
+        event.listen(read_engine.sync_engine, "before_cursor_execute", _count_query)
+
 # ====================
 # Session Factory
 # ====================
@@ -39,6 +83,15 @@ AsyncSessionLocal = async_sessionmaker(
     autocommit=False,
 )
 
+# 조회 전용 세션 (쓰기 작업에 사용 금지)
+AsyncReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False,
+)
+
 # ====================
 # Base Model
 # ====================
@@ -80,7 +133,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     FastAPI dependency: 데이터베이스 세션 제공
 
     비동기 컨텍스트 매니저를 통해 세션을 생성하고
-    요청이 끝나면 자동으로 세션을 닫습니다.
+    요청이 끝나면 자동으로 세션을 닫습니다. (async with 종료 시 close 호출)
 
     사용법:
         @router.get("/users")
@@ -91,10 +144,22 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         AsyncSession: 데이터베이스 세션
     """
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency: 읽기 전용 데이터베이스 세션 제공
+
+    DATABASE_READ_URL이 설정되어 있으면 복제본에 연결합니다.
+    복제 지연이 있을 수 있으므로 방금 쓴 데이터를 다시 읽거나
+    조회 결과를 수정해 커밋하는 경로에는 get_db를 사용하세요.
+
+    Yields:
+        AsyncSession: 읽기 전용 데이터베이스 세션
+    """
+    async with AsyncReadSessionLocal() as session:
+        yield session
 
 
 # ====================
@@ -149,3 +214,5 @@ class DatabaseManager:
         애플리케이션 종료 시 호출되어야 합니다.
         """
         await engine.dispose()
+        if read_engine is not engine:
+            await read_engine.dispose()
@@ -12,10 +12,15 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from .config import settings
+from .database import start_query_count
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# DEBUG 모드에서 요청당 SQL 실행 횟수가 이 값을 넘으면 경고합니다. (N+1 탐지)
+QUERY_COUNT_WARN_THRESHOLD = 10
+
 
 # ====================
 # Request ID Middleware
@@ -48,6 +53,9 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         # 시작 시간 기록
         start_time = time.time()
 
+        # SQL 실행 횟수 집계 (DEBUG 모드)
+        query_counter = start_query_count() if settings.DEBUG else None
+
         # 요청 로깅
         logger.info(
             f"[req_id={request_id}] {request.method} {request.url.path}",
@@ -70,6 +78,14 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
             response.headers[self.REQUEST_ID_HEADER] = request_id
             response.headers["X-Process-Time"] = str(process_time)
 
+            if query_counter is not None:
+                response.headers["X-Query-Count"] = str(query_counter[0])
+                if query_counter[0] > QUERY_COUNT_WARN_THRESHOLD:
+                    logger.warning(
+                        f"[req_id={request_id}] {request.method} {request.url.path} "
+                        f"executed {query_counter[0]} SQL queries (possible N+1)"
+                    )
+
             # 응답 로깅
             logger.info(
                 f"[req_id={request_id}] {request.method} {request.url.path} - {response.status_code} ({process_time:.3f}s)",
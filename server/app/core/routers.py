@@ -4,6 +4,7 @@ Core 레벨 라우터
 도메인과 무관한 인프라 레벨의 공통 엔드포인트를 제공합니다.
 - Health Check: 서비스 상태 확인 (운영 모니터링용)
 - Version: 배포 버전 확인 (배포 추적용)
+- Pool: DB 커넥션 풀 상태 확인 (DEBUG 모드 전용)
 
 사용 가이드:
     이 라우터는 main.py에서 직접 등록되며,
@@ -17,6 +18,8 @@ from typing import Dict, Any
 from fastapi import APIRouter, status
 
 from server.app.core.config import settings
+from server.app.core.database import engine, read_engine
+from server.app.shared.exceptions import NotFoundException
 
 
 # ====================
@@ -106,6 +109,52 @@ class VersionService:
         }
 
 
+# ====================
+# Pool Status Service
+# ====================
+
+class PoolStatusService:
+    """
+    커넥션 풀 상태 서비스
+
+    인증처럼 지연에 민감한 요청이 커넥션 대기로 느려지는지 확인할 때 사용합니다.
+    checked_out이 pool_size + max_overflow에 가까우면 풀이 포화된 상태입니다.
+    """
+
+    @staticmethod
+    def _describe(pool: Any) -> Dict[str, Any]:
+        """
+        QueuePool 상태를 dict로 변환합니다.
+
+        Args:
+            pool: SQLAlchemy 커넥션 풀
+
+        Returns:
+            Dict: 풀 크기, 유휴/사용 중 연결 수, 오버플로우 수
+        """
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "status": pool.status(),
+        }
+
+    @classmethod
+    async def get_pool_status(cls) -> Dict[str, Any]:
+        """
+        기본 엔진과 읽기 엔진의 풀 상태 반환
+
+        Returns:
+            Dict: 엔진별 풀 상태 (읽기 엔진이 기본 엔진과 같으면 read는 None)
+        """
+        return {
+            "primary": cls._describe(engine.pool),
+            "read": cls._describe(read_engine.pool) if read_engine is not engine else None,
+        }
+
+
 # ====================
 # Endpoints
 # ====================
@@ -176,6 +225,37 @@ async def version_info() -> Dict[str, Any]:
     return await service.get_version_info()
 
 
+@router.get(
+    "/pool",
+    summary="커넥션 풀 상태",
+    description="""
+    데이터베이스 커넥션 풀 상태를 반환합니다. (DEBUG 모드에서만 제공)
+
+    **응답 항목:**
+    - `size`: 풀 크기 (pool_size)
+    - `checked_out`: 사용 중인 연결 수
+    - `overflow`: 풀 크기를 넘어 생성된 연결 수
+    """,
+    response_model=Dict[str, Any],
+    status_code=status.HTTP_200_OK,
+)
+async def pool_status() -> Dict[str, Any]:
+    """
+    커넥션 풀 상태 엔드포인트
+
+    Returns:
+        Dict: 엔진별 풀 상태
+
+    Raises:
+        NotFoundException: DEBUG 모드가 아닌 경우
+    """
+    if not settings.DEBUG:
+        raise NotFoundException(message="Not found")
+
+    service = PoolStatusService()
+    return await service.get_pool_status()
+
+
 # ====================
 # 확장 가이드
 # ====================
@@ -4,6 +4,12 @@ Auth 도메인 Formatter
 인증 응답 데이터를 포맷팅합니다.
 """
 
+import operator
+from typing import Final
+
+import orjson
+from pydantic_core import to_json
+
 from server.app.domain.auth.schemas import (
     AuthFormatterInput,
     LoginResponse,
@@ -12,6 +18,37 @@ from server.app.domain.auth.schemas import (
 from server.app.shared.base.formatter import BaseFormatter
 from server.app.core.config import settings
 
+# Employee → UserInfo로 복사할 필드 목록
+# attrgetter는 여러 속성 조회를 C 레벨에서 한 번에 수행합니다.
+_USER_INFO_FIELDS = (
+    "emp_id",
+    "company_code",
+    "email",
+    "name",
+    "emp_no",
+    "dept_id",
+    "duty_code_id",
+    "pos_code_id",
+    "phone",
+    "last_login_at",
+    "use_yn",
+)
+_get_user_info_values = operator.attrgetter(*_USER_INFO_FIELDS)
+
+# Access Token 만료 시간 (초 단위) - 설정값은 실행 중 바뀌지 않으므로 한 번만 계산
+_EXPIRES_IN_SECONDS: Final[int] = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# 로그인 응답 JSON 중 배포 단위로 고정된 부분은 import 시점에 한 번만 직렬화합니다.
+# 키 순서는 LoginResponse 필드 순서(model_dump_json 출력)와 같습니다.
+_LOGIN_JSON_PREFIX: Final[bytes] = b'{"access_token":'
+_LOGIN_JSON_REFRESH: Final[bytes] = b',"refresh_token":'
+_LOGIN_JSON_STATIC: Final[bytes] = (
+    b',"token_type":"bearer","expires_in":'
+    + orjson.dumps(_EXPIRES_IN_SECONDS)
+    + b',"user":'
+)
+_LOGIN_JSON_PERMISSIONS: Final[bytes] = b',"permissions":'
+
 
 class AuthFormatter(BaseFormatter[AuthFormatterInput, LoginResponse]):
     """
@@ -22,7 +59,27 @@ class AuthFormatter(BaseFormatter[AuthFormatterInput, LoginResponse]):
 
     async def format(self, input_data: AuthFormatterInput) -> LoginResponse:
         """
-        로그인 응답 데이터를 포맷팅합니다.
+        로그인 응답 데이터를 포맷팅합니다. (BaseFormatter 비동기 계약용)
+
+        내부에 await가 없으므로 서비스에서는 format_sync를 직접 호출합니다.
+
+        Args:
+            input_data: 사용자 정보, 토큰, 권한
+
+        Returns:
+            LoginResponse: 포맷팅된 로그인 응답
+        """
+        return self.format_sync(input_data)
+
+    def format_sync(self, input_data: AuthFormatterInput) -> LoginResponse:
+        """
+        로그인 응답 데이터를 동기적으로 포맷팅합니다.
+
+        코루틴 객체 생성/스케줄링 없이 바로 결과를 반환합니다.
+
+        참고: 응답 객체는 풀링(재사용)하지 않습니다. LoginResponse는 ServiceResult에
+        담겨 라우터까지 전달되므로 수명이 포맷터 밖으로 이어지고, 재사용 시 동시 요청
+        간에 토큰이 섞일 위험이 있습니다. 객체 2개 할당 비용은 pymalloc free list로 충분히 작습니다.
 
         Args:
             input_data: 사용자 정보, 토큰, 권한
@@ -33,28 +90,46 @@ class AuthFormatter(BaseFormatter[AuthFormatterInput, LoginResponse]):
         user = input_data.user
 
         # UserInfo 생성
-        user_info = UserInfo(
-            emp_id=user.emp_id,
-            company_code=user.company_code,
-            email=user.email,
-            name=user.name,
-            emp_no=user.emp_no,
-            dept_id=user.dept_id,
-            duty_code_id=user.duty_code_id,
-            pos_code_id=user.pos_code_id,
-            phone=user.phone,
-            last_login_at=user.last_login_at,
-            use_yn=user.use_yn
+        # ORM에서 읽은 신뢰 데이터이므로 필드별 검증 없이 구성합니다.
+        user_info = UserInfo.model_construct(
+            **dict(zip(_USER_INFO_FIELDS, _get_user_info_values(user)))
         )
 
-        # LoginResponse 생성
-        response = LoginResponse(
+        # LoginResponse 생성 (서버가 만든 값만 담으므로 검증 생략)
+        response = LoginResponse.model_construct(
             access_token=input_data.access_token,
             refresh_token=input_data.refresh_token,
             token_type="bearer",
-            expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,  # 초 단위로 변환
+            expires_in=_EXPIRES_IN_SECONDS,
             user=user_info,
             permissions=input_data.permissions
         )
 
         return response
+
+
+def dump_login_response(response: LoginResponse) -> bytes:
+    """
+    format_sync가 만든 로그인 응답을 JSON 바이트로 직렬화합니다.
+
+    token_type/expires_in 등 고정 부분은 미리 만든 바이트를 그대로 이어 붙이고,
+    요청마다 달라지는 토큰/사용자 정보/권한만 인코딩합니다.
+    결과는 response.model_dump_json()과 같은 JSON 문서입니다.
+
+    Args:
+        response: format_sync가 반환한 로그인 응답 (token_type="bearer", 고정 expires_in)
+
+    Returns:
+        bytes: 로그인 응답 JSON
+    """
+    return b"".join((
+        _LOGIN_JSON_PREFIX,
+        orjson.dumps(response.access_token),
+        _LOGIN_JSON_REFRESH,
+        orjson.dumps(response.refresh_token),
+        _LOGIN_JSON_STATIC,
+        to_json(response.user),
+        _LOGIN_JSON_PERMISSIONS,
+        orjson.dumps(response.permissions),
+        b"}",
+    ))
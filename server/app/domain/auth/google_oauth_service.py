@@ -4,19 +4,20 @@ Google OAuth Service (Phase 3)
 구글 OAuth 로그인 기능을 제공합니다.
 """
 
-from datetime import datetime
-from typing import Optional
-
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from server.app.core.logging import get_logger
 from server.app.domain.auth.formatters import AuthFormatter
+from server.app.domain.auth.login_audit import enqueue_login_attempt
+from server.app.domain.auth.models import utc_now
 from server.app.domain.auth.providers import AuthProvider
 from server.app.domain.auth.schemas import (
     AuthFormatterInput,
-    AuthProviderInput,
     GoogleLoginRequest,
     LoginResponse,
 )
+from server.app.domain.auth.tokens import issue_login_tokens
 from server.app.shared.base.service import BaseService
 from server.app.shared.exceptions import (
     ApplicationException,
@@ -25,12 +26,8 @@ from server.app.shared.exceptions import (
 )
 from server.app.shared.types import ServiceResult
 from server.app.shared.utils.google_oauth import verify_google_token
-from server.app.shared.utils.jwt import (
-    create_access_token,
-    create_refresh_token,
-    get_token_expiry,
-    hash_token,
-)
+
+logger = get_logger(__name__)
 
 
 class GoogleOAuthService(BaseService[GoogleLoginRequest, LoginResponse]):
@@ -61,6 +58,7 @@ class GoogleOAuthService(BaseService[GoogleLoginRequest, LoginResponse]):
         Raises:
             UnauthorizedException: 인증 실패
             BusinessLogicException: 사용자 없음 등
+            ApplicationException: Google 로그인 설정 누락 (503, GOOGLE_CLIENT_ID 미설정)
 
         프로세스:
         1. 구글 토큰 검증 → 구글 사용자 정보 추출
@@ -74,8 +72,13 @@ class GoogleOAuthService(BaseService[GoogleLoginRequest, LoginResponse]):
             try:
                 google_user = await verify_google_token(request.google_token)
             except ApplicationException as e:
+                # 서버 설정 오류(GOOGLE_CLIENT_ID 미설정 등, 5xx)는 토큰 문제가 아니므로
+                # 401로 바꾸지 않고 전역 예외 핸들러로 전파합니다.
+                if e.status_code >= 500:
+                    raise
+
                 # 로그인 실패 기록
-                await self.provider.log_login_attempt(
+                enqueue_login_attempt(
                     company_code=request.company_code,
                     email="unknown",
                     login_method="GOOGLE",
@@ -88,37 +91,21 @@ class GoogleOAuthService(BaseService[GoogleLoginRequest, LoginResponse]):
                 raise UnauthorizedException(
                     message="Invalid Google token",
                     details={"error": e.message},
-                )
+                ) from None
 
-            # 2. user_social_auth 테이블에서 기존 연동 조회
-            provider_input = AuthProviderInput(
-                company_code=request.company_code, google_id=google_user.sub
+            # 2. 연동 정보 + 사용자 + 권한을 한 번에 조회
+            #    (연동이 있으면 연동된 직원, 없으면 이메일로 찾은 직원)
+            user, permissions, linked = await self.provider.provide_google_login(
+                company_code=request.company_code,
+                google_sub=google_user.sub,
+                email=google_user.email,
             )
-            provider_output = await self.provider.provide(provider_input)
-            social_auth = provider_output.social_auth
-
-            user = None
-
-            if social_auth:
-                # 3. 기존 연동이 있는 경우 → 연결된 사용자 조회
-                user_input = AuthProviderInput(
-                    company_code=request.company_code, emp_id=social_auth.emp_id
-                )
-                user_output = await self.provider.provide(user_input)
-                user = user_output.user
-                permissions = user_output.permissions
-            else:
-                # 4. 기존 연동이 없는 경우 → 이메일로 사용자 찾기
-                email_input = AuthProviderInput(
-                    company_code=request.company_code, email=google_user.email
-                )
-                email_output = await self.provider.provide(email_input)
-                user = email_output.user
-                permissions = email_output.permissions
 
+            if not linked:
+                # 3~4. 기존 연동이 없는 경우 → 이메일로 찾은 사용자 확인
                 if not user:
                     # 사용자를 찾을 수 없음
-                    await self.provider.log_login_attempt(
+                    enqueue_login_attempt(
                         company_code=request.company_code,
                         email=google_user.email,
                         login_method="GOOGLE",
@@ -137,17 +124,8 @@ class GoogleOAuthService(BaseService[GoogleLoginRequest, LoginResponse]):
                         },
                     )
 
-                # 5. 구글 계정과 직원 연동 생성
-                await self.provider.create_social_auth(
-                    emp_id=user.emp_id,
-                    provider="GOOGLE",
-                    provider_user_id=google_user.sub,
-                    profile_data={
-                        "email": google_user.email,
-                        "name": google_user.name,
-                        "picture": google_user.picture,
-                    },
-                )
+            # 5. 구글 계정과 직원 연동 생성 (로그인 성공 기록과 같은 SQL 문으로 저장)
+            social_link = None if linked else ("GOOGLE", google_user.sub)
 
             # 6. 계정 상태 확인
             if not user:
@@ -157,53 +135,28 @@ class GoogleOAuthService(BaseService[GoogleLoginRequest, LoginResponse]):
                 )
 
             # 7. 계정 잠김 확인
-            if user.account_locked_until and user.account_locked_until > datetime.utcnow():
+            if user.account_locked_until and user.account_locked_until > utc_now():
                 raise BusinessLogicException(
                     message="Account is locked due to multiple failed login attempts",
                     details={"locked_until": user.account_locked_until.isoformat()},
                 )
 
             # 8. JWT 토큰 생성
-            access_token = create_access_token(
-                data={
-                    "sub": str(user.emp_id),
-                    "company_code": user.company_code,
-                    "emp_id": user.emp_id,
-                    "duty_code_id": user.duty_code_id,
-                    "permissions": permissions,
-                    "email": user.email,
-                    "name": user.name,
-                }
-            )
+            tokens = issue_login_tokens(user, permissions)
 
-            refresh_token = create_refresh_token(
-                data={
-                    "sub": str(user.emp_id),
-                    "company_code": user.company_code,
-                    "emp_id": user.emp_id,
-                }
+            # 9~10. 연동 생성 + Refresh Token 저장 + 마지막 로그인 시간 업데이트 (단일 SQL 문으로 한 번에 커밋)
+            await self.provider.record_login_success(
+                user=user,
+                token_hash=tokens.refresh_token_hash,
+                expires_at=tokens.refresh_expires_at,
+                device_info=request.device_info,
+                ip_address=kwargs.get("ip_address"),
+                user_agent=kwargs.get("user_agent"),
+                social_link=social_link,
             )
 
-            # 9. Refresh Token 저장
-            token_hash = hash_token(refresh_token)
-            expires_at = get_token_expiry(refresh_token)
-
-            if expires_at:
-                await self.provider.save_refresh_token(
-                    emp_id=user.emp_id,
-                    company_code=user.company_code,
-                    token_hash=token_hash,
-                    expires_at=expires_at,
-                    device_info=request.device_info,
-                    ip_address=kwargs.get("ip_address"),
-                    user_agent=kwargs.get("user_agent"),
-                )
-
-            # 10. 마지막 로그인 시간 업데이트
-            await self.provider.update_last_login(user.emp_id)
-
-            # 11. 로그인 성공 기록
-            await self.provider.log_login_attempt(
+            # 11. 로그인 성공 기록 (백그라운드 큐)
+            enqueue_login_attempt(
                 company_code=request.company_code,
                 email=user.email,
                 login_method="GOOGLE",
@@ -217,15 +170,16 @@ class GoogleOAuthService(BaseService[GoogleLoginRequest, LoginResponse]):
             # 12. 응답 포맷팅
             formatter_input = AuthFormatterInput(
                 user=user,
-                access_token=access_token,
-                refresh_token=refresh_token,
+                access_token=tokens.access_token,
+                refresh_token=tokens.refresh_token,
                 permissions=permissions,
             )
-            response = await self.formatter.format(formatter_input)
+            response = self.formatter.format_sync(formatter_input)
 
             return ServiceResult.ok(response)
 
         except (UnauthorizedException, BusinessLogicException) as e:
             return ServiceResult.fail(e.message)
-        except Exception as e:
-            return ServiceResult.fail(f"Google OAuth login failed: {str(e)}")
+        except SQLAlchemyError as e:
+            logger.error("Google OAuth login DB error: %s", type(e).__name__)
+            return ServiceResult.fail("Google OAuth login failed")
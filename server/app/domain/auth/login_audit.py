@@ -0,0 +1,209 @@
+"""
+로그인 이력 비동기 기록기
+
+로그인 이력(login_history) 기록은 응답에 필요하지 않으므로 요청 경로에서 분리합니다.
+서비스는 큐에 행을 넣기만 하고, 백그라운드 워커가 모아서 일괄 기록합니다. (INSERT 또는 COPY)
+
+사용법:
+    # 애플리케이션 시작/종료 (lifespan)
+    start_login_audit_worker()
+    ...
+    await stop_login_audit_worker()
+
+    # 서비스
+    enqueue_login_attempt(company_code=100, email="a@b.com", login_method="PASSWORD", success=True)
+"""
+
+import asyncio
+from typing import Any, Optional
+
+from sqlalchemy import insert
+
+from server.app.core.database import AsyncSessionLocal, engine
+from server.app.core.logging import get_logger
+from server.app.domain.auth.models import LoginHistory, utc_now
+
+logger = get_logger(__name__)
+
+# ====================
+# Queue Settings
+# ====================
+
+AUDIT_QUEUE_MAXSIZE = 10_000
+AUDIT_BATCH_SIZE = 500
+AUDIT_FLUSH_INTERVAL_SECONDS = 0.1
+
+# 이 크기 이상의 배치는 INSERT 대신 COPY FROM STDIN으로 기록합니다. (SQL 파싱 없음)
+AUDIT_COPY_THRESHOLD = 100
+
+# COPY 대상 컬럼 (enqueue_login_attempt가 만드는 행의 키와 같은 순서)
+_COPY_COLUMNS = (
+    "emp_id",
+    "company_code",
+    "email",
+    "login_method",
+    "login_success",
+    "failure_reason",
+    "ip_address",
+    "user_agent",
+    "device_info",
+    "created_at",
+)
+
+_audit_queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+_worker_task: Optional[asyncio.Task] = None
+
+# 워커 종료 신호
+_STOP = object()
+
+# 큐가 가득 차서 버려진 이력 수 (모니터링용)
+dropped_count = 0
+
+
+def enqueue_login_attempt(
+    company_code: Optional[int],
+    email: str,
+    login_method: str,
+    success: bool,
+    emp_id: Optional[int] = None,
+    failure_reason: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+    device_info: Optional[str] = None
+) -> None:
+    """
+    로그인 시도를 기록 큐에 넣습니다. (대기하지 않음)
+
+    큐가 가득 찬 경우 이력을 버리고 경고 로그를 남깁니다.
+
+    Args:
+        company_code: 회사 코드
+        email: 이메일
+        login_method: 로그인 방법 (PASSWORD, GOOGLE 등)
+        success: 성공 여부
+        emp_id: 직원 ID (성공 시)
+        failure_reason: 실패 사유
+        ip_address: IP 주소
+        user_agent: User Agent
+        device_info: 디바이스 정보
+    """
+    global dropped_count
+
+    row = {
+        "emp_id": emp_id,
+        "company_code": company_code,
+        "email": email,
+        "login_method": login_method,
+        "login_success": success,
+        "failure_reason": failure_reason,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "device_info": device_info,
+        "created_at": utc_now(),  # 기록 시점이 아닌 시도 시점
+    }
+
+    try:
+        _audit_queue.put_nowait(row)
+    except asyncio.QueueFull:
+        dropped_count += 1
+        logger.warning(f"Login audit queue full, dropped entry (total dropped: {dropped_count})")
+
+
+async def _collect_batch() -> tuple[list[dict[str, Any]], bool]:
+    """
+    첫 행을 기다린 뒤 AUDIT_FLUSH_INTERVAL_SECONDS 동안 최대 AUDIT_BATCH_SIZE 행을 모읍니다.
+
+    Returns:
+        tuple: (INSERT할 행 목록, 종료 신호 수신 여부)
+    """
+    batch: list[dict[str, Any]] = []
+    item = await _audit_queue.get()
+    if item is _STOP:
+        return batch, True
+    batch.append(item)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + AUDIT_FLUSH_INTERVAL_SECONDS
+
+    while len(batch) < AUDIT_BATCH_SIZE:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            item = await asyncio.wait_for(_audit_queue.get(), timeout)
+        except asyncio.TimeoutError:
+            break
+        if item is _STOP:
+            return batch, True
+        batch.append(item)
+
+    return batch, False
+
+
+async def _copy_batch(batch: list[dict[str, Any]]) -> None:
+    """
+    asyncpg의 COPY 프로토콜로 행을 기록합니다.
+
+    Args:
+        batch: 기록할 행 목록
+    """
+    records = [tuple(row[column] for column in _COPY_COLUMNS) for row in batch]
+
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            LoginHistory.__tablename__, records=records, columns=_COPY_COLUMNS
+        )
+
+
+async def _write_batch(batch: list[dict[str, Any]]) -> None:
+    """
+    모은 행을 기록합니다.
+
+    AUDIT_COPY_THRESHOLD 이상이면 COPY, 그보다 작으면 하나의 executemany INSERT를 사용합니다.
+
+    Args:
+        batch: 기록할 행 목록
+    """
+    try:
+        if len(batch) >= AUDIT_COPY_THRESHOLD:
+            await _copy_batch(batch)
+            return
+
+        async with AsyncSessionLocal() as session:
+            await session.execute(insert(LoginHistory), batch)
+            await session.commit()
+    except Exception:
+        logger.exception("Failed to write %s login audit entries", len(batch))
+
+
+async def _audit_worker() -> None:
+    """큐를 비우며 일괄 INSERT를 반복하는 백그라운드 워커 (종료 신호까지 모두 기록)"""
+    stopping = False
+    while not stopping:
+        batch, stopping = await _collect_batch()
+        if batch:
+            await _write_batch(batch)
+
+
+def start_login_audit_worker() -> None:
+    """백그라운드 워커를 시작합니다. (애플리케이션 시작 시 호출)"""
+    global _worker_task
+
+    if _worker_task is None or _worker_task.done():
+        _worker_task = asyncio.create_task(_audit_worker())
+
+
+async def stop_login_audit_worker() -> None:
+    """
+    큐에 남은 이력을 모두 기록한 뒤 워커를 종료합니다. (애플리케이션 종료 시 호출)
+    """
+    global _worker_task
+
+    if _worker_task is None:
+        return
+
+    # 종료 신호는 FIFO 순서상 기존 이력 뒤에 처리되므로 남은 이력이 모두 기록됩니다.
+    await _audit_queue.put(_STOP)
+    await _worker_task
+    _worker_task = None
@@ -7,9 +7,13 @@ Auth 도메인 SQLAlchemy 모델 (기존 DB 구조 기반)
 - role_groups (역할 그룹)
 - duty_role_mapping (직급-역할 매핑)
 - user_social_auth (소셜 로그인)
+
+컬렉션 관계는 lazy="raise_on_sql"로 선언합니다.
+비동기 세션에서는 암묵적 지연 로딩을 할 수 없으므로, 필요한 쿼리에서
+selectinload()로 명시적으로 로드합니다. (joinedload는 행 수를 곱으로 늘림)
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 from sqlalchemy import (
@@ -21,14 +25,38 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
+    func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from server.app.core.database import Base
 
 
+# ====================
+# Server-side Timestamp
+# ====================
+
+# 타임스탬프 컬럼(TIMESTAMP WITHOUT TIME ZONE)은 UTC 기준으로 저장합니다.
+# Python에서 datetime을 만들어 전송하지 않고 DB가 직접 값을 채웁니다.
+# (Provider의 UPDATE 문에서도 같은 표현식을 사용합니다)
+def utc_now_sql():
+    """DB 서버의 현재 UTC 시각 SQL 표현식 (timezone('utc', now()))"""
+    return func.timezone("utc", func.now())
+
+
+def utc_now() -> datetime:
+    """
+    현재 UTC 시각 (tzinfo 없음, TIMESTAMP WITHOUT TIME ZONE 컬럼과 비교/저장용)
+
+    datetime.utcnow()는 Python 3.12부터 deprecated이므로 대신 사용합니다.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class Company(Base):
     """회사 정보 (기존 companies 테이블)"""
 
@@ -39,13 +67,13 @@ class Company(Base):
     domain: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     use_yn: Mapped[str] = mapped_column(CHAR(1), default="Y", nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=utc_now_sql(), nullable=False
     )
     updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
     employees: Mapped[list["Employee"]] = relationship(
-        back_populates="company"
+        back_populates="company", lazy="raise_on_sql"
     )
 
 
@@ -70,7 +98,7 @@ class Employee(Base):
     account_status: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     use_yn: Mapped[str] = mapped_column(CHAR(1), default="Y", nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=utc_now_sql(), nullable=False
     )
     login_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     password: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -86,13 +114,24 @@ class Employee(Base):
         back_populates="employees"
     )
     social_auths: Mapped[list["UserSocialAuth"]] = relationship(
-        back_populates="employee", cascade="all, delete-orphan"
+        back_populates="employee", cascade="all, delete-orphan", lazy="raise_on_sql"
     )
     duty_role_mappings: Mapped[list["DutyRoleMapping"]] = relationship(
         back_populates="employee",
         primaryjoin="and_(Employee.duty_code_id==DutyRoleMapping.duty_code_id, Employee.company_code==DutyRoleMapping.company_code)",
         foreign_keys="[DutyRoleMapping.duty_code_id, DutyRoleMapping.company_code]",
-        viewonly=True
+        viewonly=True,
+        lazy="raise_on_sql"
+    )
+
+    __table_args__ = (
+        # 로그인 조회(company_code, email)용 부분 인덱스 (활성 직원만)
+        Index(
+            "idx_employee_login_active",
+            "company_code",
+            "email",
+            postgresql_where=text("use_yn = 'Y' AND account_status = 'ACTIVE'"),
+        ),
     )
 
 
@@ -110,10 +149,10 @@ class RoleGroup(Base):
 
     # Relationships
     duty_role_mappings: Mapped[list["DutyRoleMapping"]] = relationship(
-        back_populates="role_group"
+        back_populates="role_group", lazy="raise_on_sql"
     )
     role_menu_maps: Mapped[list["RoleMenuMap"]] = relationship(
-        back_populates="role_group"
+        back_populates="role_group", lazy="raise_on_sql"
     )
 
 
@@ -152,7 +191,9 @@ class Menu(Base):
     use_yn: Mapped[str] = mapped_column(CHAR(1), default="Y", nullable=False)
 
     # Relationships
-    role_menu_maps: Mapped[list["RoleMenuMap"]] = relationship(back_populates="menu")
+    role_menu_maps: Mapped[list["RoleMenuMap"]] = relationship(
+        back_populates="menu", lazy="raise_on_sql"
+    )
 
 
 class RoleMenuMap(Base):
@@ -186,11 +227,24 @@ class UserSocialAuth(Base):
     provider: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     provider_user_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     use_yn: Mapped[str] = mapped_column(CHAR(1), default="Y", nullable=False)
-    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, server_default=utc_now_sql(), nullable=True
+    )
 
     # Relationships
     employee: Mapped["Employee"] = relationship(back_populates="social_auths")
 
+    __table_args__ = (
+        # Google 연동 조회를 index-only scan으로 처리하기 위한 커버링 인덱스
+        Index(
+            "idx_social_auth_provider",
+            "provider",
+            "provider_user_id",
+            postgresql_include=["emp_id", "use_yn"],
+        ),
+        Index("idx_social_auth_emp", "emp_id"),
+    )
+
 
 class RefreshToken(Base):
     """Refresh Token 저장소 (신규 테이블 - 필요시 생성)"""
@@ -202,7 +256,7 @@ class RefreshToken(Base):
         Integer, ForeignKey("employees.emp_id"), nullable=False
     )
     company_code: Mapped[int] = mapped_column(Integer, nullable=False)
-    token_hash: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False, unique=True)
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     device_info: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
@@ -210,17 +264,23 @@ class RefreshToken(Base):
     is_revoked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     revoked_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=utc_now_sql(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=utc_now_sql(), onupdate=utc_now_sql(), nullable=False
     )
 
     __table_args__ = (
         Index("idx_refresh_token_emp", "emp_id"),
-        Index("idx_refresh_token_hash", "token_hash"),
+        # 유효 토큰 조회용 부분 인덱스 (token_hash 조회 + expires_at 비교를 인덱스만으로 처리)
+        # token_hash 단독 조회는 UNIQUE 제약 인덱스가 담당합니다.
+        Index(
+            "idx_refresh_token_hash_active",
+            "token_hash",
+            "expires_at",
+            postgresql_where=text("is_revoked = false"),
+        ),
         Index("idx_refresh_token_expires", "expires_at"),
-        Index("idx_refresh_token_revoked", "is_revoked"),
     )
 
 
@@ -240,7 +300,7 @@ class LoginHistory(Base):
     user_agent: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     device_info: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=utc_now_sql(), nullable=False
     )
 
     __table_args__ = (
@@ -4,26 +4,596 @@ Auth 도메인 Provider (기존 DB 구조 기반)
 사용자 인증 데이터 조회를 담당합니다.
 """
 
+import logging
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy import select
+from cachetools import TTLCache
+from sqlalchemy import and_, bindparam, case, func, insert, literal_column, select, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, load_only, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from server.app.core.database import AsyncReadSessionLocal
+from server.app.core.logging import get_logger
+from server.app.domain.auth.login_audit import enqueue_login_attempt
 from server.app.domain.auth.models import (
     DutyRoleMapping,
     Employee,
-    LoginHistory,
     Menu,
     RefreshToken,
     RoleGroup,
     RoleMenuMap,
     UserSocialAuth,
+    utc_now,
+    utc_now_sql,
 )
 from server.app.domain.auth.schemas import AuthProviderInput, AuthProviderOutput
 from server.app.shared.base.provider import BaseProvider
 
+logger = get_logger(__name__)
+
+# ====================
+# Prebuilt Statements
+# ====================
+
+
+def _mapped_role_group_ids(duty_code_id, company_code):
+    """
+    직급/회사에 매핑된 역할 그룹 ID 서브쿼리를 만듭니다.
+
+    역할 그룹/메뉴 조회는 이 서브쿼리에 대한 IN(semi-join)으로 거르므로
+    매핑 행 수만큼 결과가 늘어나지 않아 DISTINCT 정렬/해시가 필요 없습니다.
+
+    Args:
+        duty_code_id: 직급 ID 표현식 (bindparam 또는 상관 컬럼)
+        company_code: 회사 코드 표현식 (bindparam 또는 상관 컬럼)
+
+    Returns:
+        Select: SELECT role_group_id FROM duty_role_mapping WHERE ...
+    """
+    return (
+        select(DutyRoleMapping.role_group_id)
+        .where(
+            DutyRoleMapping.duty_code_id == duty_code_id,
+            DutyRoleMapping.company_code == company_code,
+            DutyRoleMapping.use_yn == "Y"
+        )
+        # 상관 컬럼(Employee)으로 호출되면 바깥 사용자 조회문에 상관시킵니다. (중첩 단계와 무관)
+        .correlate_except(DutyRoleMapping)
+    )
+
+
+def _role_group_names(duty_code_id, company_code):
+    """
+    직급/회사의 권한(역할 그룹 이름) 배열 조회문을 만듭니다.
+
+    DISTINCT는 조인 중복 제거가 아니라 이름이 같은 역할 그룹을 하나로 합치기 위한 것으로,
+    매핑된 역할 그룹 행(보통 몇 개)에만 적용됩니다.
+
+    Args:
+        duty_code_id: 직급 ID 표현식
+        company_code: 회사 코드 표현식
+
+    Returns:
+        Select: array_agg(DISTINCT role_group_name)
+    """
+    return (
+        select(func.array_agg(func.distinct(RoleGroup.role_group_name)))
+        .where(
+            RoleGroup.role_group_id.in_(_mapped_role_group_ids(duty_code_id, company_code)),
+            RoleGroup.use_yn == "Y",
+            RoleGroup.role_group_name.isnot(None)
+        )
+    )
+
+
+def _mapped_menu_ids(duty_code_id, company_code):
+    """
+    직급/회사에 매핑된 (활성) 메뉴 ID 서브쿼리를 만듭니다.
+
+    Args:
+        duty_code_id: 직급 ID 표현식
+        company_code: 회사 코드 표현식
+
+    Returns:
+        Select: SELECT menu_id FROM role_menu_map WHERE role_group_id IN (...)
+    """
+    return (
+        select(RoleMenuMap.menu_id)
+        .join(RoleGroup, RoleGroup.role_group_id == RoleMenuMap.role_group_id)
+        .where(
+            RoleGroup.role_group_id.in_(_mapped_role_group_ids(duty_code_id, company_code)),
+            RoleGroup.use_yn == "Y",
+            RoleMenuMap.use_yn == "Y"
+        )
+        .correlate_except(RoleMenuMap, RoleGroup)
+    )
+
+
+def _permissions_subquery():
+    """
+    Employee 행에 상관된 권한(역할 그룹 이름) 배열 서브쿼리를 만듭니다.
+
+    Returns:
+        ScalarSelect: array_agg(DISTINCT role_group_name)
+    """
+    return (
+        _role_group_names(Employee.duty_code_id, Employee.company_code)
+        .correlate(Employee)
+        .scalar_subquery()
+    )
+
+
+def _menus_subquery():
+    """
+    Employee 행에 상관된 메뉴 권한 JSON 배열 서브쿼리를 만듭니다.
+
+    Returns:
+        ScalarSelect: jsonb_agg(메뉴 객체)
+    """
+    menu_obj = func.jsonb_build_object(
+        "menu_id", Menu.menu_id,
+        "menu_name", Menu.menu_name,
+        "menu_path", Menu.menu_path,
+        "parent_menu_id", Menu.parent_menu_id,
+        "menu_order", Menu.menu_order,
+    )
+    return (
+        select(func.jsonb_agg(menu_obj))
+        .where(
+            Menu.menu_id.in_(_mapped_menu_ids(Employee.duty_code_id, Employee.company_code)),
+            Menu.use_yn == "Y"
+        )
+        .correlate(Employee)
+        .scalar_subquery()
+    )
+
+
+# 활성 직원 조건은 바인드 파라미터가 아닌 SQL 리터럴로 렌더링합니다.
+# (prepared statement의 generic plan에서도 부분 인덱스 idx_employee_login_active 조건과 일치)
+_ACTIVE_EMPLOYEE = and_(
+    Employee.use_yn == literal_column("'Y'"),
+    Employee.account_status == literal_column("'ACTIVE'")
+)
+
+
+# 로그인/토큰 갱신에서 사용하는 Employee 컬럼만 로드합니다. (UserInfo 필드 + 인증 상태)
+# hire_date, user_category, login_id 등 나머지 컬럼은 로드하지 않으며, 접근 시 예외가 발생합니다.
+_LOAD_LOGIN_USER = load_only(
+    Employee.emp_id,
+    Employee.company_code,
+    Employee.email,
+    Employee.name,
+    Employee.emp_no,
+    Employee.dept_id,
+    Employee.duty_code_id,
+    Employee.pos_code_id,
+    Employee.phone,
+    Employee.last_login_at,
+    Employee.use_yn,
+    Employee.account_status,
+    Employee.password,
+    Employee.failed_login_count,
+    Employee.account_locked_until,
+    raiseload=True,
+)
+
+# 로그인마다 실행되는 조회문은 모듈 로드 시 한 번만 구성하고 bindparam으로 값을 바인딩합니다.
+# (호출마다 select().where() 표현식 트리를 다시 만들지 않고, 컴파일 캐시도 항상 적중)
+# 권한 배열을 같은 행에 함께 가져와 권한 캐시 미스 시의 추가 왕복을 없앱니다.
+_SELECT_USER_BY_EMAIL = (
+    select(Employee, _permissions_subquery().label("permissions"))
+    .options(_LOAD_LOGIN_USER)
+    .where(
+        Employee.company_code == bindparam("company_code"),
+        Employee.email == bindparam("email"),
+        _ACTIVE_EMPLOYEE
+    )
+)
+
+_SELECT_USER_BY_ID = (
+    select(Employee, _permissions_subquery().label("permissions"))
+    .options(_LOAD_LOGIN_USER)
+    .where(
+        Employee.emp_id == bindparam("emp_id"),
+        Employee.company_code == bindparam("company_code"),
+        _ACTIVE_EMPLOYEE
+    )
+)
+
+# 권한 단독 조회도 상관 서브쿼리와 같은 array_agg 형태로 한 행에 받아
+# Python에서 행을 순회하며 리스트를 만들지 않습니다. (모든 경로에서 같은 정렬/중복 제거 결과)
+_SELECT_PERMISSIONS = _role_group_names(bindparam("duty_code_id"), bindparam("company_code"))
+
+# 메뉴는 응답 dict에 필요한 컬럼만 조회합니다. (Menu ORM 엔티티 생성/identity map 등록 없음)
+_SELECT_MENUS = (
+    select(
+        Menu.menu_id,
+        Menu.menu_name,
+        Menu.menu_path,
+        Menu.parent_menu_id,
+        Menu.menu_order
+    )
+    .where(
+        Menu.menu_id.in_(_mapped_menu_ids(bindparam("duty_code_id"), bindparam("company_code"))),
+        Menu.use_yn == "Y"
+    )
+)
+
+# /auth/me: UserInfo 컬럼만 projection 하고 (ORM 엔티티 생성 없음),
+# 권한/메뉴는 캐시에 없는 것만 상관 서브쿼리(array_agg / jsonb_agg)로 함께 가져옵니다.
+_ME_COLUMNS = (
+    Employee.emp_id,
+    Employee.company_code,
+    Employee.email,
+    Employee.name,
+    Employee.emp_no,
+    Employee.dept_id,
+    Employee.duty_code_id,
+    Employee.pos_code_id,
+    Employee.phone,
+    Employee.last_login_at,
+    Employee.use_yn,
+)
+
+
+def _select_me(include_permissions: bool, include_menus: bool):
+    """
+    /auth/me 조회문을 만듭니다. (모듈 로드 시 조합별로 한 번만 호출)
+
+    Args:
+        include_permissions: 권한 배열 서브쿼리 포함 여부
+        include_menus: 메뉴 JSON 배열 서브쿼리 포함 여부
+
+    Returns:
+        Select: emp_id / company_code 를 bindparam으로 받는 조회문
+    """
+    columns = list(_ME_COLUMNS)
+    if include_permissions:
+        columns.append(_permissions_subquery().label("permissions"))
+    if include_menus:
+        columns.append(_menus_subquery().label("menus"))
+
+    return (
+        select(*columns)
+        .where(
+            Employee.emp_id == bindparam("emp_id"),
+            Employee.company_code == bindparam("company_code"),
+            _ACTIVE_EMPLOYEE
+        )
+    )
+
+
+# (권한 서브쿼리 포함 여부, 메뉴 서브쿼리 포함 여부) → 조회문
+_SELECT_ME_STATEMENTS = {
+    (include_permissions, include_menus): _select_me(include_permissions, include_menus)
+    for include_permissions in (False, True)
+    for include_menus in (False, True)
+}
+
+_SELECT_SOCIAL_AUTH = (
+    select(UserSocialAuth)
+    .where(
+        UserSocialAuth.provider == bindparam("provider"),
+        UserSocialAuth.provider_user_id == bindparam("provider_user_id"),
+        UserSocialAuth.use_yn == "Y"
+    )
+    # 다대일(스칼라) 관계의 joinedload는 행을 늘리지 않으므로 unique() 처리가 필요 없습니다.
+    # 그 밖의 관계는 raiseload로 막아 암묵적 지연 로딩(N+1)을 즉시 드러냅니다.
+    .options(joinedload(UserSocialAuth.employee), raiseload("*"))
+)
+
+# 구글 로그인: 기존 연동(emp_id)을 조회하고, 연동이 없으면 이메일로 직원을 찾습니다.
+_GOOGLE_LINKED = (
+    select(
+        select(UserSocialAuth.emp_id)
+        .where(
+            UserSocialAuth.provider == "GOOGLE",
+            UserSocialAuth.provider_user_id == bindparam("google_sub"),
+            UserSocialAuth.use_yn == "Y"
+        )
+        .limit(1)
+        .scalar_subquery()
+        .label("emp_id")
+    )
+    .subquery("linked")
+)
+
+_SELECT_GOOGLE_LOGIN = (
+    select(
+        _GOOGLE_LINKED.c.emp_id,
+        Employee,
+        _permissions_subquery().label("permissions")
+    )
+    .select_from(_GOOGLE_LINKED)
+    .options(_LOAD_LOGIN_USER)
+    .outerjoin(
+        Employee,
+        and_(
+            Employee.company_code == bindparam("company_code"),
+            _ACTIVE_EMPLOYEE,
+            case(
+                (_GOOGLE_LINKED.c.emp_id.isnot(None), Employee.emp_id == _GOOGLE_LINKED.c.emp_id),
+                else_=Employee.email == bindparam("email")
+            )
+        )
+    )
+)
+
+# 만료 비교는 DB 시각(utc_now_sql)으로 수행하므로 바인드 값은 token_hash 하나뿐입니다.
+_SELECT_REFRESH_TOKEN = (
+    select(RefreshToken)
+    .where(
+        RefreshToken.token_hash == bindparam("token_hash"),
+        RefreshToken.is_revoked == False,
+        RefreshToken.expires_at > utc_now_sql()
+    )
+)
+
+# 토큰 갱신은 토큰 행의 존재만 확인하면 되므로 RefreshToken 엔티티는 로드하지 않고
+# 토큰 소유자(Employee)와 권한 배열만 가져옵니다.
+_SELECT_REFRESH_TOKEN_WITH_USER = (
+    select(Employee, _permissions_subquery().label("permissions"))
+    .select_from(RefreshToken)
+    .join(Employee, Employee.emp_id == RefreshToken.emp_id)
+    .options(_LOAD_LOGIN_USER)
+    .where(
+        RefreshToken.token_hash == bindparam("token_hash"),
+        RefreshToken.is_revoked == False,
+        RefreshToken.expires_at > utc_now_sql(),
+        Employee.company_code == RefreshToken.company_code,
+        _ACTIVE_EMPLOYEE
+    )
+)
+
+_REVOKE_REFRESH_TOKEN = (
+    update(RefreshToken)
+    .where(
+        RefreshToken.token_hash == bindparam("token_hash"),
+        RefreshToken.is_revoked == False
+    )
+    .values(is_revoked=True, revoked_at=utc_now_sql())
+    # 세션에 로드된 RefreshToken 객체가 없으므로 동기화 생략
+    .execution_options(synchronize_session=False)
+)
+
+# 직원/토큰 상태 갱신문도 모듈 로드 시 한 번만 구성합니다.
+# 세션에 로드된 Employee의 동기화(evaluate/fetch)는 생략하며, 각 메서드가 요청 단위 사용자 캐시를 비웁니다.
+_UPDATE_LAST_LOGIN = (
+    update(Employee)
+    .where(Employee.emp_id == bindparam("target_emp_id"))
+    .values(last_login_at=utc_now_sql(), failed_login_count=0, account_locked_until=None)
+    .execution_options(synchronize_session=False)
+)
+
+_UPDATE_PASSWORD = (
+    update(Employee)
+    .where(Employee.emp_id == bindparam("target_emp_id"), _ACTIVE_EMPLOYEE)
+    .values(password=bindparam("password_hash"), password_changed_at=utc_now_sql())
+    .execution_options(synchronize_session=False)
+)
+
+_FAILED_LOGIN_COUNT = func.coalesce(Employee.failed_login_count, 0) + 1
+
+_INCREMENT_FAILED_LOGIN = (
+    update(Employee)
+    .where(Employee.emp_id == bindparam("target_emp_id"))
+    .values(
+        failed_login_count=_FAILED_LOGIN_COUNT,
+        # 5회 이상 실패 시 계정 잠금 (30분)
+        account_locked_until=case(
+            (_FAILED_LOGIN_COUNT >= 5, utc_now_sql() + timedelta(minutes=30)),
+            else_=Employee.account_locked_until
+        )
+    )
+    .returning(Employee.failed_login_count)
+    .execution_options(synchronize_session=False)
+)
+
+# 로그인 성공 후처리: Refresh Token INSERT를 데이터 변경 CTE로 붙여
+# 직원 UPDATE와 함께 하나의 SQL 문(DB 왕복 1회)으로 실행합니다.
+# (INSERT/UPDATE 대상 컬럼과 같은 이름의 bindparam은 쓸 수 없으므로 rt_ 접두어 사용)
+_INSERT_LOGIN_REFRESH_TOKEN = (
+    insert(RefreshToken)
+    .values(
+        emp_id=bindparam("target_emp_id"),
+        company_code=bindparam("rt_company_code"),
+        token_hash=bindparam("rt_token_hash"),
+        expires_at=bindparam("rt_expires_at"),
+        device_info=bindparam("rt_device_info"),
+        ip_address=bindparam("rt_ip_address"),
+        user_agent=bindparam("rt_user_agent"),
+        is_revoked=False
+    )
+    .returning(RefreshToken.token_id)
+    .cte("new_refresh_token")
+)
+
+_RECORD_LOGIN = (
+    update(Employee)
+    .where(Employee.emp_id == bindparam("target_emp_id"))
+    .values(last_login_at=bindparam("login_at"), failed_login_count=0, account_locked_until=None)
+    .execution_options(synchronize_session=False)
+)
+
+# 첫 소셜 로그인: 연동 INSERT도 같은 SQL 문의 CTE로 붙입니다. (sa_ 접두어)
+_INSERT_LOGIN_SOCIAL_AUTH = (
+    insert(UserSocialAuth)
+    .values(
+        emp_id=bindparam("target_emp_id"),
+        provider=bindparam("sa_provider"),
+        provider_user_id=bindparam("sa_provider_user_id"),
+        use_yn="Y"
+    )
+    .returning(UserSocialAuth.social_id)
+    .cte("new_social_auth")
+)
+
+_RECORD_LOGIN_WITH_TOKEN = _RECORD_LOGIN.add_cte(_INSERT_LOGIN_REFRESH_TOKEN)
+
+# (Refresh Token 저장 여부, 소셜 연동 생성 여부) → 실행할 문장
+_RECORD_LOGIN_STATEMENTS = {
+    (False, False): _RECORD_LOGIN,
+    (True, False): _RECORD_LOGIN_WITH_TOKEN,
+    (False, True): _RECORD_LOGIN.add_cte(_INSERT_LOGIN_SOCIAL_AUTH),
+    (True, True): _RECORD_LOGIN_WITH_TOKEN.add_cte(_INSERT_LOGIN_SOCIAL_AUTH),
+}
+
+# ====================
+# Menu Cache
+# ====================
+
+# 메뉴 구조는 거의 바뀌지 않으므로 (duty_code_id, company_code) 단위로 캐시합니다.
+# 직급/회사 조합은 수백 개 수준이라 maxsize=2048이면 전체 작업 집합을 담을 수 있습니다.
+# 메뉴 매핑 변경 시에는 invalidate_menus/clear_menu_cache로 즉시 반영합니다.
+MENU_CACHE_MAXSIZE = 2048
+MENU_CACHE_TTL_SECONDS = 300
+
+_MENU_CACHE: TTLCache = TTLCache(maxsize=MENU_CACHE_MAXSIZE, ttl=MENU_CACHE_TTL_SECONDS)
+
+
+def clear_menu_cache() -> None:
+    """메뉴 캐시를 비웁니다. (메뉴/역할 매핑 변경 시 호출)"""
+    _MENU_CACHE.clear()
+
+
+def invalidate_menus(duty_code_id: int, company_code: int) -> None:
+    """
+    특정 직급/회사의 메뉴 캐시 항목만 제거합니다. (해당 직급의 메뉴 매핑 변경 시 호출)
+
+    Args:
+        duty_code_id: 직급 ID
+        company_code: 회사 코드
+    """
+    _MENU_CACHE.pop((duty_code_id, company_code), None)
+
+
+# 전체 (직급, 회사) → 메뉴 목록을 한 번에 조회하는 조회문 (캐시 워밍업용)
+_SELECT_ALL_MENUS = (
+    select(
+        DutyRoleMapping.duty_code_id,
+        DutyRoleMapping.company_code,
+        Menu.menu_id,
+        Menu.menu_name,
+        Menu.menu_path,
+        Menu.parent_menu_id,
+        Menu.menu_order
+    )
+    .join(RoleGroup, RoleGroup.role_group_id == DutyRoleMapping.role_group_id)
+    .join(RoleMenuMap, RoleMenuMap.role_group_id == RoleGroup.role_group_id)
+    .join(Menu, Menu.menu_id == RoleMenuMap.menu_id)
+    .where(
+        DutyRoleMapping.duty_code_id.isnot(None),
+        DutyRoleMapping.use_yn == "Y",
+        RoleGroup.use_yn == "Y",
+        RoleMenuMap.use_yn == "Y",
+        Menu.use_yn == "Y"
+    )
+    .distinct()
+)
+
+
+async def warm_menu_cache() -> int:
+    """
+    모든 직급/회사의 메뉴 목록을 한 번의 쿼리로 조회해 메뉴 캐시를 미리 채웁니다.
+
+    애플리케이션 시작 시 호출하여 첫 로그인/내 정보 조회부터 메뉴 조인을 생략합니다.
+    DB에 연결할 수 없으면 경고만 남기고 0을 반환합니다.
+
+    Returns:
+        int: 캐시에 채운 (직급, 회사) 항목 수
+    """
+    try:
+        async with AsyncReadSessionLocal() as session:
+            result = await session.execute(_SELECT_ALL_MENUS)
+            rows = result.mappings().all()
+    except (SQLAlchemyError, OSError) as e:
+        logger.warning(f"Menu cache warm-up skipped: {e}")
+        return 0
+
+    menus: dict[tuple[int, int], list[dict]] = {}
+    for row in rows:
+        menu = dict(row)
+        key = (menu.pop("duty_code_id"), menu.pop("company_code"))
+        menus.setdefault(key, []).append(menu)
+
+    _MENU_CACHE.update(menus)
+    return len(menus)
+
+
+# ====================
+# Permission Cache
+# ====================
+
+# 권한(역할 그룹 이름) 목록도 직급/회사 단위로 결정되므로 같은 방식으로 캐시합니다.
+# 로그인/토큰 발급 시 동일한 리스트 객체를 재사용하여 조회와 리스트 생성을 생략합니다.
+PERMISSION_CACHE_MAXSIZE = 2048
+PERMISSION_CACHE_TTL_SECONDS = 60
+
+_PERMISSION_CACHE: TTLCache = TTLCache(
+    maxsize=PERMISSION_CACHE_MAXSIZE, ttl=PERMISSION_CACHE_TTL_SECONDS
+)
+
+
+def clear_permission_cache() -> None:
+    """권한 캐시를 비웁니다. (역할 그룹/직급 매핑 변경 시 호출)"""
+    _PERMISSION_CACHE.clear()
+
+
+def invalidate_permissions(duty_code_id: int, company_code: int) -> None:
+    """
+    특정 직급/회사의 권한 캐시 항목만 제거합니다. (해당 직급의 역할 매핑 변경 시 호출)
+
+    Args:
+        duty_code_id: 직급 ID
+        company_code: 회사 코드
+    """
+    _PERMISSION_CACHE.pop((duty_code_id, company_code), None)
+
+
+# 전체 (직급, 회사) → 권한 목록을 한 번에 구성하는 조회문 (캐시 워밍업용)
+_SELECT_ALL_PERMISSIONS = (
+    select(
+        DutyRoleMapping.duty_code_id,
+        DutyRoleMapping.company_code,
+        func.array_agg(func.distinct(RoleGroup.role_group_name))
+    )
+    .join(RoleGroup, RoleGroup.role_group_id == DutyRoleMapping.role_group_id)
+    .where(
+        DutyRoleMapping.use_yn == "Y",
+        RoleGroup.use_yn == "Y",
+        RoleGroup.role_group_name.isnot(None)
+    )
+    .group_by(DutyRoleMapping.duty_code_id, DutyRoleMapping.company_code)
+)
+
+
+async def warm_permission_cache() -> int:
+    """
+    모든 직급/회사의 권한 목록을 한 번의 쿼리로 조회해 권한 캐시를 미리 채웁니다.
+
+    애플리케이션 시작 시 호출하여 첫 로그인부터 권한 조회 왕복을 없앱니다.
+    이후에는 TTL 만료 시 요청 경로에서 개별 항목이 다시 채워집니다.
+    DB에 연결할 수 없으면 경고만 남기고 0을 반환합니다.
+
+    Returns:
+        int: 캐시에 채운 (직급, 회사) 항목 수
+    """
+    try:
+        async with AsyncReadSessionLocal() as session:
+            result = await session.execute(_SELECT_ALL_PERMISSIONS)
+            rows = result.all()
+    except (SQLAlchemyError, OSError) as e:
+        logger.warning(f"Permission cache warm-up skipped: {e}")
+        return 0
+
+    for duty_code_id, company_code, permissions in rows:
+        _PERMISSION_CACHE[(duty_code_id, company_code)] = list(permissions or [])
+
+    return len(rows)
+
 
 class AuthProvider(BaseProvider[AuthProviderInput, AuthProviderOutput]):
     """
@@ -32,13 +602,23 @@ class AuthProvider(BaseProvider[AuthProviderInput, AuthProviderOutput]):
     기존 employees, duty_role_mapping 테이블을 사용합니다.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, read_db: Optional[AsyncSession] = None):
         super().__init__(db)
+        # 조회 전용 세션 (권한/메뉴/내 정보 조회). 로그인 시 수정할 사용자, Refresh Token처럼
+        # 최신 상태가 필요하거나 같은 세션에서 갱신하는 조회는 기본 세션(db)을 사용합니다.
+        self.read_db = read_db or db
+        # 요청 단위 사용자 캐시 (Provider는 요청 세션마다 생성됨)
+        # ("id", emp_id, company_code) / ("email", email, company_code) → Employee
+        self._user_cache: dict[tuple, Employee] = {}
 
     async def provide(self, input_data: AuthProviderInput) -> AuthProviderOutput:
         """
         인증 데이터를 조회합니다.
 
+        사용자와 권한은 DB 왕복 1회로 조회됩니다. 사용자 조회문이 권한 배열을
+        상관 서브쿼리로 함께 가져와 권한 캐시를 채우므로, 이어지는
+        get_user_permissions는 캐시에서 바로 응답합니다.
+
         Args:
             input_data: 조회 조건 (company_code + email 또는 emp_id)
 
@@ -93,29 +673,22 @@ class AuthProvider(BaseProvider[AuthProviderInput, AuthProviderOutput]):
         Returns:
             Employee | None: 사용자 정보
         """
-        # 디버그 로그
-        print(f"[DEBUG] AuthProvider.get_user_by_email - company_code: {company_code}, email: {email}")
+        cached = self._user_cache.get(("email", email, company_code))
+        if cached is not None:
+            return cached
 
-        stmt = (
-            select(Employee)
-            .where(
-                Employee.company_code == company_code,
-                Employee.email == email,
-                Employee.use_yn == "Y",
-                Employee.account_status == "ACTIVE"
-            )
+        result = await self.db.execute(
+            _SELECT_USER_BY_EMAIL, {"company_code": company_code, "email": email}
         )
+        user = self._store_user_permissions(result.one_or_none())
+        self._cache_user(user)
 
-        # 디버그 로그: SQL 쿼리 출력
-        print(f"[DEBUG] SQL Query: {stmt}")
-
-        result = await self.db.execute(stmt)
-        user = result.scalar_one_or_none()
-
-        # 디버그 로그
-        print(f"[DEBUG] Query result - user found: {user is not None}")
-        if user:
-            print(f"[DEBUG] Found user - emp_id: {user.emp_id}, email: {user.email}, company_code: {user.company_code}, use_yn: {user.use_yn}, account_status: {user.account_status}")
+        # 디버그 로그 (DEBUG 레벨이 아니면 문자열 포맷팅도 하지 않음)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "get_user_by_email company_code=%s found=%s",
+                company_code, user is not None
+            )
 
         return user
 
@@ -134,19 +707,30 @@ class AuthProvider(BaseProvider[AuthProviderInput, AuthProviderOutput]):
         Returns:
             Employee | None: 사용자 정보
         """
-        stmt = (
-            select(Employee)
-            .where(
-                Employee.emp_id == emp_id,
-                Employee.company_code == company_code,
-                Employee.use_yn == "Y",
-                Employee.account_status == "ACTIVE"
-            )
+        cached = self._user_cache.get(("id", emp_id, company_code))
+        if cached is not None:
+            return cached
+
+        result = await self.db.execute(
+            _SELECT_USER_BY_ID, {"emp_id": emp_id, "company_code": company_code}
         )
-        result = await self.db.execute(stmt)
-        user = result.scalar_one_or_none()
+        user = self._store_user_permissions(result.one_or_none())
+        self._cache_user(user)
         return user
 
+    def _cache_user(self, user: Optional[Employee]) -> None:
+        """
+        조회한 사용자를 id/email 두 키로 요청 단위 캐시에 저장합니다.
+
+        Args:
+            user: 조회한 사용자 (None이면 저장하지 않음)
+        """
+        if user is None:
+            return
+
+        self._user_cache[("id", user.emp_id, user.company_code)] = user
+        self._user_cache[("email", user.email, user.company_code)] = user
+
     async def get_user_permissions(
         self,
         emp_id: int,
@@ -162,26 +746,21 @@ class AuthProvider(BaseProvider[AuthProviderInput, AuthProviderOutput]):
             company_code: 회사 코드
 
         Returns:
-            list[str]: 역할 그룹 이름 목록
+            list[str]: 역할 그룹 이름 목록 (캐시와 공유되므로 수정하지 마세요)
         """
         if not duty_code_id:
             return []
 
+        cache_key = (duty_code_id, company_code)
+        cached = _PERMISSION_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         # duty_role_mapping을 통해 role_group 조회
-        stmt = (
-            select(RoleGroup.role_group_name)
-            .join(DutyRoleMapping, DutyRoleMapping.role_group_id == RoleGroup.role_group_id)
-            .where(
-                DutyRoleMapping.duty_code_id == duty_code_id,
-                DutyRoleMapping.company_code == company_code,
-                DutyRoleMapping.use_yn == "Y",
-                RoleGroup.use_yn == "Y"
-            )
-            .distinct()
+        result = await self.read_db.execute(
+            _SELECT_PERMISSIONS, {"duty_code_id": duty_code_id, "company_code": company_code}
         )
-        result = await self.db.execute(stmt)
-        roles = [row[0] for row in result.all() if row[0]]
-        return roles
+        return self._store_permissions(duty_code_id, company_code, result.scalar())
 
     async def get_user_menus(
         self,
@@ -196,39 +775,156 @@ class AuthProvider(BaseProvider[AuthProviderInput, AuthProviderOutput]):
             company_code: 회사 코드
 
         Returns:
-            list[dict]: 메뉴 정보 목록
+            list[dict]: 메뉴 정보 목록 (캐시와 공유되므로 수정하지 마세요)
         """
         if not duty_code_id:
             return []
 
-        stmt = (
-            select(Menu)
-            .join(RoleMenuMap, RoleMenuMap.menu_id == Menu.menu_id)
-            .join(RoleGroup, RoleGroup.role_group_id == RoleMenuMap.role_group_id)
-            .join(DutyRoleMapping, DutyRoleMapping.role_group_id == RoleGroup.role_group_id)
-            .where(
-                DutyRoleMapping.duty_code_id == duty_code_id,
-                DutyRoleMapping.company_code == company_code,
-                DutyRoleMapping.use_yn == "Y",
-                RoleGroup.use_yn == "Y",
-                RoleMenuMap.use_yn == "Y",
-                Menu.use_yn == "Y"
+        cache_key = (duty_code_id, company_code)
+        cached = _MENU_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = await self.read_db.execute(
+            _SELECT_MENUS, {"duty_code_id": duty_code_id, "company_code": company_code}
+        )
+        menu_list = [dict(row) for row in result.mappings()]
+        _MENU_CACHE[cache_key] = menu_list
+        return menu_list
+
+    @staticmethod
+    def _store_permissions(
+        duty_code_id: Optional[int],
+        company_code: int,
+        permissions: Optional[list[str]]
+    ) -> list[str]:
+        """
+        서브쿼리로 함께 조회한 권한 목록을 권한 캐시에 채워 넣습니다.
+
+        Args:
+            duty_code_id: 직급 ID
+            company_code: 회사 코드
+            permissions: array_agg 결과 (없으면 None)
+
+        Returns:
+            list[str]: 권한 목록
+        """
+        permissions = list(permissions or [])
+        if duty_code_id:
+            _PERMISSION_CACHE[(duty_code_id, company_code)] = permissions
+        return permissions
+
+    def _store_user_permissions(self, row) -> Optional[Employee]:
+        """
+        (Employee, permissions) 조회 결과에서 권한을 캐시에 채우고 사용자만 반환합니다.
+
+        이어지는 get_user_permissions 호출은 DB 왕복 없이 캐시에서 응답합니다.
+
+        Args:
+            row: 사용자 조회 결과 행 (없으면 None)
+
+        Returns:
+            Employee | None: 사용자 정보
+        """
+        if row is None:
+            return None
+
+        user, permissions = row
+        self._store_permissions(user.duty_code_id, user.company_code, permissions)
+        return user
+
+    async def get_me_projection(
+        self,
+        emp_id: int,
+        company_code: int,
+        duty_code_id: Optional[int] = None
+    ) -> Optional[dict[str, Any]]:
+        """
+        /auth/me 응답에 필요한 컬럼, 권한, 메뉴를 한 번의 쿼리로 조회합니다.
+
+        ORM 엔티티를 만들지 않고 필요한 컬럼만 projection 하며,
+        권한과 메뉴는 상관 서브쿼리(array_agg / jsonb_agg)로 함께 가져옵니다.
+        duty_code_id(JWT 값)의 권한/메뉴가 이미 캐시되어 있으면 해당 서브쿼리는 생략합니다.
+
+        Args:
+            emp_id: 직원 ID
+            company_code: 회사 코드
+            duty_code_id: 직급 ID (권한/메뉴 캐시 조회용 힌트)
+
+        Returns:
+            dict | None: UserInfo 필드 + permissions + menus
+        """
+        cache_key = (duty_code_id, company_code)
+        include_permissions = cache_key not in _PERMISSION_CACHE
+        include_menus = cache_key not in _MENU_CACHE
+
+        result = await self.read_db.execute(
+            _SELECT_ME_STATEMENTS[(include_permissions, include_menus)],
+            {"emp_id": emp_id, "company_code": company_code}
+        )
+        row = result.mappings().one_or_none()
+
+        if row is None:
+            return None
+
+        projection = dict(row)
+
+        if include_permissions:
+            projection["permissions"] = self._store_permissions(
+                projection["duty_code_id"], company_code, projection["permissions"]
+            )
+        else:
+            # 캐시 적중 (DB의 직급이 JWT와 다르면 get_user_permissions가 다시 조회)
+            projection["permissions"] = await self.get_user_permissions(
+                emp_id, projection["duty_code_id"], company_code
+            )
+
+        if include_menus:
+            menus = list(projection["menus"] or [])
+            if projection["duty_code_id"]:
+                _MENU_CACHE[(projection["duty_code_id"], company_code)] = menus
+            projection["menus"] = menus
+        else:
+            # 캐시 적중 (DB의 직급이 JWT와 다르면 get_user_menus가 다시 조회)
+            projection["menus"] = await self.get_user_menus(
+                projection["duty_code_id"], company_code
             )
-            .distinct()
+
+        return projection
+
+    async def provide_google_login(
+        self,
+        company_code: int,
+        google_sub: str,
+        email: str
+    ) -> tuple[Optional[Employee], list[str], bool]:
+        """
+        구글 로그인에 필요한 사용자, 권한, 연동 여부를 한 번의 쿼리로 조회합니다.
+
+        user_social_auth 연동이 있으면 연동된 직원을, 없으면 이메일이 같은 직원을
+        employees와 LEFT JOIN 하고, 권한은 상관 서브쿼리(array_agg)로 함께 가져옵니다.
+        연동 여부(use_yn)는 캐시하지 않고 매번 DB에서 확인합니다.
+        (연동 해제가 다른 워커의 프로세스 캐시에는 반영되지 않으므로)
+
+        Args:
+            company_code: 회사 코드
+            google_sub: 구글 고유 ID (sub)
+            email: 구글 계정 이메일
+
+        Returns:
+            tuple: (사용자 정보 | None, 권한 목록, 기존 연동 여부)
+        """
+        result = await self.db.execute(
+            _SELECT_GOOGLE_LOGIN,
+            {"google_sub": google_sub, "company_code": company_code, "email": email}
         )
-        result = await self.db.execute(stmt)
-        menus = result.scalars().all()
-
-        return [
-            {
-                "menu_id": menu.menu_id,
-                "menu_name": menu.menu_name,
-                "menu_path": menu.menu_path,
-                "parent_menu_id": menu.parent_menu_id,
-                "menu_order": menu.menu_order
-            }
-            for menu in menus
-        ]
+        linked_emp_id, user, permissions = result.one()
+
+        if user is None:
+            return None, [], linked_emp_id is not None
+
+        permissions = self._store_permissions(user.duty_code_id, user.company_code, permissions)
+        return user, permissions, linked_emp_id is not None
 
     async def get_social_auth(
         self,
@@ -245,17 +941,10 @@ class AuthProvider(BaseProvider[AuthProviderInput, AuthProviderOutput]):
         Returns:
             UserSocialAuth | None: 소셜 인증 정보
         """
-        stmt = (
-            select(UserSocialAuth)
-            .where(
-                UserSocialAuth.provider == provider,
-                UserSocialAuth.provider_user_id == provider_user_id,
-                UserSocialAuth.use_yn == "Y"
-            )
-            .options(joinedload(UserSocialAuth.employee))
+        result = await self.db.execute(
+            _SELECT_SOCIAL_AUTH, {"provider": provider, "provider_user_id": provider_user_id}
         )
-        result = await self.db.execute(stmt)
-        social_auth = result.unique().scalar_one_or_none()
+        social_auth = result.scalar_one_or_none()
         return social_auth
 
     async def update_last_login(self, emp_id: int) -> None:
@@ -265,21 +954,37 @@ class AuthProvider(BaseProvider[AuthProviderInput, AuthProviderOutput]):
         Args:
             emp_id: 직원 ID
         """
-        stmt = select(Employee).where(Employee.emp_id == emp_id)
-        result = await self.db.execute(stmt)
-        user = result.scalar_one_or_none()
+        self._user_cache.clear()
 
-        if user:
-            user.last_login_at = datetime.utcnow()
-            user.failed_login_count = 0
-            user.account_locked_until = None
-            await self.db.commit()
+        await self.db.execute(_UPDATE_LAST_LOGIN, {"target_emp_id": emp_id})
+        await self.db.commit()
+
+    async def update_password(self, emp_id: int, password_hash: str) -> bool:
+        """
+        비밀번호 해시를 단일 UPDATE로 저장합니다.
+
+        Args:
+            emp_id: 직원 ID
+            password_hash: 비밀번호 해시 (Argon2id)
+
+        Returns:
+            bool: 변경 여부 (활성 사용자가 없으면 False)
+        """
+        self._user_cache.clear()
+
+        result = await self.db.execute(
+            _UPDATE_PASSWORD, {"target_emp_id": emp_id, "password_hash": password_hash}
+        )
+        await self.db.commit()
+        return result.rowcount > 0
 
     async def increment_failed_login(self, emp_id: int) -> int:
         """
         로그인 실패 횟수를 증가시킵니다.
 
         5회 실패 시 계정을 30분간 잠급니다.
+        증가와 잠금 판단을 하나의 UPDATE ... RETURNING으로 처리하므로
+        동시 실패 요청 사이에서도 횟수가 누락되지 않습니다.
 
         Args:
             emp_id: 직원 ID
@@ -287,98 +992,76 @@ class AuthProvider(BaseProvider[AuthProviderInput, AuthProviderOutput]):
         Returns:
             int: 실패 횟수
         """
-        stmt = select(Employee).where(Employee.emp_id == emp_id)
-        result = await self.db.execute(stmt)
-        user = result.scalar_one_or_none()
-
-        if user:
-            user.failed_login_count = (user.failed_login_count or 0) + 1
-
-            # 5회 이상 실패 시 계정 잠금 (30분)
-            if user.failed_login_count >= 5:
-                user.account_locked_until = datetime.utcnow() + timedelta(minutes=30)
+        self._user_cache.clear()
 
-            await self.db.commit()
-            return user.failed_login_count
+        result = await self.db.execute(_INCREMENT_FAILED_LOGIN, {"target_emp_id": emp_id})
+        failed_count = result.scalar_one_or_none()
+        await self.db.commit()
 
-        return 0
+        return failed_count or 0
 
-    async def save_refresh_token(
-        self,
-        emp_id: int,
-        company_code: int,
-        token_hash: str,
-        expires_at: datetime,
-        device_info: Optional[str] = None,
-        ip_address: Optional[str] = None,
-        user_agent: Optional[str] = None
-    ) -> RefreshToken:
+    async def get_refresh_token_by_hash(self, token_hash: bytes) -> Optional[RefreshToken]:
         """
-        Refresh Token을 저장합니다.
+        Refresh Token을 해시값으로 조회합니다.
 
         Args:
-            emp_id: 직원 ID
-            company_code: 회사 코드
             token_hash: 토큰 해시값
-            expires_at: 만료 시간
-            device_info: 디바이스 정보
-            ip_address: IP 주소
-            user_agent: User Agent
 
         Returns:
-            RefreshToken: 저장된 토큰 정보
+            RefreshToken | None: 토큰 정보
         """
-        refresh_token = RefreshToken(
-            emp_id=emp_id,
-            company_code=company_code,
-            token_hash=token_hash,
-            expires_at=expires_at,
-            device_info=device_info,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            is_revoked=False
-        )
-        self.db.add(refresh_token)
-        await self.db.commit()
-        await self.db.refresh(refresh_token)
-        return refresh_token
+        result = await self.db.execute(_SELECT_REFRESH_TOKEN, {"token_hash": token_hash})
+        return result.scalar_one_or_none()
 
-    async def get_refresh_token_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+    async def get_user_with_permissions_by_refresh_hash(
+        self,
+        token_hash: bytes
+    ) -> Optional[tuple[Employee, list[str]]]:
         """
-        Refresh Token을 해시값으로 조회합니다.
+        유효한 Refresh Token의 소유자와 소유자의 권한 목록을 한 번의 쿼리로 조회합니다.
+
+        refresh_tokens ⨝ employees 조인에 권한(역할 그룹 이름)을
+        상관 서브쿼리(array_agg)로 함께 가져와 DB 왕복을 1회로 줄입니다.
+        (토큰 행 자체는 조건 확인에만 사용하고 로드하지 않음)
 
         Args:
             token_hash: 토큰 해시값
 
         Returns:
-            RefreshToken | None: 토큰 정보
+            tuple | None: (사용자 정보, 권한 목록), 유효한 토큰이 없으면 None
         """
-        stmt = (
-            select(RefreshToken)
-            .where(
-                RefreshToken.token_hash == token_hash,
-                RefreshToken.is_revoked == False,
-                RefreshToken.expires_at > datetime.utcnow()
-            )
+        result = await self.db.execute(
+            _SELECT_REFRESH_TOKEN_WITH_USER,
+            {"token_hash": token_hash}
         )
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        row = result.one_or_none()
 
-    async def revoke_refresh_token(self, token_hash: str) -> None:
+        if row is None:
+            return None
+
+        user, permissions = row
+        return user, self._store_permissions(
+            user.duty_code_id, user.company_code, permissions
+        )
+
+    async def revoke_refresh_token(self, token_hash: bytes) -> bool:
         """
         Refresh Token을 폐기합니다.
 
+        토큰을 조회하지 않고 단일 UPDATE로 폐기하며,
+        해당 토큰이 없거나 이미 폐기된 경우에는 아무것도 변경하지 않습니다.
+
         Args:
             token_hash: 토큰 해시값
-        """
-        stmt = select(RefreshToken).where(RefreshToken.token_hash == token_hash)
-        result = await self.db.execute(stmt)
-        token = result.scalar_one_or_none()
 
-        if token:
-            token.is_revoked = True
-            token.revoked_at = datetime.utcnow()
-            await self.db.commit()
+        Returns:
+            bool: 폐기 여부 (대상 토큰이 없으면 False)
+        """
+        result = await self.db.execute(
+            _REVOKE_REFRESH_TOKEN, {"token_hash": token_hash}
+        )
+        await self.db.commit()
+        return result.rowcount > 0
 
     async def log_login_attempt(
         self,
@@ -395,6 +1078,9 @@ class AuthProvider(BaseProvider[AuthProviderInput, AuthProviderOutput]):
         """
         로그인 시도를 기록합니다.
 
+        요청 세션에서 INSERT/COMMIT 하지 않고 로그인 이력 큐에 넣으며,
+        백그라운드 워커가 모아서 일괄 INSERT 합니다. (login_audit 참고)
+
         Args:
             company_code: 회사 코드
             email: 이메일
@@ -406,47 +1092,70 @@ class AuthProvider(BaseProvider[AuthProviderInput, AuthProviderOutput]):
             user_agent: User Agent
             device_info: 디바이스 정보
         """
-        history = LoginHistory(
-            emp_id=emp_id,
+        enqueue_login_attempt(
             company_code=company_code,
             email=email,
             login_method=login_method,
-            login_success=success,
+            success=success,
+            emp_id=emp_id,
             failure_reason=failure_reason,
             ip_address=ip_address,
             user_agent=user_agent,
             device_info=device_info
         )
-        self.db.add(history)
-        await self.db.commit()
 
-    async def create_social_auth(
+    async def record_login_success(
         self,
-        emp_id: int,
-        provider: str,
-        provider_user_id: str,
-        profile_data: Optional[dict] = None
-    ) -> UserSocialAuth:
+        user: Employee,
+        token_hash: bytes,
+        expires_at: Optional[datetime],
+        device_info: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        social_link: Optional[tuple[str, str]] = None
+    ) -> None:
         """
-        소셜 인증 연동을 생성합니다.
+        로그인 성공 후처리를 하나의 트랜잭션으로 기록합니다.
 
-        Args:
-            emp_id: 직원 ID
-            provider: 제공자 (GOOGLE, KAKAO 등)
-            provider_user_id: 제공자 고유 ID
-            profile_data: 프로필 데이터
+        Refresh Token INSERT(데이터 변경 CTE)와 마지막 로그인 시간 UPDATE를
+        하나의 SQL 문으로 실행하고 한 번 커밋합니다. (ORM flush의 문장별 왕복 없음)
+        첫 소셜 로그인이면 연동 INSERT도 같은 문장에 CTE로 붙입니다.
+        user는 조회된 Employee 객체이며, 갱신 값은 객체에도 그대로 반영됩니다. (추가 SELECT 없음)
+        로그인 이력은 login_audit 큐를 통해 비동기로 기록합니다.
 
-        Returns:
-            UserSocialAuth: 소셜 인증 정보
+        Args:
+            user: 로그인한 직원
+            token_hash: Refresh Token 해시값
+            expires_at: Refresh Token 만료 시간 (None이면 토큰 저장 생략)
+            device_info: 디바이스 정보
+            ip_address: IP 주소
+            user_agent: User Agent
+            social_link: 새로 만들 소셜 연동 (제공자, 제공자 고유 ID), 없으면 None
         """
-        social_auth = UserSocialAuth(
-            emp_id=emp_id,
-            provider=provider,
-            provider_user_id=provider_user_id,
-            use_yn="Y",
-            created_at=datetime.utcnow()
-        )
-        self.db.add(social_auth)
+        self._user_cache.clear()
+
+        # last_login_at은 응답(UserInfo)에 포함되므로 DB 함수 대신 Python 값으로 설정합니다.
+        # (같은 값을 DB와 객체에 함께 반영하여 재조회가 필요 없음)
+        now = utc_now()
+        params = {"target_emp_id": user.emp_id, "login_at": now}
+
+        if expires_at:
+            params.update(
+                rt_company_code=user.company_code,
+                rt_token_hash=token_hash,
+                rt_expires_at=expires_at,
+                rt_device_info=device_info,
+                rt_ip_address=ip_address,
+                rt_user_agent=user_agent
+            )
+        if social_link:
+            params.update(sa_provider=social_link[0], sa_provider_user_id=social_link[1])
+
+        statement = _RECORD_LOGIN_STATEMENTS[(bool(expires_at), bool(social_link))]
+        await self.db.execute(statement, params)
         await self.db.commit()
-        await self.db.refresh(social_auth)
-        return social_auth
+
+        # DB에 기록한 값을 객체에 반영 (변경 추적 없이 커밋된 값으로 설정)
+        set_committed_value(user, "last_login_at", now)
+        set_committed_value(user, "failed_login_count", 0)
+        set_committed_value(user, "account_locked_until", None)
@@ -4,6 +4,7 @@ Auth 도메인 Pydantic 스키마
 인증 관련 Request/Response 스키마를 정의합니다.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
@@ -65,6 +66,9 @@ class RoleInfo(BaseModel):
 # Request Schemas
 # ====================
 
+# 로그인/토큰 요청 바디는 검증 후 변경되지 않으므로 frozen으로 두고,
+# 알 수 없는 필드는 오류 대신 무시(extra="ignore")하여 검증 비용을 줄입니다.
+
 
 class LoginRequest(BaseModel):
     """일반 로그인 요청"""
@@ -75,6 +79,10 @@ class LoginRequest(BaseModel):
     device_info: Optional[str] = Field(None, description="디바이스 정보")
 
     model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        validate_assignment=False,
+        str_strip_whitespace=False,
         json_schema_extra={
             "example": {
                 "company_code": 100,
@@ -90,10 +98,14 @@ class GoogleLoginRequest(BaseModel):
     """구글 OAuth 로그인 요청"""
 
     company_code: int = Field(..., description="회사 코드 (숫자)")
-    google_token: str = Field(..., description="구글 ID 토큰 (JWT)")
+    google_token: str = Field(..., description="구글 ID 토큰 (JWT)", min_length=1)
     device_info: Optional[str] = Field(None, description="디바이스 정보")
 
     model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        validate_assignment=False,
+        str_strip_whitespace=False,
         json_schema_extra={
             "example": {
                 "company_code": 100,
@@ -107,9 +119,13 @@ class GoogleLoginRequest(BaseModel):
 class RefreshTokenRequest(BaseModel):
     """Refresh Token 갱신 요청"""
 
-    refresh_token: str = Field(..., description="Refresh Token")
+    refresh_token: str = Field(..., description="Refresh Token", min_length=1)
 
     model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        validate_assignment=False,
+        str_strip_whitespace=False,
         json_schema_extra={
             "example": {
                 "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."
@@ -172,9 +188,9 @@ class LoginResponse(BaseModel):
                 "expires_in": 1800,
                 "user": {
                     "emp_id": 1,
-                    "company_code": "VNTG",
+                    "company_code": 100,
                     "email": "admin@vantage.com",
-                    "emp_name": "시스템 관리자",
+                    "name": "시스템 관리자",
                     "emp_no": "EMP001",
                     "duty_code_id": 1,
                     "position_name": "CEO"
@@ -193,6 +209,7 @@ class RefreshTokenResponse(BaseModel):
     expires_in: int = Field(..., description="만료 시간 (초)")
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
@@ -210,6 +227,7 @@ class LogoutResponse(BaseModel):
     success: bool = Field(True, description="성공 여부")
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "message": "Successfully logged out",
@@ -241,15 +259,16 @@ class CurrentUserResponse(BaseModel):
     user: UserInfo = Field(..., description="사용자 정보")
     roles: list[RoleInfo] = Field(default_factory=list, description="역할 목록")
     permissions: list[str] = Field(default_factory=list, description="권한 코드 목록")
+    menus: list[dict[str, Any]] = Field(default_factory=list, description="메뉴 권한 목록")
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "user": {
                     "emp_id": 1,
-                    "company_code": "VNTG",
+                    "company_code": 100,
                     "email": "admin@vantage.com",
-                    "emp_name": "시스템 관리자"
+                    "name": "시스템 관리자"
                 },
                 "roles": [
                     {
@@ -258,7 +277,16 @@ class CurrentUserResponse(BaseModel):
                         "permissions": ["admin:all"]
                     }
                 ],
-                "permissions": ["admin:all", "user:read", "user:write"]
+                "permissions": ["admin:all", "user:read", "user:write"],
+                "menus": [
+                    {
+                        "menu_id": 1,
+                        "menu_name": "대시보드",
+                        "menu_path": "/dashboard",
+                        "parent_menu_id": None,
+                        "menu_order": 1
+                    }
+                ]
             }
         }
     )
@@ -269,7 +297,12 @@ class CurrentUserResponse(BaseModel):
 # ====================
 
 
-class AuthProviderInput(BaseModel):
+# 서버 내부에서만 생성/소비되는 신뢰 데이터이므로 Pydantic 검증 없이
+# slots + frozen dataclass로 정의합니다. (로그인마다 생성되는 객체 비용 절감)
+
+
+@dataclass(slots=True, frozen=True)
+class AuthProviderInput:
     """AuthProvider 입력 데이터"""
 
     company_code: int
@@ -278,26 +311,24 @@ class AuthProviderInput(BaseModel):
     emp_id: Optional[int] = None
 
 
-class AuthProviderOutput(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AuthProviderOutput:
     """AuthProvider 출력 데이터"""
 
-    user: Optional[Any] = None  # UserAccount 모델
-    permissions: list[str] = Field(default_factory=list)
+    user: Optional[Any] = None  # Employee 모델
+    permissions: list[str] = field(default_factory=list)
     social_auth: Optional[Any] = None  # UserSocialAuth 모델
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
 
-class AuthFormatterInput(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AuthFormatterInput:
     """AuthFormatter 입력 데이터"""
 
-    user: Any  # UserAccount 모델
+    user: Any  # Employee 모델
     access_token: str
     refresh_token: str
     permissions: list[str]
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
 
 # ====================
 # Google OAuth Response (from Google API)
@@ -4,12 +4,14 @@ Auth 도메인 Service (Phase 1: 기본 로그인)
 일반 로그인 (ID/PW) 기능만 구현합니다.
 """
 
-from datetime import datetime
-from typing import Optional
+import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from server.app.core.logging import get_logger
 from server.app.domain.auth.formatters import AuthFormatter
+from server.app.domain.auth.login_audit import enqueue_login_attempt
+from server.app.domain.auth.models import utc_now
 from server.app.domain.auth.providers import AuthProvider
 from server.app.domain.auth.schemas import (
     AuthFormatterInput,
@@ -17,19 +19,22 @@ from server.app.domain.auth.schemas import (
     LoginRequest,
     LoginResponse,
 )
+from server.app.domain.auth.tokens import issue_login_tokens
 from server.app.shared.base.service import BaseService
 from server.app.shared.exceptions import (
     BusinessLogicException,
     UnauthorizedException,
 )
 from server.app.shared.types import ServiceResult
-from server.app.shared.utils.jwt import (
-    create_access_token,
-    create_refresh_token,
-    get_token_expiry,
-    hash_token,
+from server.app.shared.utils.password import (
+    hash_password_async,
+    is_password_hash,
+    needs_update,
+    verify_password_async,
+    verify_plaintext_password,
 )
-from server.app.shared.utils.password import hash_password, verify_password
+
+logger = get_logger(__name__)
 
 
 class AuthService(BaseService[LoginRequest, LoginResponse]):
@@ -60,9 +65,6 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
             BusinessLogicException: 계정 잠김 등
         """
         try:
-            # 디버그 로그
-            print(f"[DEBUG] Login attempt - company_code: {request.company_code}, email: {request.email}")
-
             # 1. 사용자 조회
             provider_input = AuthProviderInput(
                 company_code=request.company_code,
@@ -71,14 +73,16 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
             provider_output = await self.provider.provide(provider_input)
             user = provider_output.user
 
-            # 디버그 로그
-            print(f"[DEBUG] User found: {user is not None}")
-            if user:
-                print(f"[DEBUG] User details - emp_id: {user.emp_id}, email: {user.email}, use_yn: {user.use_yn}, account_status: {user.account_status}")
+            # 디버그 로그 (DEBUG 레벨이 아니면 문자열 포맷팅도 하지 않음, 이메일은 남기지 않음)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Login lookup company_code=%s found=%s emp_id=%s",
+                    request.company_code, user is not None, user.emp_id if user else None
+                )
 
             if not user:
                 # 로그인 실패 기록
-                await self.provider.log_login_attempt(
+                enqueue_login_attempt(
                     company_code=request.company_code,
                     email=request.email,
                     login_method="PASSWORD",
@@ -94,7 +98,7 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
                 )
 
             # 2. 계정 잠김 확인
-            if user.account_locked_until and user.account_locked_until > datetime.utcnow():
+            if user.account_locked_until and user.account_locked_until > utc_now():
                 raise BusinessLogicException(
                     message="Account is locked due to multiple failed login attempts",
                     details={"locked_until": user.account_locked_until.isoformat()}
@@ -108,23 +112,23 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
                 )
 
             # ⚠️ Phase 1: 평문 비교 (개발 단계)
-            # TODO Phase 2: BCRYPT 해싱 추가
             password_valid = False
+            password_hashed = is_password_hash(user.password)
 
-            # 먼저 BCRYPT 검증 시도
-            if user.password.startswith("$2b$") or user.password.startswith("$2a$"):
-                # BCRYPT 해시인 경우
-                password_valid = verify_password(request.password, user.password)
+            # 먼저 해시(Argon2id/BCRYPT) 검증 시도
+            if password_hashed:
+                # 해시인 경우
+                password_valid = await verify_password_async(request.password, user.password)
             else:
-                # 평문인 경우 (개발 환경)
-                password_valid = (request.password == user.password)
+                # 평문인 경우 (개발 환경, 상수 시간 비교)
+                password_valid = verify_plaintext_password(request.password, user.password)
 
             if not password_valid:
                 # 실패 횟수 증가
                 await self.provider.increment_failed_login(user.emp_id)
 
                 # 로그인 실패 기록
-                await self.provider.log_login_attempt(
+                enqueue_login_attempt(
                     company_code=request.company_code,
                     email=request.email,
                     login_method="PASSWORD",
@@ -141,43 +145,27 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
                     details={"company_code": request.company_code, "email": request.email}
                 )
 
-            # 4. 토큰 생성
-            access_token = create_access_token(data={
-                "sub": str(user.emp_id),
-                "company_code": user.company_code,
-                "emp_id": user.emp_id,
-                "duty_code_id": user.duty_code_id,
-                "permissions": provider_output.permissions,
-                "email": user.email,
-                "name": user.name
-            })
-
-            refresh_token = create_refresh_token(data={
-                "sub": str(user.emp_id),
-                "company_code": user.company_code,
-                "emp_id": user.emp_id
-            })
-
-            # 5. Refresh Token 저장
-            token_hash = hash_token(refresh_token)
-            expires_at = get_token_expiry(refresh_token)
-
-            if expires_at:
-                await self.provider.save_refresh_token(
-                    emp_id=user.emp_id,
-                    company_code=user.company_code,
-                    token_hash=token_hash,
-                    expires_at=expires_at,
-                    device_info=request.device_info,
-                    ip_address=kwargs.get("ip_address"),
-                    user_agent=kwargs.get("user_agent")
+            # 기존 BCRYPT(또는 이전 파라미터) 해시는 평문을 알고 있는 지금 Argon2id로 재해싱
+            if password_hashed and needs_update(user.password):
+                await self.provider.update_password(
+                    user.emp_id, await hash_password_async(request.password)
                 )
 
-            # 6. 마지막 로그인 시간 업데이트
-            await self.provider.update_last_login(user.emp_id)
+            # 4. 토큰 생성
+            tokens = issue_login_tokens(user, provider_output.permissions)
+
+            # 5~6. Refresh Token 저장 + 마지막 로그인 시간 업데이트 (단일 SQL 문으로 한 번에 커밋)
+            await self.provider.record_login_success(
+                user=user,
+                token_hash=tokens.refresh_token_hash,
+                expires_at=tokens.refresh_expires_at,
+                device_info=request.device_info,
+                ip_address=kwargs.get("ip_address"),
+                user_agent=kwargs.get("user_agent")
+            )
 
-            # 7. 로그인 성공 기록
-            await self.provider.log_login_attempt(
+            # 7. 로그인 성공 기록 (백그라운드 큐)
+            enqueue_login_attempt(
                 company_code=request.company_code,
                 email=request.email,
                 login_method="PASSWORD",
@@ -191,22 +179,21 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
             # 8. 응답 포맷팅
             formatter_input = AuthFormatterInput(
                 user=user,
-                access_token=access_token,
-                refresh_token=refresh_token,
+                access_token=tokens.access_token,
+                refresh_token=tokens.refresh_token,
                 permissions=provider_output.permissions
             )
-            response = await self.formatter.format(formatter_input)
+            response = self.formatter.format_sync(formatter_input)
 
             return ServiceResult.ok(response)
 
         except (UnauthorizedException, BusinessLogicException) as e:
+            # 예상한 인증 실패만 결과로 변환하고, 그 외 예외(DB 장애 등)는 전역 예외 핸들러로 전파합니다.
             return ServiceResult.fail(e.message)
-        except Exception as e:
-            return ServiceResult.fail(f"Login failed: {str(e)}")
 
     async def hash_user_password(self, emp_id: int, plain_password: str) -> bool:
         """
-        사용자의 평문 비밀번호를 BCRYPT로 해싱합니다.
+        사용자의 평문 비밀번호를 Argon2id로 해싱합니다.
 
         Phase 2에서 사용할 유틸리티 함수입니다.
 
@@ -218,20 +205,11 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
             bool: 성공 여부
         """
         try:
-            provider_input = AuthProviderInput(emp_id=emp_id, company_code=0)
-            provider_output = await self.provider.provide(provider_input)
-            user = provider_output.user
-
-            if not user:
-                return False
-
-            # 평문 비밀번호를 BCRYPT로 해싱
-            hashed_password = hash_password(plain_password)
-            user.password = hashed_password
-            user.password_changed_at = datetime.utcnow()
+            # 평문 비밀번호를 Argon2id로 해싱
+            hashed_password = await hash_password_async(plain_password)
 
-            await self.db.commit()
-            return True
+            # 사용자 조회 없이 단일 UPDATE로 저장
+            return await self.provider.update_password(emp_id, hashed_password)
 
         except Exception:
             return False
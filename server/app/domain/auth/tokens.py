@@ -0,0 +1,83 @@
+"""
+로그인 토큰 발급
+
+비밀번호 로그인, 구글 로그인, 토큰 갱신이 같은 클레임 구성으로 토큰을 발급하도록
+Employee → JWT 클레임 변환과 Refresh Token 저장값(해시, 만료 시각) 계산을 한곳에 모읍니다.
+
+사용법:
+    tokens = issue_login_tokens(user, permissions)
+    await provider.record_login_success(
+        user=user,
+        token_hash=tokens.refresh_token_hash,
+        expires_at=tokens.refresh_expires_at,
+    )
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from server.app.shared.utils.jwt import (
+    create_access_token,
+    create_refresh_token_with_expiry,
+    hash_token,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class LoginTokens:
+    """로그인 시 발급한 토큰과 Refresh Token 저장값"""
+
+    access_token: str
+    refresh_token: str
+    refresh_token_hash: bytes
+    refresh_expires_at: datetime
+
+
+def create_user_access_token(user: Any, permissions: list[str]) -> str:
+    """
+    직원 정보와 권한으로 Access Token을 발급합니다.
+
+    Args:
+        user: 직원 (Employee 모델)
+        permissions: 권한 목록
+
+    Returns:
+        str: JWT Access Token
+    """
+    return create_access_token(data={
+        "sub": str(user.emp_id),
+        "company_code": user.company_code,
+        "emp_id": user.emp_id,
+        "duty_code_id": user.duty_code_id,
+        "permissions": permissions,
+        "email": user.email,
+        "name": user.name
+    })
+
+
+def issue_login_tokens(user: Any, permissions: list[str]) -> LoginTokens:
+    """
+    로그인 성공 시 Access/Refresh Token을 발급합니다.
+
+    Refresh Token의 만료 시각은 서명할 때 계산한 값을 그대로 사용합니다. (재디코딩 없음)
+
+    Args:
+        user: 직원 (Employee 모델)
+        permissions: 권한 목록
+
+    Returns:
+        LoginTokens: 발급한 토큰과 Refresh Token 해시/만료 시각
+    """
+    refresh_token, refresh_expires_at = create_refresh_token_with_expiry(data={
+        "sub": str(user.emp_id),
+        "company_code": user.company_code,
+        "emp_id": user.emp_id
+    })
+
+    return LoginTokens(
+        access_token=create_user_access_token(user, permissions),
+        refresh_token=refresh_token,
+        refresh_token_hash=hash_token(refresh_token),
+        refresh_expires_at=refresh_expires_at,
+    )
@@ -4,18 +4,293 @@ Google OAuth 2.0 유틸리티
 구글 ID 토큰 검증 및 사용자 정보 추출 기능을 제공합니다.
 """
 
+import asyncio
+import hashlib
+import importlib.util
+import os
+import re
+import time
+
 import httpx
-from typing import Optional
+from typing import Any, Optional
+
+import jwt
+import orjson
+from cachetools import TTLCache
+from jwt.exceptions import PyJWTError
 
 from server.app.core.config import settings
 from server.app.domain.auth.schemas import GoogleUserInfo
 from server.app.shared.exceptions import ApplicationException
 
+# ====================
+# HTTP Client
+# ====================
+
+# 로그인마다 TCP/TLS 핸드셰이크를 하지 않도록 연결 풀을 공유하는 클라이언트를 재사용합니다.
+# h2 패키지(httpx[http2])가 있으면 HTTP/2로 동시 요청을 하나의 연결에 다중화합니다.
+GOOGLE_HTTP_MAX_KEEPALIVE = 32
+GOOGLE_HTTP_MAX_CONNECTIONS = 64
+
+# 유휴 연결 유지 시간 (초). httpx 기본값(5초)은 로그인 간격보다 짧아 재연결이 잦으므로 늘립니다.
+GOOGLE_HTTP_KEEPALIVE_EXPIRY = 30.0
+
+# TCP/TLS 연결 수립 제한 시간 (초). 연결 실패는 전체 타임아웃까지 기다리지 않고 빨리 끊습니다.
+GOOGLE_HTTP_CONNECT_TIMEOUT = 3.0
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    Google API 호출용 공유 클라이언트를 반환합니다. (최초 호출 시 생성)
+
+    Returns:
+        httpx.AsyncClient: 연결 풀을 공유하는 클라이언트
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=httpx.Timeout(
+                settings.GOOGLE_API_TIMEOUT,
+                connect=min(GOOGLE_HTTP_CONNECT_TIMEOUT, settings.GOOGLE_API_TIMEOUT),
+            ),
+            limits=httpx.Limits(
+                max_keepalive_connections=GOOGLE_HTTP_MAX_KEEPALIVE,
+                max_connections=GOOGLE_HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=GOOGLE_HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _http_client
+
+
+async def close_google_http_client() -> None:
+    """공유 클라이언트의 연결을 닫습니다. (애플리케이션 종료 시 호출)"""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# ====================
+# Google Signing Keys (JWKS)
+# ====================
+
+# ID 토큰 서명을 로컬에서 검증하기 위한 공개키를 kid 단위로 보관합니다.
+# 공개키 객체는 한 번만 생성하여 재사용하고, 모르는 kid가 오면 키 목록을 다시 받습니다.
+# (Google은 키를 몇 주 주기로 교체하며, 새 키는 미리 JWKS에 게시됩니다)
+# 갱신 주기는 JWKS 응답의 Cache-Control max-age를 따르며, 헤더가 없을 때만 기본값을 사용합니다.
+GOOGLE_JWKS_REFRESH_SECONDS = 3600
+# 모르는 kid로 인한 재요청 최소 간격 (임의 kid를 담은 토큰으로 JWKS 요청이 반복되지 않도록)
+GOOGLE_JWKS_MIN_REFRESH_SECONDS = 60
+# JWKS 조회 실패 후 재요청을 보류하는 시간 (초). 그동안은 기존 키(만료되었더라도)로 검증합니다.
+GOOGLE_JWKS_FAILURE_BACKOFF_SECONDS = 30
+GOOGLE_ISSUERS = ("https://accounts.google.com", "accounts.google.com")
+
+_signing_keys: dict[str, Any] = {}
+# 시각은 time.monotonic() 기준 (부팅 직후에도 "아직 받은 적 없음"이 되도록 -inf로 시작)
+_signing_keys_fetched_at = float("-inf")
+_signing_keys_max_age = float(GOOGLE_JWKS_REFRESH_SECONDS)
+_signing_keys_failed_at = float("-inf")
+_signing_keys_lock = asyncio.Lock()
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def _cache_max_age(cache_control: Optional[str]) -> float:
+    """
+    Cache-Control 헤더의 max-age(초)를 반환합니다. (없으면 GOOGLE_JWKS_REFRESH_SECONDS)
+
+    Args:
+        cache_control: Cache-Control 헤더 값
+
+    Returns:
+        float: 키 목록을 재사용할 시간 (초)
+    """
+    match = _MAX_AGE_PATTERN.search(cache_control or "")
+    return float(match.group(1)) if match else float(GOOGLE_JWKS_REFRESH_SECONDS)
+
+
+async def _refresh_signing_keys() -> None:
+    """
+    Google JWKS를 받아 kid → 공개키 객체 맵을 교체합니다.
+
+    여러 요청이 동시에 갱신을 시도해도 실제 요청은 한 번만 보냅니다.
+    실패하면 실패 시각을 기록하고 기존 키 목록은 그대로 둡니다.
+    """
+    global _signing_keys, _signing_keys_fetched_at, _signing_keys_max_age
+    global _signing_keys_failed_at
+
+    started = time.monotonic()
+    async with _signing_keys_lock:
+        # 대기하는 동안 다른 요청이 이미 갱신(또는 실패)했으면 생략
+        if max(_signing_keys_fetched_at, _signing_keys_failed_at) >= started:
+            return
+
+        try:
+            response = await _get_http_client().get(settings.GOOGLE_CERTS_URL)
+            response.raise_for_status()
+            signing_keys = {
+                key["kid"]: jwt.PyJWK(key, key.get("alg", "RS256")).key
+                for key in orjson.loads(response.content).get("keys", [])
+            }
+        except Exception:
+            _signing_keys_failed_at = time.monotonic()
+            raise
+
+        _signing_keys = signing_keys
+        _signing_keys_max_age = _cache_max_age(response.headers.get("cache-control"))
+        _signing_keys_fetched_at = time.monotonic()
+
+
+async def _get_signing_key(kid: str) -> Optional[Any]:
+    """
+    kid에 해당하는 Google 서명 공개키를 반환합니다.
+
+    키 목록이 오래되었거나 kid를 모르면 한 번 갱신합니다. (모르는 kid는 최소 간격 적용)
+    갱신에 실패하면 GOOGLE_JWKS_FAILURE_BACKOFF_SECONDS 동안 재요청하지 않고 기존 키를 사용합니다.
+
+    Args:
+        kid: JWT 헤더의 키 ID
+
+    Returns:
+        공개키 객체 | None: 갱신 후에도 찾을 수 없는 경우
+    """
+    now = time.monotonic()
+    if now - _signing_keys_failed_at < GOOGLE_JWKS_FAILURE_BACKOFF_SECONDS:
+        return _signing_keys.get(kid)
+
+    age = now - _signing_keys_fetched_at
+    if age > _signing_keys_max_age or (
+        kid not in _signing_keys and age > GOOGLE_JWKS_MIN_REFRESH_SECONDS
+    ):
+        try:
+            await _refresh_signing_keys()
+        except (httpx.HTTPError, ValueError, KeyError, PyJWTError):
+            # JWKS 조회/파싱 실패 → 기존 키로 검증 (없으면 tokeninfo)
+            pass
+    return _signing_keys.get(kid)
+
+
+def _require_client_id() -> str:
+    """
+    ID 토큰의 aud 검증에 사용할 Google OAuth Client ID를 반환합니다.
+
+    Client ID가 없으면 aud를 검증할 수 없으므로 검증을 생략하지 않고 로그인을 거부합니다.
+
+    Returns:
+        str: GOOGLE_CLIENT_ID
+
+    Raises:
+        ApplicationException: GOOGLE_CLIENT_ID가 설정되지 않은 경우
+    """
+    if not settings.GOOGLE_CLIENT_ID:
+        raise ApplicationException(
+            message="Google login is not configured",
+            status_code=503,
+            details={"setting": "GOOGLE_CLIENT_ID"}
+        )
+    return settings.GOOGLE_CLIENT_ID
+
+
+def _check_audience_and_issuer(token_info: dict[str, Any], client_id: str) -> None:
+    """
+    tokeninfo 응답의 aud/iss가 이 서비스용 Google 토큰인지 확인합니다. (JWKS 경로와 동일한 기준)
+
+    tokeninfo는 Google이 발급한 토큰이면 다른 클라이언트용 토큰도 유효하다고 응답합니다.
+
+    Args:
+        token_info: tokeninfo 응답
+        client_id: 허용할 Client ID
+
+    Raises:
+        ApplicationException: aud 또는 iss가 일치하지 않는 경우
+    """
+    if token_info.get("aud") != client_id:
+        raise ApplicationException(
+            message="Invalid Google token",
+            status_code=401,
+            details={"error": "Invalid audience"}
+        )
+    if token_info.get("iss") not in GOOGLE_ISSUERS:
+        raise ApplicationException(
+            message="Invalid Google token",
+            status_code=401,
+            details={"error": "Invalid issuer"}
+        )
+
+
+def _build_user_info(claims: dict[str, Any]) -> GoogleUserInfo:
+    """
+    검증된 토큰 정보(tokeninfo 응답 또는 ID 토큰 클레임)로 GoogleUserInfo를 만듭니다.
+
+    Args:
+        claims: 검증된 토큰 정보
+
+    Returns:
+        GoogleUserInfo: 구글 사용자 정보
+
+    Raises:
+        ApplicationException: 이메일이 인증되지 않은 경우
+        KeyError: 필수 항목(sub, email)이 없는 경우
+    """
+    # 이메일 인증 여부 확인 (tokeninfo는 문자열 "true"로 반환)
+    if str(claims.get("email_verified")).lower() != "true":
+        raise ApplicationException(
+            message="Email not verified",
+            status_code=400,
+            details={"email": claims.get("email")}
+        )
+
+    return GoogleUserInfo(
+        sub=claims["sub"],
+        email=claims["email"],
+        email_verified=True,
+        name=claims.get("name"),
+        given_name=claims.get("given_name"),
+        family_name=claims.get("family_name"),
+        picture=claims.get("picture"),
+        locale=claims.get("locale")
+    )
+
+
+# ====================
+# Token Verification Cache
+# ====================
+
+# 동일한 ID 토큰의 재전송(재시도, 웹/모바일 중복 요청)은 Google 호출 없이 처리합니다.
+# 각 항목은 토큰의 exp 시각까지만 유효하며, 검증에 실패한 토큰은 캐시하지 않습니다.
+GOOGLE_TOKEN_CACHE_MAXSIZE = 4096
+GOOGLE_TOKEN_CACHE_TTL_SECONDS = 3600  # 구글 ID 토큰 최대 수명
+
+_token_cache: TTLCache = TTLCache(
+    maxsize=GOOGLE_TOKEN_CACHE_MAXSIZE, ttl=GOOGLE_TOKEN_CACHE_TTL_SECONDS
+)
+
+# 캐시 키 해시용 키 (프로세스마다 새로 생성, 캐시가 프로세스 메모리에만 있으므로 공유 불필요)
+_TOKEN_CACHE_KEY = os.urandom(32)
+
+
+# 진행 중인 검증 (캐시 키 → Task)
+# 같은 토큰의 동시 요청은 Google 호출 하나를 공유합니다.
+_inflight: dict[bytes, asyncio.Task] = {}
+
+
+def _token_cache_key(token: str) -> bytes:
+    """토큰 원문 대신 keyed BLAKE2b 다이제스트를 키로 사용합니다."""
+    return hashlib.blake2b(token.encode(), digest_size=32, key=_TOKEN_CACHE_KEY).digest()
+
 
 async def verify_google_token(token: str) -> GoogleUserInfo:
     """
     구글 ID 토큰을 검증하고 사용자 정보를 반환합니다.
 
+    캐시에 유효한 결과가 있으면 그대로 반환하고, 같은 토큰의 검증이 이미
+    진행 중이면 새로 호출하지 않고 그 결과를 함께 기다립니다.
+
     Args:
         token: 구글 ID 토큰 (JWT)
 
@@ -23,139 +298,153 @@ async def verify_google_token(token: str) -> GoogleUserInfo:
         GoogleUserInfo: 구글 사용자 정보
 
     Raises:
-        ApplicationException: 토큰이 유효하지 않은 경우
+        ApplicationException: 토큰이 유효하지 않거나 GOOGLE_CLIENT_ID가 설정되지 않은 경우
 
     Note:
-        Google의 tokeninfo 엔드포인트를 사용하여 토큰을 검증합니다.
-        프로덕션 환경에서는 google-auth 라이브러리 사용을 권장합니다.
+        Google JWKS 공개키로 서명을 로컬 검증합니다. (google-auth 라이브러리 불필요)
+        공개키를 얻을 수 없는 경우에만 tokeninfo 엔드포인트를 호출합니다.
+        두 경로 모두 aud(GOOGLE_CLIENT_ID)와 iss를 검증합니다.
     """
-    try:
-        # Google tokeninfo API를 사용하여 토큰 검증
-        # https://oauth2.googleapis.com/tokeninfo?id_token={token}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                settings.GOOGLE_TOKENINFO_URL,
-                params={"id_token": token},
-                timeout=settings.GOOGLE_API_TIMEOUT
-            )
-
-            if response.status_code != 200:
-                raise ApplicationException(
-                    message="Invalid Google token",
-                    status_code=401,
-                    details={"error": response.text}
-                )
-
-            token_info = response.json()
-
-            # 이메일 인증 여부 확인
-            if not token_info.get("email_verified"):
-                raise ApplicationException(
-                    message="Email not verified",
-                    status_code=400,
-                    details={"email": token_info.get("email")}
-                )
-
-            # GoogleUserInfo 객체 생성
-            user_info = GoogleUserInfo(
-                sub=token_info["sub"],
-                email=token_info["email"],
-                email_verified=token_info.get("email_verified", False),
-                name=token_info.get("name"),
-                given_name=token_info.get("given_name"),
-                family_name=token_info.get("family_name"),
-                picture=token_info.get("picture"),
-                locale=token_info.get("locale")
-            )
+    _require_client_id()
 
+    cache_key = _token_cache_key(token)
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        user_info, expires_at = cached
+        if expires_at > time.time():
             return user_info
 
-    except httpx.TimeoutException:
+    task = _inflight.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(_verify_and_cache(token, cache_key))
+        _inflight[cache_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(cache_key, None))
+
+    # 한 요청이 취소되어도 같은 검증을 기다리는 다른 요청에는 영향이 없도록 shield 처리
+    return await asyncio.shield(task)
+
+
+async def _verify_and_cache(token: str, cache_key: bytes) -> GoogleUserInfo:
+    """
+    토큰 서명을 로컬(JWKS)에서 검증하고 성공 결과를 토큰 만료 시각까지 캐시합니다.
+
+    토큰 헤더의 kid에 해당하는 공개키를 찾을 수 없거나 JWKS를 받을 수 없을 때만
+    tokeninfo 엔드포인트로 검증합니다.
+
+    Args:
+        token: 구글 ID 토큰 (JWT)
+        cache_key: 토큰 캐시 키
+
+    Returns:
+        GoogleUserInfo: 구글 사용자 정보
+
+    Raises:
+        ApplicationException: 토큰이 유효하지 않은 경우
+    """
+    try:
+        kid = jwt.get_unverified_header(token).get("kid")
+    except PyJWTError as e:
         raise ApplicationException(
-            message="Google token verification timeout",
-            status_code=504,
-            details={"error": "Request to Google API timed out"}
+            message="Invalid Google token",
+            status_code=401,
+            details={"error": str(e)}
+        ) from None
+
+    key = await _get_signing_key(kid) if kid else None
+    if key is None:
+        return await _verify_with_tokeninfo(token, cache_key)
+
+    try:
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=["RS256"],
+            audience=_require_client_id(),
+            issuer=GOOGLE_ISSUERS,
         )
-    except httpx.HTTPError as e:
+        user_info = _build_user_info(claims)
+    except PyJWTError as e:
         raise ApplicationException(
-            message="Failed to verify Google token",
-            status_code=500,
+            message="Invalid Google token",
+            status_code=401,
             details={"error": str(e)}
-        )
+        ) from None
     except KeyError as e:
         raise ApplicationException(
             message="Invalid token response format",
             status_code=400,
             details={"missing_field": str(e)}
-        )
-    except Exception as e:
-        raise ApplicationException(
-            message=f"Google OAuth error: {str(e)}",
-            status_code=500
-        )
+        ) from None
 
+    _token_cache[cache_key] = (user_info, int(claims["exp"]))
+    return user_info
 
-async def verify_google_token_with_google_auth(token: str, client_id: Optional[str] = None) -> GoogleUserInfo:
+
+async def _verify_with_tokeninfo(token: str, cache_key: bytes) -> GoogleUserInfo:
     """
-    google-auth 라이브러리를 사용한 토큰 검증 (프로덕션 권장)
+    tokeninfo 엔드포인트로 토큰을 검증하고 성공 결과를 캐시에 저장합니다.
 
     Args:
-        token: 구글 ID 토큰
-        client_id: Google OAuth Client ID (선택)
+        token: 구글 ID 토큰 (JWT)
+        cache_key: 토큰 캐시 키
 
     Returns:
         GoogleUserInfo: 구글 사용자 정보
 
-    Note:
-        이 함수를 사용하려면 `google-auth` 패키지가 필요합니다:
-        pip install google-auth
-
-        프로덕션 환경에서는 이 방식을 권장합니다.
+    Raises:
+        ApplicationException: 토큰이 유효하지 않은 경우
     """
     try:
-        from google.oauth2 import id_token
-        from google.auth.transport import requests
-
-        # 토큰 검증
-        idinfo = id_token.verify_oauth2_token(
-            token,
-            requests.Request(),
-            client_id  # None이면 client_id 검증 스킵
+        # Google tokeninfo API를 사용하여 토큰 검증
+        # https://oauth2.googleapis.com/tokeninfo?id_token={token}
+        response = await _get_http_client().get(
+            settings.GOOGLE_TOKENINFO_URL,
+            params={"id_token": token}
         )
 
-        # 이메일 인증 확인
-        if not idinfo.get("email_verified"):
+        if response.status_code != 200:
             raise ApplicationException(
-                message="Email not verified",
-                status_code=400
+                message="Invalid Google token",
+                status_code=401,
+                details={"error": response.text}
             )
 
-        # GoogleUserInfo 객체 생성
-        user_info = GoogleUserInfo(
-            sub=idinfo["sub"],
-            email=idinfo["email"],
-            email_verified=idinfo.get("email_verified", False),
-            name=idinfo.get("name"),
-            given_name=idinfo.get("given_name"),
-            family_name=idinfo.get("family_name"),
-            picture=idinfo.get("picture"),
-            locale=idinfo.get("locale")
-        )
+        # httpx의 response.json()(표준 json) 대신 orjson으로 파싱
+        token_info = orjson.loads(response.content)
+
+        # 다른 클라이언트용/다른 발급자의 토큰 거부 (JWKS 경로와 동일한 aud/iss 검증)
+        _check_audience_and_issuer(token_info, _require_client_id())
+
+        # 이메일 인증 확인 후 GoogleUserInfo 객체 생성
+        user_info = _build_user_info(token_info)
+
+        # 검증 성공 결과를 토큰 만료 시각까지 캐시
+        expires_at = int(token_info.get("exp", 0))
+        if expires_at > time.time():
+            _token_cache[cache_key] = (user_info, expires_at)
 
         return user_info
 
-    except ImportError:
+    except ApplicationException:
+        raise
+    except httpx.TimeoutException:
         raise ApplicationException(
-            message="google-auth library not installed",
-            status_code=500,
-            details={"hint": "pip install google-auth"}
+            message="Google token verification timeout",
+            status_code=504,
+            details={"error": "Request to Google API timed out"}
         )
-    except ValueError as e:
+    except httpx.HTTPError as e:
         raise ApplicationException(
-            message="Invalid Google token",
-            status_code=401,
+            message="Failed to verify Google token",
+            status_code=500,
             details={"error": str(e)}
         )
+    except KeyError as e:
+        raise ApplicationException(
+            message="Invalid token response format",
+            status_code=400,
+            details={"missing_field": str(e)}
+        )
     except Exception as e:
         raise ApplicationException(
             message=f"Google OAuth error: {str(e)}",
@@ -5,14 +5,87 @@ JWT 토큰 생성 및 검증 유틸리티
 """
 
 import hashlib
+import re
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
-from jose import JWTError, jwt
+import jwt
+import orjson
+from jwt.exceptions import PyJWTError
+from jwt.utils import base64url_decode, base64url_encode
 
 from server.app.core.config import settings
 from server.app.shared.exceptions import UnauthorizedException
 
+# Refresh Token 해시 키 (keyed BLAKE2b)
+_TOKEN_HASH_KEY = settings.TOKEN_HASH_KEY.encode()
+
+# JWT 서명 알고리즘/키 (PyJWT)
+# 알고리즘 객체 조회와 키 준비(prepare_key)는 시작 시 한 번만 수행해 재사용합니다.
+# HS256 서명은 hmac → hashlib(OpenSSL), RS256은 cryptography(OpenSSL)로 계산됩니다.
+_JWT_ALGORITHM = jwt.get_algorithm_by_name(settings.JWT_ALGORITHM)
+_JWT_KEY = _JWT_ALGORITHM.prepare_key(settings.SECRET_KEY)
+
+# 검증 시 허용 알고리즘 목록 (호출마다 리스트를 만들지 않도록 고정)
+_ALLOWED_JWT_ALGORITHMS = (settings.JWT_ALGORITHM,)
+
+# 기본 토큰 수명 (초)
+# exp/iat는 JWT 표준상 정수 epoch이므로 datetime 없이 처음부터 time.time() 정수로 계산합니다.
+_ACCESS_TOKEN_TTL_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_TTL_SECONDS = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+# 토큰 타입별 필수 클레임
+_REQUIRED_ACCESS_CLAIMS = frozenset(("sub", "company_code", "emp_id"))
+_REQUIRED_CLAIMS = {
+    "access": _REQUIRED_ACCESS_CLAIMS,
+    "refresh": _REQUIRED_ACCESS_CLAIMS,
+}
+
+# 형식 검사용 패턴 (header.payload.signature, 각 구간은 base64url)
+_JWT_SHAPE = re.compile(r"[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+")
+MAX_TOKEN_LENGTH = 4096
+
+# JWS 헤더 (base64url 인코딩 완료)
+# 헤더는 알고리즘이 같으면 항상 같으므로 서명마다 json.dumps하지 않고 한 번만 만듭니다.
+_ENCODED_JWT_HEADER = base64url_encode(
+    orjson.dumps({"alg": settings.JWT_ALGORITHM, "typ": "JWT"})
+)
+
+
+def _encode_token(
+    data: dict[str, Any],
+    lifetime_seconds: int,
+    token_type: str
+) -> tuple[str, int]:
+    """
+    exp/iat/type 클레임을 붙여 토큰에 서명합니다.
+
+    Args:
+        data: 토큰에 포함할 데이터
+        lifetime_seconds: 토큰 수명 (초)
+        token_type: 토큰 타입 ("access" 또는 "refresh")
+
+    Returns:
+        tuple: (JWT 토큰 문자열, 만료 시각 epoch 초)
+    """
+    now = int(time.time())
+    expire = now + lifetime_seconds
+
+    # jwt.encode는 클레임 dict를 복사한 뒤 표준 json으로 직렬화하므로,
+    # 클레임을 한 번에 구성해 orjson으로 직렬화하고 미리 만든 키/헤더로 직접 서명합니다.
+    # (exp/iat가 이미 정수라 jwt.encode의 datetime 변환도 필요 없음)
+    encoded_claims = base64url_encode(orjson.dumps({
+        **data,
+        "exp": expire,
+        "iat": now,
+        "type": token_type
+    }))
+    signing_input = b".".join((_ENCODED_JWT_HEADER, encoded_claims))
+    signature = base64url_encode(_JWT_ALGORITHM.sign(signing_input, _JWT_KEY))
+
+    return b".".join((signing_input, signature)).decode(), expire
+
 
 def create_access_token(
     data: dict[str, Any],
@@ -28,7 +101,7 @@ def create_access_token(
         - duty_code_id: 직급 ID
         - permissions: 권한 목록 (list[str])
         - email: 이메일
-        - emp_name: 직원 이름
+        - name: 직원 이름
         - exp: 만료 시간
         - iat: 발급 시간
 
@@ -42,31 +115,17 @@ def create_access_token(
     Example:
         >>> token = create_access_token({
         ...     "sub": "1",
-        ...     "company_code": "VNTG",
+        ...     "company_code": 100,
         ...     "emp_id": 1,
         ...     "duty_code_id": 1,
         ...     "permissions": ["user:read", "user:write"],
         ...     "email": "admin@vantage.com",
-        ...     "emp_name": "관리자"
+        ...     "name": "관리자"
         ... })
     """
-    to_encode = data.copy()
-
-    # 만료 시간 설정
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-
-    to_encode.update({
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
-        "type": "access"
-    })
-
-    # JWT 토큰 생성
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-    return encoded_jwt
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TOKEN_TTL_SECONDS
+    token, _ = _encode_token(data, lifetime, "access")
+    return token
 
 
 def create_refresh_token(
@@ -93,27 +152,60 @@ def create_refresh_token(
     Example:
         >>> token = create_refresh_token({
         ...     "sub": "1",
-        ...     "company_code": "VNTG",
+        ...     "company_code": 100,
         ...     "emp_id": 1
         ... })
     """
-    to_encode = data.copy()
+    token, _ = create_refresh_token_with_expiry(data, expires_delta)
+    return token
 
-    # 만료 시간 설정
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
-    to_encode.update({
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
-        "type": "refresh"
-    })
+def create_refresh_token_with_expiry(
+    data: dict[str, Any],
+    expires_delta: Optional[timedelta] = None
+) -> tuple[str, datetime]:
+    """
+    Refresh Token을 생성하고 만료 시각을 함께 반환합니다.
+
+    저장용 만료 시각을 얻기 위해 방금 만든 토큰을 다시 디코딩(get_token_expiry)하지 않습니다.
+
+    Args:
+        data: 토큰에 포함할 데이터
+        expires_delta: 만료 시간 (기본값: 7일)
+
+    Returns:
+        tuple: (JWT Refresh Token, 만료 시각 (UTC))
+    """
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else _REFRESH_TOKEN_TTL_SECONDS
+    token, expire = _encode_token(data, lifetime, "refresh")
+    return token, datetime.fromtimestamp(expire, tz=timezone.utc)
+
+
+def _peek_claims(token: str) -> Optional[dict[str, Any]]:
+    """
+    서명을 검증하지 않고 페이로드 구간만 디코딩합니다. (헤더 파싱/클레임 검증 없음)
 
-    # JWT 토큰 생성
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-    return encoded_jwt
+    만료 시각 같은 참고용 값 조회에만 사용하며, 인증 판단은 반드시 서명 검증 후에 합니다.
+
+    Args:
+        token: JWT 토큰 문자열
+
+    Returns:
+        dict | None: 페이로드 (형식이 잘못된 경우 None)
+    """
+    try:
+        claims = orjson.loads(base64url_decode(token.split(".", 2)[1]))
+    except (IndexError, ValueError):
+        return None
+    return claims if isinstance(claims, dict) else None
+
+
+def _invalid_token_type(expected: str, actual: Any) -> UnauthorizedException:
+    """토큰 타입 불일치 예외를 만듭니다."""
+    return UnauthorizedException(
+        message=f"Invalid token type. Expected '{expected}', got '{actual}'",
+        details={"expected": expected, "actual": actual}
+    )
 
 
 def verify_token(token: str, token_type: str = "access") -> dict[str, Any]:
@@ -133,35 +225,28 @@ def verify_token(token: str, token_type: str = "access") -> dict[str, Any]:
     Example:
         >>> payload = verify_token(token, "access")
         >>> print(payload["company_code"])
-        VNTG
+        100
     """
     try:
-        # JWT 디코딩
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        # JWT 디코딩 (서명/만료 검증)
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_ALLOWED_JWT_ALGORITHMS)
 
-        # 토큰 타입 확인
+        # 토큰 타입 확인 (서명이 검증된 페이로드 기준, type 클레임이 없는 토큰 포함)
         if payload.get("type") != token_type:
+            raise _invalid_token_type(token_type, payload.get("type"))
+
+        # 필수 필드 확인 (집합 차집합으로 한 번에 계산)
+        missing = _REQUIRED_CLAIMS.get(token_type, _REQUIRED_ACCESS_CLAIMS) - payload.keys()
+        if missing:
+            field = min(missing)
             raise UnauthorizedException(
-                message=f"Invalid token type. Expected '{token_type}', got '{payload.get('type')}'",
-                details={"expected": token_type, "actual": payload.get("type")}
+                message=f"Missing required field: {field}",
+                details={"field": field}
             )
 
-        # 필수 필드 확인
-        if token_type == "access":
-            required_fields = ["sub", "company_code", "emp_id"]
-        else:  # refresh
-            required_fields = ["sub", "company_code", "emp_id"]
-
-        for field in required_fields:
-            if field not in payload:
-                raise UnauthorizedException(
-                    message=f"Missing required field: {field}",
-                    details={"field": field}
-                )
-
         return payload
 
-    except JWTError as e:
+    except PyJWTError as e:
         raise UnauthorizedException(
             message="Invalid or expired token",
             details={"error": str(e)}
@@ -186,27 +271,74 @@ def decode_token_without_verification(token: str) -> Optional[dict[str, Any]]:
     """
     try:
         return jwt.decode(token, options={"verify_signature": False})
-    except JWTError:
+    except PyJWTError:
         return None
 
 
-def hash_token(token: str) -> str:
+def hash_token(token: str) -> bytes:
     """
-    토큰을 SHA-256으로 해시합니다.
+    토큰을 keyed BLAKE2b로 해시합니다.
 
-    Refresh Token을 데이터베이스에 저장할 때 사용합니다.
+    Refresh Token을 데이터베이스에 저장/조회할 때 사용합니다.
+    BLAKE2b는 SHA-NI가 없는 환경에서도 SHA-256보다 빠르고,
+    키를 사용하므로 그 자체로 HMAC 역할을 합니다.
+    hex 인코딩 없이 32바이트 다이제스트를 그대로 저장하여 행/인덱스 크기를 줄입니다.
+
+    참고:
+        - hashlib.blake2b는 CPython 내장 SIMD 구현을 사용하므로 별도 의존성(blake3)이 필요 없습니다.
+        - JWT 서명(HS256)은 PyJWT → hmac → hashlib(OpenSSL) 경로로 계산되며,
+          OpenSSL이 CPU의 SHA-NI 명령어를 자동으로 사용합니다.
 
     Args:
         token: JWT 토큰 문자열
 
     Returns:
-        str: SHA-256 해시 문자열 (hex)
+        bytes: 32바이트 BLAKE2b 다이제스트
 
     Example:
         >>> token_hash = hash_token(refresh_token)
-        >>> # DB에 저장: INSERT INTO REFRESH_TOKEN (TOKEN_HASH) VALUES (token_hash)
+        >>> # DB에 저장: INSERT INTO refresh_tokens (token_hash) VALUES (token_hash)
+    """
+    return hashlib.blake2b(token.encode(), digest_size=32, key=_TOKEN_HASH_KEY).digest()
+
+
+def is_well_formed_token(token: str) -> bool:
     """
-    return hashlib.sha256(token.encode()).hexdigest()
+    토큰이 JWT 형식(base64url 세 구간)인지 확인합니다. (서명/만료는 검증하지 않음)
+
+    형식이 맞지 않는 토큰은 해시 계산이나 DB 조회 없이 바로 거를 때 사용합니다.
+
+    Args:
+        token: JWT 토큰 문자열
+
+    Returns:
+        bool: 형식이 올바르면 True
+    """
+    return len(token) <= MAX_TOKEN_LENGTH and _JWT_SHAPE.fullmatch(token) is not None
+
+
+def get_token_expiry_ts(token: str) -> Optional[int]:
+    """
+    토큰의 만료 시각을 epoch 초로 반환합니다.
+
+    time.time()과 비교만 하는 경우 datetime 객체를 만들 필요가 없으므로 이 함수를 사용합니다.
+
+    Args:
+        token: JWT 토큰 문자열
+
+    Returns:
+        int | None: 만료 시각 (epoch 초, 실패 시 None)
+
+    Example:
+        >>> if (get_token_expiry_ts(token) or 0) < time.time():
+        ...     print("expired")
+    """
+    # 만료 시각만 필요하므로 PyJWT 디코딩 없이 페이로드 구간만 파싱합니다.
+    payload = _peek_claims(token)
+    exp = payload.get("exp") if payload else None
+    if isinstance(exp, (int, float)):
+        return int(exp)
+    return None
 
 
 def get_token_expiry(token: str) -> Optional[datetime]:
@@ -223,7 +355,7 @@ def get_token_expiry(token: str) -> Optional[datetime]:
         >>> expiry = get_token_expiry(token)
         >>> print(f"Token expires at: {expiry}")
     """
-    payload = decode_token_without_verification(token)
-    if payload and "exp" in payload:
-        return datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
-    return None
+    exp = get_token_expiry_ts(token)
+    if exp is None:
+        return None
+    return datetime.fromtimestamp(exp, tz=timezone.utc)
@@ -0,0 +1,86 @@
+"""
+JWT 검증 결과 캐시
+
+동일한 토큰이 짧은 시간 안에 반복 검증될 때 서명 검증(HMAC/RSA)을 생략하기 위해
+검증에 성공한 페이로드를 프로세스 메모리에 잠시 보관합니다.
+
+주의:
+    - 검증에 실패한 토큰은 절대 캐시하지 않습니다.
+    - 캐시 항목은 min(토큰 exp, 현재 + TTL) 까지만 유효합니다.
+    - 서명 키 교체 등 토큰 무효화는 최대 TTL만큼 늦게 반영됩니다.
+      허용할 수 없는 환경에서는 JWT_VERIFY_CACHE_ENABLED=False로 끕니다.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Any
+
+from cachetools import TTLCache
+
+from server.app.core.config import settings
+from server.app.shared.utils.jwt import verify_token
+
+# 캐시 설정
+JWT_CACHE_MAXSIZE = 10_000
+JWT_CACHE_TTL_SECONDS = settings.JWT_VERIFY_CACHE_TTL_SECONDS
+
+_cache: TTLCache = TTLCache(maxsize=JWT_CACHE_MAXSIZE, ttl=JWT_CACHE_TTL_SECONDS)
+_lock = threading.Lock()
+
+
+def _cache_key(token: str, token_type: str) -> tuple[bytes, str]:
+    """토큰 원문 대신 BLAKE2b 다이제스트를 키로 사용합니다."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest(), token_type
+
+
+def verify_token_cached(token: str, token_type: str = "access") -> dict[str, Any]:
+    """
+    캐시를 거쳐 JWT 토큰을 검증합니다.
+
+    캐시에 유효한(exp가 지나지 않은) 페이로드가 있으면 그 복사본을 반환하고,
+    없으면 verify_token으로 검증한 뒤 결과를 캐시에 저장합니다.
+    만료된 항목은 TTL을 기다리지 않고 바로 제거합니다.
+    JWT_VERIFY_CACHE_ENABLED가 False면 캐시 없이 매번 검증합니다.
+
+    반환값은 캐시 항목의 얕은 복사본이므로 호출자가 키를 추가/변경해도 캐시에는
+    영향이 없습니다. (permissions 등 중첩 리스트는 공유되므로 수정하지 마세요)
+
+    Args:
+        token: JWT 토큰 문자열
+        token_type: 토큰 타입 ("access" 또는 "refresh")
+
+    Returns:
+        dict: 디코딩된 페이로드
+
+    Raises:
+        UnauthorizedException: 토큰이 유효하지 않거나 만료된 경우
+    """
+    if not settings.JWT_VERIFY_CACHE_ENABLED:
+        return verify_token(token, token_type=token_type)
+
+    key = _cache_key(token, token_type)
+
+    with _lock:
+        payload = _cache.get(key)
+        if payload is not None and payload.get("exp", 0) <= time.time():
+            # 토큰 만료 → 캐시 항목 제거 후 재검증 (만료 예외 발생)
+            del _cache[key]
+            payload = None
+
+    if payload is not None:
+        return dict(payload)
+
+    # 캐시 미스 → 실제 검증 (실패 시 예외가 전파되므로 캐시되지 않음)
+    payload = verify_token(token, token_type=token_type)
+
+    with _lock:
+        _cache[key] = payload
+
+    return dict(payload)
+
+
+def clear_jwt_cache() -> None:
+    """캐시를 비웁니다. (테스트 또는 키 교체 시 사용)"""
+    with _lock:
+        _cache.clear()
@@ -1,40 +1,78 @@
 """
 비밀번호 암호화 및 검증 유틸리티
 
-BCRYPT를 사용하여 비밀번호를 안전하게 해싱하고 검증합니다.
+Argon2id를 사용하여 비밀번호를 안전하게 해싱하고 검증합니다.
+기존 BCRYPT 해시도 검증할 수 있으며, 로그인 성공 시 needs_update로 확인해 Argon2id로 재해싱합니다.
+두 알고리즘 모두 의도적으로 CPU(Argon2id는 메모리도)를 많이 사용하므로,
+async 코드에서는 이벤트 루프를 막지 않도록 *_async 변형을 사용하세요.
 """
 
-from passlib.context import CryptContext
+import asyncio
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
 
-# BCRYPT 컨텍스트 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from server.app.core.config import settings
+
+# Argon2id 해시 접두어 ($argon2id$v=19$m=...,t=...,p=...$<salt>$<hash>)
+_ARGON2ID_PREFIX = "$argon2id$"
+
+# 저장된 값이 BCRYPT 해시인지 판별할 때 허용하는 접두어 (bcrypt.checkpw가 모두 지원)
+# bcrypt 패키지(네이티브 백엔드)를 직접 사용하며, 기존 해시 검증에만 사용합니다.
+BCRYPT_PREFIXES = frozenset({"$2a$", "$2b$", "$2y$"})
+
+# BCRYPT 해시 길이 ($2b$<cost>$<salt 22자><hash 31자>)
+# bcrypt 패키지(Rust 구현)는 잘린 해시에서 ValueError가 아닌 panic을 일으키므로 길이를 먼저 확인합니다.
+BCRYPT_HASH_LENGTH = 60
+
+# Argon2id 해셔 (argon2-cffi의 C 구현, 파라미터는 설정값으로 고정)
+_password_hasher = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+    hash_len=32,
+    type=Type.ID,
+)
+
+# 비밀번호 해싱 전용 스레드 풀
+# argon2-cffi와 bcrypt C 확장은 해싱 중 GIL을 해제하므로 스레드만으로 코어 수만큼 병렬 처리됩니다.
+PASSWORD_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count(),
+    thread_name_prefix="password",
+)
 
 
 def hash_password(password: str) -> str:
     """
-    비밀번호를 BCRYPT로 해싱합니다.
+    비밀번호를 Argon2id로 해싱합니다.
 
     Args:
         password: 평문 비밀번호
 
     Returns:
-        str: BCRYPT 해시 문자열
+        str: Argon2id 해시 문자열
 
     Example:
         >>> hashed = hash_password("mypassword123")
         >>> print(hashed)
-        $2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5GyYC5OwHbaHm
+        $argon2id$v=19$m=47104,t=1,p=1$c2FsdHNhbHRzYWx0$...
     """
-    return pwd_context.hash(password)
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     평문 비밀번호와 해시값을 비교하여 일치 여부를 확인합니다.
 
+    해시 접두어로 Argon2id / BCRYPT를 구분하여 검증합니다.
+
     Args:
         plain_password: 평문 비밀번호
-        hashed_password: BCRYPT 해시 문자열
+        hashed_password: Argon2id 또는 BCRYPT 해시 문자열
 
     Returns:
         bool: 비밀번호 일치 여부 (True/False)
@@ -46,15 +84,75 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         >>> verify_password("wrongpassword", hashed)
         False
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    if hashed_password.startswith(_ARGON2ID_PREFIX):
+        try:
+            return _password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            # 불일치 또는 잘못된 형식의 해시
+            return False
+
+    if is_bcrypt_hash(hashed_password):
+        if len(hashed_password) != BCRYPT_HASH_LENGTH:
+            return False
+        try:
+            return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("ascii"))
+        except ValueError:
+            # 잘못된 형식의 해시
+            return False
+
+    return False
+
+
+def is_bcrypt_hash(stored_password: str) -> bool:
+    """
+    저장된 비밀번호가 BCRYPT 해시인지 확인합니다.
+
+    Args:
+        stored_password: DB에 저장된 비밀번호 값
+
+    Returns:
+        bool: BCRYPT 해시 여부 (False면 평문으로 저장된 값)
+    """
+    return stored_password[:4] in BCRYPT_PREFIXES
+
+
+def is_password_hash(stored_password: str) -> bool:
+    """
+    저장된 비밀번호가 해시값(Argon2id 또는 BCRYPT)인지 확인합니다.
+
+    Args:
+        stored_password: DB에 저장된 비밀번호 값
+
+    Returns:
+        bool: 해시 여부 (False면 평문으로 저장된 값)
+    """
+    return stored_password.startswith(_ARGON2ID_PREFIX) or is_bcrypt_hash(stored_password)
+
+
+def verify_plaintext_password(plain_password: str, stored_password: str) -> bool:
+    """
+    평문으로 저장된 비밀번호(개발 환경)를 상수 시간으로 비교합니다.
+
+    == 비교는 첫 번째 다른 문자에서 멈추므로 응답 시간으로 일치 길이가 드러날 수 있습니다.
+
+    Args:
+        plain_password: 입력한 평문 비밀번호
+        stored_password: DB에 평문으로 저장된 비밀번호
+
+    Returns:
+        bool: 비밀번호 일치 여부 (True/False)
+    """
+    return hmac.compare_digest(plain_password.encode("utf-8"), stored_password.encode("utf-8"))
 
 
 def needs_update(hashed_password: str) -> bool:
     """
-    해시 알고리즘 업데이트가 필요한지 확인합니다.
+    해시 알고리즘/파라미터 업데이트가 필요한지 확인합니다.
+
+    BCRYPT 해시이거나 현재 설정과 다른 파라미터의 Argon2id 해시면 재해싱 대상입니다.
 
     Args:
-        hashed_password: BCRYPT 해시 문자열
+        hashed_password: Argon2id 또는 BCRYPT 해시 문자열
 
     Returns:
         bool: 업데이트 필요 여부
@@ -64,4 +162,40 @@ def needs_update(hashed_password: str) -> bool:
         >>> needs_update(hashed)
         False
     """
-    return pwd_context.needs_update(hashed_password)
+    if not hashed_password.startswith(_ARGON2ID_PREFIX):
+        return True
+    try:
+        return _password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    hash_password를 비밀번호 해싱 전용 스레드 풀에서 실행합니다.
+
+    Args:
+        password: 평문 비밀번호
+
+    Returns:
+        str: Argon2id 해시 문자열
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(PASSWORD_POOL, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    verify_password를 비밀번호 해싱 전용 스레드 풀에서 실행합니다.
+
+    Args:
+        plain_password: 평문 비밀번호
+        hashed_password: Argon2id 또는 BCRYPT 해시 문자열
+
+    Returns:
+        bool: 비밀번호 일치 여부 (True/False)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        PASSWORD_POOL, verify_password, plain_password, hashed_password
+    )
@@ -10,7 +10,7 @@ install(show_locals=True)
 
 # 2️⃣ FastAPI core
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
@@ -25,7 +25,11 @@ from server.app.core.routers import router as core_router
 from server.app.core.logging import setup_logging, get_logger
 from server.app.core.middleware import RequestIDMiddleware, ExternalLoggingMiddleware
 from server.app.api.v1.router import api_router
+from server.app.domain.auth.login_audit import start_login_audit_worker, stop_login_audit_worker
+from server.app.domain.auth.providers import warm_menu_cache, warm_permission_cache
 from server.app.shared.exceptions import ApplicationException
+from server.app.shared.utils.google_oauth import close_google_http_client
+from server.app.shared.utils.password import PASSWORD_POOL
 
 # 5️⃣ FastAPI app 생성 (debug 필수)
 app = FastAPI(debug=True)
@@ -71,11 +75,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         print("⚠️  Development mode: Creating database tables...")
         # await DatabaseManager.create_tables()
 
+    # 권한 캐시 워밍업 (직급/회사별 권한 목록)
+    warmed = await warm_permission_cache()
+    logger.info(f"🔑 Permission cache warmed: {warmed} duty/company entries")
+
+    # 메뉴 캐시 워밍업 (직급/회사별 메뉴 목록)
+    warmed = await warm_menu_cache()
+    logger.info(f"📋 Menu cache warmed: {warmed} duty/company entries")
+
+    # 로그인 이력 백그라운드 기록기 시작
+    start_login_audit_worker()
+
     yield
 
     # 종료 시 실행
     logger.info("👋 Shutting down application...")
+    await stop_login_audit_worker()  # 남은 로그인 이력 기록 후 종료
     await DatabaseManager.close_connections()
+    await close_google_http_client()
+    PASSWORD_POOL.shutdown(wait=False)
     logger.info("✅ Application shutdown complete")
 
 
@@ -127,6 +145,8 @@ def create_application() -> FastAPI:
         """,
         debug=settings.DEBUG,
         lifespan=lifespan,
+        # 모든 응답을 orjson으로 직렬화 (표준 json 인코더 대비 빠름, datetime 네이티브 지원)
+        default_response_class=ORJSONResponse,
         # docs_url="/docs" if settings.DEBUG else None,  # 운영에서는 문서 비활성화 가능
         # redoc_url="/redoc" if settings.DEBUG else None,
     )
@@ -171,7 +191,7 @@ def create_application() -> FastAPI:
     async def application_exception_handler(
         request: Request,
         exc: ApplicationException
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """
         애플리케이션 예외 핸들러
 
@@ -191,7 +211,7 @@ def create_application() -> FastAPI:
             }
         )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": exc.message,
@@ -203,7 +223,7 @@ def create_application() -> FastAPI:
     async def general_exception_handler(
         request: Request,
         exc: Exception
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """
         일반 예외 핸들러
 
@@ -213,8 +233,10 @@ def create_application() -> FastAPI:
         request_id = getattr(request.state, 'request_id', None)
 
         # 로깅 및 알림
+        # 메시지 포맷은 로그 레벨이 활성화된 경우에만 수행되도록 인자로 넘깁니다.
         logger.error(
-            f"Unexpected error: {str(exc)}",
+            "Unexpected error: %s",
+            exc,
             extra={
                 "request_id": request_id,
                 "exception_type": type(exc).__name__,
@@ -226,7 +248,7 @@ def create_application() -> FastAPI:
 
         # 개발 환경에서는 상세 에러 표시
         if settings.DEBUG:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "error": "Internal server error",
@@ -238,7 +260,7 @@ def create_application() -> FastAPI:
             )
 
         # 운영 환경에서는 간단한 에러 메시지만
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "Internal server error",
@@ -301,6 +323,9 @@ if __name__ == "__main__":
 
     사용법:
         python -m server.main
+
+    운영 환경에서는 동일한 옵션으로 uvicorn CLI를 직접 실행합니다:
+        uvicorn server.main:app --loop uvloop --http httptools --no-access-log
     """
     import uvicorn
 
@@ -310,4 +335,7 @@ if __name__ == "__main__":
         port=settings.SERVER_PORT,
         reload=settings.DEBUG,
         log_level=settings.LOG_LEVEL.lower(),
+        loop="uvloop",  # uvicorn[standard]에 포함
+        http="httptools",
+        access_log=settings.SERVER_ACCESS_LOG,
     )
@@ -78,6 +78,9 @@ async def test_db() -> AsyncGenerator[AsyncSession, None]:
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
+    # 연결 정리 (aiosqlite 연결 스레드가 남아 있으면 pytest 종료 시 프로세스가 끝나지 않음)
+    await test_engine.dispose()
+
 
 # ====================
 # FastAPI Client Fixtures
@@ -0,0 +1,55 @@
+"""
+Auth 엔드포인트 단위 테스트
+
+개발용 비밀번호 해싱 엔드포인트가 DEBUG 모드에서만 동작하는지 검증합니다.
+(엔드포인트 함수를 직접 호출, DB 없음)
+"""
+
+import pytest
+
+from server.app.api.v1.endpoints import auth as auth_endpoints
+from server.app.api.v1.endpoints.auth import HashPasswordRequest, hash_password_utility
+from server.app.core.config import settings
+from server.app.shared.exceptions import NotFoundException
+
+
+@pytest.fixture
+def hash_calls(monkeypatch) -> list[tuple[int, str]]:
+    """AuthService.hash_user_password 호출 기록 (항상 성공)"""
+    calls: list[tuple[int, str]] = []
+
+    async def fake_hash_user_password(self, emp_id: int, plain_password: str) -> bool:
+        calls.append((emp_id, plain_password))
+        return True
+
+    monkeypatch.setattr(
+        auth_endpoints.AuthService, "hash_user_password", fake_hash_user_password
+    )
+    return calls
+
+
+@pytest.mark.unit
+class TestHashPasswordUtility:
+    """POST /auth/hash-password"""
+
+    async def test_not_found_outside_debug(self, monkeypatch, hash_calls):
+        """DEBUG가 아니면 404이고 비밀번호를 건드리지 않음"""
+        monkeypatch.setattr(settings, "DEBUG", False)
+
+        with pytest.raises(NotFoundException):
+            await hash_password_utility(
+                HashPasswordRequest(emp_id=1, plain_password="new-password"), db=None
+            )
+
+        assert hash_calls == []
+
+    async def test_hashes_in_debug(self, monkeypatch, hash_calls):
+        """DEBUG 모드에서는 해싱 후 응답 모델 반환"""
+        monkeypatch.setattr(settings, "DEBUG", True)
+
+        response = await hash_password_utility(
+            HashPasswordRequest(emp_id=1, plain_password="new-password"), db=None
+        )
+
+        assert response.success is True
+        assert hash_calls == [(1, "new-password")]
@@ -0,0 +1,104 @@
+"""
+Auth Formatter 단위 테스트
+
+Employee 모델 → UserInfo / LoginResponse 변환을 검증합니다.
+"""
+
+from datetime import datetime
+
+import orjson
+import pytest
+
+from server.app.domain.auth.formatters import (
+    _USER_INFO_FIELDS,
+    AuthFormatter,
+    dump_login_response,
+)
+from server.app.domain.auth.models import Employee
+from server.app.domain.auth.schemas import AuthFormatterInput, LoginResponse, UserInfo
+
+
+@pytest.fixture
+def employee() -> Employee:
+    """테스트용 Employee 인스턴스 (DB 저장 없음)"""
+    return Employee(
+        emp_id=1,
+        company_code=100,
+        emp_no="EMP001",
+        email="admin@vantage.com",
+        name="시스템 관리자",
+        phone="010-1234-5678",
+        dept_id=10,
+        pos_code_id=20,
+        duty_code_id=30,
+        use_yn="Y",
+        account_status="ACTIVE",
+        last_login_at=datetime(2024, 1, 1, 9, 0, 0),
+    )
+
+
+@pytest.mark.unit
+class TestAuthFormatter:
+    """
+    AuthFormatter 테스트
+    """
+
+    def test_user_info_fields_match_employee_and_schema(self):
+        """복사 대상 필드가 Employee 컬럼과 UserInfo 필드에 모두 존재하는지 확인"""
+        employee_columns = set(Employee.__table__.columns.keys())
+
+        for field in _USER_INFO_FIELDS:
+            assert field in employee_columns
+            assert field in UserInfo.model_fields
+
+    def test_format_builds_user_info_from_employee(self, employee: Employee):
+        """Employee 인스턴스로 UserInfo가 올바르게 구성되는지 확인"""
+        response = AuthFormatter().format_sync(
+            AuthFormatterInput(
+                user=employee,
+                access_token="access",
+                refresh_token="refresh",
+                permissions=["ADMIN"],
+            )
+        )
+
+        user = response.user
+        assert isinstance(user, UserInfo)
+        assert user.emp_id == employee.emp_id
+        assert user.company_code == employee.company_code
+        assert user.email == employee.email
+        assert user.name == employee.name
+        assert user.dept_id == employee.dept_id
+        assert user.last_login_at == employee.last_login_at
+        assert response.permissions == ["ADMIN"]
+        assert response.token_type == "bearer"
+
+    def test_format_output_matches_validated_model(self, employee: Employee):
+        """검증을 생략한 UserInfo가 검증된 모델과 같은 값을 갖는지 확인"""
+        response = AuthFormatter().format_sync(
+            AuthFormatterInput(
+                user=employee,
+                access_token="access",
+                refresh_token="refresh",
+                permissions=[],
+            )
+        )
+
+        validated = UserInfo.model_validate(employee)
+        assert response.user.model_dump() == validated.model_dump()
+
+    def test_dump_login_response_matches_schema_serialization(self, employee: Employee):
+        """미리 직렬화한 응답 바이트가 LoginResponse 직렬화 결과와 같은지 확인"""
+        response = AuthFormatter().format_sync(
+            AuthFormatterInput(
+                user=employee,
+                access_token="access",
+                refresh_token="refresh",
+                permissions=["ADMIN", "USER"],
+            )
+        )
+
+        dumped = dump_login_response(response)
+
+        assert orjson.loads(dumped) == orjson.loads(response.model_dump_json())
+        LoginResponse.model_validate_json(dumped)
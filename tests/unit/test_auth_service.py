@@ -0,0 +1,125 @@
+"""
+AuthService 단위 테스트
+
+일반 로그인 성공 시 기존 해시(BCRYPT/이전 파라미터)를 Argon2id로 재해싱하는지 검증합니다.
+(DB 대신 가짜 Provider 사용)
+"""
+
+from datetime import datetime
+
+import bcrypt
+import pytest
+
+from server.app.domain.auth import service as auth_service
+from server.app.domain.auth.models import Employee
+from server.app.domain.auth.schemas import AuthProviderOutput, LoginRequest
+from server.app.domain.auth.service import AuthService
+from server.app.shared.utils.password import hash_password, needs_update, verify_password
+
+PASSWORD = "test123"
+
+
+class FakeAuthProvider:
+    """AuthService가 사용하는 Provider 메서드만 구현한 가짜 Provider"""
+
+    def __init__(self, user: Employee):
+        self.user = user
+        self.updated_passwords: list[tuple[int, str]] = []
+        self.failed_logins: list[int] = []
+
+    async def provide(self, input_data) -> AuthProviderOutput:
+        return AuthProviderOutput(user=self.user, permissions=["user:read"])
+
+    async def update_password(self, emp_id: int, password_hash: str) -> bool:
+        self.updated_passwords.append((emp_id, password_hash))
+        return True
+
+    async def increment_failed_login(self, emp_id: int) -> int:
+        self.failed_logins.append(emp_id)
+        return len(self.failed_logins)
+
+    async def record_login_success(self, **kwargs) -> None:
+        return None
+
+
+def make_employee(password: str) -> Employee:
+    """저장된 비밀번호 값만 다른 테스트용 직원"""
+    return Employee(
+        emp_id=1,
+        company_code=100,
+        emp_no="EMP001",
+        email="admin@vantage.com",
+        name="시스템 관리자",
+        duty_code_id=30,
+        use_yn="Y",
+        account_status="ACTIVE",
+        password=password,
+        failed_login_count=0,
+        account_locked_until=None,
+        last_login_at=datetime(2024, 1, 1, 9, 0, 0),
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_login_audit(monkeypatch):
+    """로그인 이력 큐 적재 생략"""
+    monkeypatch.setattr(auth_service, "enqueue_login_attempt", lambda **kwargs: None)
+
+
+async def login(stored_password: str, password: str = PASSWORD) -> tuple[bool, FakeAuthProvider]:
+    """가짜 Provider로 로그인하고 (성공 여부, Provider)를 반환"""
+    service = AuthService(db=None)
+    provider = FakeAuthProvider(make_employee(stored_password))
+    service.provider = provider
+
+    result = await service.execute(
+        LoginRequest(company_code=100, email="admin@vantage.com", password=password)
+    )
+    return result.success, provider
+
+
+def only_update(provider: FakeAuthProvider) -> str | None:
+    """저장된 새 해시 (재해싱이 없으면 None)"""
+    assert len(provider.updated_passwords) <= 1
+    return provider.updated_passwords[0][1] if provider.updated_passwords else None
+
+
+@pytest.mark.unit
+class TestLoginRehash:
+    """로그인 성공 시 재해싱"""
+
+    async def test_bcrypt_hash_is_rehashed_to_argon2id(self):
+        """BCRYPT 해시로 로그인하면 같은 비밀번호의 Argon2id 해시를 저장"""
+        stored = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(rounds=4)).decode()
+
+        success, provider = await login(stored)
+
+        new_hash = only_update(provider)
+        assert success is True
+        assert new_hash.startswith("$argon2id$")
+        assert verify_password(PASSWORD, new_hash) is True
+        assert needs_update(new_hash) is False
+
+    async def test_current_argon2id_hash_is_not_rehashed(self):
+        """현재 파라미터의 Argon2id 해시는 그대로 둠"""
+        success, provider = await login(hash_password(PASSWORD))
+
+        assert success is True
+        assert only_update(provider) is None
+
+    async def test_failed_login_does_not_rehash(self):
+        """비밀번호가 틀리면 재해싱하지 않고 실패 횟수만 증가"""
+        stored = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(rounds=4)).decode()
+
+        success, provider = await login(stored, password="wrong")
+
+        assert success is False
+        assert only_update(provider) is None
+        assert provider.failed_logins == [1]
+
+    async def test_plaintext_password_is_not_rehashed_on_login(self):
+        """평문 저장 값(개발 환경)은 로그인 경로에서 재해싱하지 않음"""
+        success, provider = await login(PASSWORD)
+
+        assert success is True
+        assert only_update(provider) is None
@@ -0,0 +1,285 @@
+"""
+Google ID 토큰 검증 단위 테스트
+
+JWKS 로컬 검증 / tokeninfo 대체 경로의 aud·iss 검증과 설정 누락 시 거부를 검증합니다.
+(Google API 호출은 가짜 HTTP 클라이언트로 대체)
+"""
+
+import time
+from typing import Any
+
+import jwt
+import orjson
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from server.app.core.config import settings
+from server.app.domain.auth.google_oauth_service import GoogleOAuthService
+from server.app.domain.auth.schemas import GoogleLoginRequest
+from server.app.shared.exceptions import ApplicationException
+from server.app.shared.utils import google_oauth
+
+CLIENT_ID = "test-client.apps.googleusercontent.com"
+
+
+class FakeResponse:
+    """httpx.Response 대체 (status_code / content / headers)"""
+
+    def __init__(self, payload: Any, status_code: int = 200, headers: dict | None = None):
+        self.status_code = status_code
+        self.content = orjson.dumps(payload)
+        self.text = self.content.decode()
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise google_oauth.httpx.HTTPStatusError(
+                "error", request=None, response=None
+            )
+
+
+class FakeHttpClient:
+    """URL별로 응답(또는 예외)을 돌려주는 가짜 httpx.AsyncClient"""
+
+    is_closed = False
+
+    def __init__(self, routes: dict[str, Any]):
+        self.routes = routes
+        self.calls: list[str] = []
+
+    async def get(self, url: str, **kwargs) -> FakeResponse:
+        self.calls.append(url)
+        result = self.routes[url]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def signing_key() -> rsa.RSAPrivateKey:
+    """테스트용 RSA 서명 키"""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def jwks(signing_key: rsa.RSAPrivateKey) -> dict[str, Any]:
+    """signing_key의 공개키를 kid=k1로 담은 JWKS"""
+    key = orjson.loads(RSAAlgorithm.to_jwk(signing_key.public_key()))
+    key.update(kid="k1", alg="RS256")
+    return {"keys": [key]}
+
+
+@pytest.fixture(autouse=True)
+def reset_google_state(monkeypatch):
+    """모듈 캐시/공유 클라이언트를 테스트마다 초기화"""
+    monkeypatch.setattr(settings, "GOOGLE_CLIENT_ID", CLIENT_ID)
+    google_oauth._token_cache.clear()
+    google_oauth._inflight.clear()
+    monkeypatch.setattr(google_oauth, "_signing_keys", {})
+    monkeypatch.setattr(google_oauth, "_signing_keys_fetched_at", float("-inf"))
+    monkeypatch.setattr(google_oauth, "_signing_keys_failed_at", float("-inf"))
+    yield
+    google_oauth._token_cache.clear()
+
+
+def install_client(monkeypatch, routes: dict[str, Any]) -> FakeHttpClient:
+    """가짜 클라이언트를 공유 클라이언트로 설정"""
+    client = FakeHttpClient(routes)
+    monkeypatch.setattr(google_oauth, "_http_client", client)
+    return client
+
+
+def make_claims(**overrides) -> dict[str, Any]:
+    """유효한 Google ID 토큰 클레임"""
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "google-sub-1",
+        "email": "user@vantage.com",
+        "email_verified": True,
+        "iat": now,
+        "exp": now + 600,
+    }
+    claims.update(overrides)
+    return claims
+
+
+def sign(signing_key: rsa.RSAPrivateKey, claims: dict[str, Any], kid: str = "k1") -> str:
+    """RS256 ID 토큰 생성"""
+    return jwt.encode(claims, signing_key, algorithm="RS256", headers={"kid": kid})
+
+
+def tokeninfo_payload(**overrides) -> dict[str, Any]:
+    """tokeninfo 응답 (값은 문자열)"""
+    payload = {
+        "iss": "accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "google-sub-1",
+        "email": "user@vantage.com",
+        "email_verified": "true",
+        "exp": str(int(time.time()) + 600),
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.mark.unit
+class TestJwksVerification:
+    """JWKS 로컬 검증 경로"""
+
+    async def test_valid_token_is_verified_locally(self, monkeypatch, signing_key, jwks):
+        """서명/aud/iss가 올바르면 tokeninfo 호출 없이 검증"""
+        client = install_client(monkeypatch, {settings.GOOGLE_CERTS_URL: FakeResponse(jwks)})
+
+        user = await google_oauth.verify_google_token(sign(signing_key, make_claims()))
+
+        assert user.sub == "google-sub-1"
+        assert client.calls == [settings.GOOGLE_CERTS_URL]
+
+    async def test_other_client_audience_is_rejected(self, monkeypatch, signing_key, jwks):
+        """다른 클라이언트용 토큰 거부"""
+        install_client(monkeypatch, {settings.GOOGLE_CERTS_URL: FakeResponse(jwks)})
+
+        with pytest.raises(ApplicationException) as exc_info:
+            await google_oauth.verify_google_token(
+                sign(signing_key, make_claims(aud="other-client"))
+            )
+        assert exc_info.value.status_code == 401
+
+    async def test_foreign_issuer_is_rejected(self, monkeypatch, signing_key, jwks):
+        """Google이 아닌 발급자 거부"""
+        install_client(monkeypatch, {settings.GOOGLE_CERTS_URL: FakeResponse(jwks)})
+
+        with pytest.raises(ApplicationException) as exc_info:
+            await google_oauth.verify_google_token(
+                sign(signing_key, make_claims(iss="https://evil.example.com"))
+            )
+        assert exc_info.value.status_code == 401
+
+
+@pytest.mark.unit
+class TestTokeninfoFallback:
+    """JWKS를 사용할 수 없을 때의 tokeninfo 경로"""
+
+    async def test_valid_tokeninfo_response_is_accepted(self, monkeypatch, signing_key):
+        """aud/iss가 일치하면 로그인 허용"""
+        install_client(monkeypatch, {
+            settings.GOOGLE_CERTS_URL: google_oauth.httpx.ConnectError("down"),
+            settings.GOOGLE_TOKENINFO_URL: FakeResponse(tokeninfo_payload()),
+        })
+
+        user = await google_oauth.verify_google_token(sign(signing_key, make_claims()))
+
+        assert user.email == "user@vantage.com"
+
+    async def test_other_client_audience_is_rejected(self, monkeypatch, signing_key):
+        """tokeninfo가 유효하다고 해도 다른 클라이언트용 토큰은 거부"""
+        install_client(monkeypatch, {
+            settings.GOOGLE_CERTS_URL: google_oauth.httpx.ConnectError("down"),
+            settings.GOOGLE_TOKENINFO_URL: FakeResponse(tokeninfo_payload(aud="other-client")),
+        })
+
+        with pytest.raises(ApplicationException) as exc_info:
+            await google_oauth.verify_google_token(sign(signing_key, make_claims()))
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.details == {"error": "Invalid audience"}
+
+    async def test_foreign_issuer_is_rejected(self, monkeypatch, signing_key):
+        """tokeninfo 응답의 iss가 Google이 아니면 거부"""
+        install_client(monkeypatch, {
+            settings.GOOGLE_CERTS_URL: google_oauth.httpx.ConnectError("down"),
+            settings.GOOGLE_TOKENINFO_URL: FakeResponse(
+                tokeninfo_payload(iss="https://evil.example.com")
+            ),
+        })
+
+        with pytest.raises(ApplicationException) as exc_info:
+            await google_oauth.verify_google_token(sign(signing_key, make_claims()))
+        assert exc_info.value.details == {"error": "Invalid issuer"}
+
+
+@pytest.mark.unit
+class TestJwksFailureBackoff:
+    """JWKS 조회 실패 시 재요청 보류"""
+
+    async def test_failed_fetch_is_not_retried_during_backoff(self, monkeypatch, signing_key):
+        """실패 직후 로그인은 JWKS를 다시 요청하지 않고 tokeninfo로 검증"""
+        client = install_client(monkeypatch, {
+            settings.GOOGLE_CERTS_URL: google_oauth.httpx.ConnectError("down"),
+            settings.GOOGLE_TOKENINFO_URL: FakeResponse(tokeninfo_payload()),
+        })
+
+        await google_oauth.verify_google_token(sign(signing_key, make_claims()))
+        await google_oauth.verify_google_token(sign(signing_key, make_claims(sub="google-sub-2")))
+
+        assert client.calls.count(settings.GOOGLE_CERTS_URL) == 1
+        assert client.calls.count(settings.GOOGLE_TOKENINFO_URL) == 2
+
+    async def test_stale_keys_are_served_while_refresh_fails(self, monkeypatch, signing_key, jwks):
+        """만료된 키 목록이라도 갱신 실패 중에는 계속 로컬 검증에 사용"""
+        client = install_client(monkeypatch, {settings.GOOGLE_CERTS_URL: FakeResponse(jwks)})
+        await google_oauth.verify_google_token(sign(signing_key, make_claims()))
+
+        # 키 목록 만료 + JWKS 장애
+        monkeypatch.setattr(google_oauth, "_signing_keys_fetched_at", float("-inf"))
+        client.routes[settings.GOOGLE_CERTS_URL] = google_oauth.httpx.ConnectError("down")
+
+        for sub in ("google-sub-2", "google-sub-3"):
+            user = await google_oauth.verify_google_token(
+                sign(signing_key, make_claims(sub=sub))
+            )
+            assert user.sub == sub
+
+        assert client.calls == [settings.GOOGLE_CERTS_URL] * 2
+        assert settings.GOOGLE_TOKENINFO_URL not in client.calls
+
+    async def test_fetch_is_retried_after_backoff(self, monkeypatch, signing_key, jwks):
+        """보류 시간이 지나면 다시 JWKS를 요청"""
+        client = install_client(monkeypatch, {
+            settings.GOOGLE_CERTS_URL: google_oauth.httpx.ConnectError("down"),
+            settings.GOOGLE_TOKENINFO_URL: FakeResponse(tokeninfo_payload()),
+        })
+        await google_oauth.verify_google_token(sign(signing_key, make_claims()))
+
+        monkeypatch.setattr(
+            google_oauth,
+            "_signing_keys_failed_at",
+            google_oauth._signing_keys_failed_at - google_oauth.GOOGLE_JWKS_FAILURE_BACKOFF_SECONDS,
+        )
+        client.routes[settings.GOOGLE_CERTS_URL] = FakeResponse(jwks)
+
+        await google_oauth.verify_google_token(sign(signing_key, make_claims(sub="google-sub-2")))
+
+        assert client.calls[-1] == settings.GOOGLE_CERTS_URL
+
+
+@pytest.mark.unit
+class TestMissingClientId:
+    """GOOGLE_CLIENT_ID 미설정 시 fail closed"""
+
+    async def test_login_is_refused_without_client_id(self, monkeypatch, signing_key, jwks):
+        """aud 검증을 생략하지 않고 Google API 호출 전에 거부"""
+        monkeypatch.setattr(settings, "GOOGLE_CLIENT_ID", None)
+        client = install_client(monkeypatch, {settings.GOOGLE_CERTS_URL: FakeResponse(jwks)})
+
+        with pytest.raises(ApplicationException) as exc_info:
+            await google_oauth.verify_google_token(sign(signing_key, make_claims()))
+
+        assert exc_info.value.status_code == 503
+        assert client.calls == []
+
+    async def test_service_propagates_503(self, monkeypatch, signing_key):
+        """로그인 서비스도 503을 401(토큰 오류)로 바꾸지 않고 그대로 전파"""
+        monkeypatch.setattr(settings, "GOOGLE_CLIENT_ID", None)
+        install_client(monkeypatch, {})
+
+        with pytest.raises(ApplicationException) as exc_info:
+            await GoogleOAuthService(db=None).execute(
+                GoogleLoginRequest(
+                    company_code=100, google_token=sign(signing_key, make_claims())
+                )
+            )
+
+        assert exc_info.value.status_code == 503
@@ -0,0 +1,112 @@
+"""
+JWT 유틸리티 단위 테스트
+
+토큰 검증(서명/만료/타입/필수 클레임)과 형식 사전 검사를 검증합니다.
+"""
+
+from datetime import timedelta
+
+import orjson
+import pytest
+from jwt.utils import base64url_decode, base64url_encode
+
+from server.app.shared.exceptions import UnauthorizedException
+from server.app.shared.utils.jwt import (
+    MAX_TOKEN_LENGTH,
+    create_access_token,
+    create_refresh_token,
+    is_well_formed_token,
+    verify_token,
+)
+
+CLAIMS = {"sub": "1", "company_code": 100, "emp_id": 1, "permissions": ["user:read"]}
+
+
+def replace_claims(token: str, **overrides) -> str:
+    """서명은 그대로 두고 페이로드 구간만 바꾼 토큰 (변조 토큰)"""
+    header, claims, signature = token.split(".")
+    payload = orjson.loads(base64url_decode(claims))
+    payload.update(overrides)
+    return ".".join((header, base64url_encode(orjson.dumps(payload)).decode(), signature))
+
+
+@pytest.mark.unit
+class TestVerifyToken:
+    """verify_token"""
+
+    def test_valid_access_token(self):
+        """서명/만료/타입이 올바르면 페이로드 반환"""
+        payload = verify_token(create_access_token(CLAIMS), "access")
+
+        assert payload["company_code"] == 100
+        assert payload["type"] == "access"
+
+    def test_wrong_token_type_is_rejected(self):
+        """access 자리에 refresh 토큰을 쓰면 거부"""
+        with pytest.raises(UnauthorizedException) as exc_info:
+            verify_token(create_refresh_token(CLAIMS), "access")
+
+        assert exc_info.value.details == {"expected": "access", "actual": "refresh"}
+
+    def test_expired_token_is_rejected(self):
+        """만료된 토큰 거부"""
+        token = create_access_token(CLAIMS, expires_delta=timedelta(seconds=-1))
+
+        with pytest.raises(UnauthorizedException) as exc_info:
+            verify_token(token, "access")
+
+        assert exc_info.value.message == "Invalid or expired token"
+
+    def test_tampered_claims_are_rejected(self):
+        """페이로드를 바꾼 토큰은 서명 검증에서 거부"""
+        token = replace_claims(create_access_token(CLAIMS), company_code=999)
+
+        with pytest.raises(UnauthorizedException) as exc_info:
+            verify_token(token, "access")
+
+        assert exc_info.value.message == "Invalid or expired token"
+
+    def test_forged_type_claim_is_rejected_as_invalid_signature(self):
+        """type만 바꾼 위조 토큰도 타입 판단 전에 서명 검증에서 거부"""
+        token = replace_claims(create_refresh_token(CLAIMS), type="access")
+
+        with pytest.raises(UnauthorizedException) as exc_info:
+            verify_token(token, "refresh")
+
+        assert exc_info.value.message == "Invalid or expired token"
+
+    def test_missing_required_claim_is_rejected(self):
+        """필수 클레임(emp_id)이 없으면 거부"""
+        token = create_access_token({"sub": "1", "company_code": 100})
+
+        with pytest.raises(UnauthorizedException) as exc_info:
+            verify_token(token, "access")
+
+        assert exc_info.value.details == {"field": "emp_id"}
+
+
+@pytest.mark.unit
+class TestIsWellFormedToken:
+    """is_well_formed_token (서명/만료는 보지 않는 형식 검사)"""
+
+    def test_valid_jwt(self):
+        """발급한 토큰은 통과"""
+        assert is_well_formed_token(create_refresh_token(CLAIMS)) is True
+
+    def test_two_segments(self):
+        """구간이 두 개뿐이면 거부"""
+        header, claims, _ = create_refresh_token(CLAIMS).split(".")
+        assert is_well_formed_token(f"{header}.{claims}") is False
+
+    def test_non_base64url_segment(self):
+        """base64url 문자가 아닌 구간이 있으면 거부"""
+        header, claims, signature = create_refresh_token(CLAIMS).split(".")
+        assert is_well_formed_token(f"{header}.{claims}+/=.{signature}") is False
+
+    def test_empty_string(self):
+        """빈 문자열 거부"""
+        assert is_well_formed_token("") is False
+
+    def test_too_long(self):
+        """MAX_TOKEN_LENGTH를 넘으면 형식이 맞아도 거부"""
+        assert is_well_formed_token("a.b." + "c" * MAX_TOKEN_LENGTH) is False
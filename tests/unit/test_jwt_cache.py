@@ -0,0 +1,114 @@
+"""
+JWT 검증 결과 캐시 단위 테스트
+
+캐시 적중 조건(exp), 만료 항목 제거, 캐시 비활성화, 토큰 타입 분리를 검증합니다.
+"""
+
+import pytest
+
+from server.app.core.config import settings
+from server.app.shared.exceptions import UnauthorizedException
+from server.app.shared.utils import jwt_cache
+from server.app.shared.utils.jwt import create_access_token, create_refresh_token, verify_token
+
+CLAIMS = {"sub": "1", "company_code": 100, "emp_id": 1, "permissions": ["user:read"]}
+
+
+@pytest.fixture(autouse=True)
+def reset_cache(monkeypatch):
+    """테스트마다 캐시를 비우고 캐시를 켠 상태로 시작"""
+    monkeypatch.setattr(settings, "JWT_VERIFY_CACHE_ENABLED", True)
+    jwt_cache.clear_jwt_cache()
+    yield
+    jwt_cache.clear_jwt_cache()
+
+
+@pytest.fixture
+def verify_calls(monkeypatch) -> list[str]:
+    """jwt_cache가 호출하는 verify_token을 감싸 호출 횟수를 기록"""
+    calls: list[str] = []
+
+    def counting_verify_token(token: str, token_type: str = "access"):
+        calls.append(token_type)
+        return verify_token(token, token_type=token_type)
+
+    monkeypatch.setattr(jwt_cache, "verify_token", counting_verify_token)
+    return calls
+
+
+@pytest.mark.unit
+class TestVerifyTokenCached:
+    """verify_token_cached"""
+
+    def test_hit_while_not_expired(self, verify_calls):
+        """exp 이전에는 서명 검증 없이 캐시에서 응답"""
+        token = create_access_token(CLAIMS)
+
+        first = jwt_cache.verify_token_cached(token)
+        second = jwt_cache.verify_token_cached(token)
+
+        assert first == second
+        assert verify_calls == ["access"]
+
+    def test_returns_copy_of_cached_payload(self, verify_calls):
+        """반환값을 수정해도 캐시 항목은 바뀌지 않음"""
+        token = create_access_token(CLAIMS)
+
+        payload = jwt_cache.verify_token_cached(token)
+        payload["company_code"] = 999
+        payload["injected"] = True
+
+        cached = jwt_cache.verify_token_cached(token)
+        assert cached["company_code"] == 100
+        assert "injected" not in cached
+
+    def test_expired_entry_is_evicted(self, monkeypatch, verify_calls):
+        """exp가 지난 항목은 적중으로 보지 않고 제거 후 재검증"""
+        token = create_access_token(CLAIMS)
+        payload = jwt_cache.verify_token_cached(token)
+
+        # 캐시 시계를 exp 이후로 이동하고, 재검증은 만료 예외를 내도록 대체
+        monkeypatch.setattr(jwt_cache.time, "time", lambda: payload["exp"] + 1)
+
+        def expired(token: str, token_type: str = "access"):
+            verify_calls.append(token_type)
+            raise UnauthorizedException(message="Invalid or expired token")
+
+        monkeypatch.setattr(jwt_cache, "verify_token", expired)
+
+        with pytest.raises(UnauthorizedException):
+            jwt_cache.verify_token_cached(token)
+
+        assert verify_calls == ["access", "access"]
+        assert jwt_cache._cache_key(token, "access") not in jwt_cache._cache
+
+    def test_disabled_cache_verifies_every_time(self, monkeypatch, verify_calls):
+        """JWT_VERIFY_CACHE_ENABLED=False면 매번 검증하고 저장하지 않음"""
+        monkeypatch.setattr(settings, "JWT_VERIFY_CACHE_ENABLED", False)
+        token = create_access_token(CLAIMS)
+
+        jwt_cache.verify_token_cached(token)
+        jwt_cache.verify_token_cached(token)
+
+        assert verify_calls == ["access", "access"]
+        assert len(jwt_cache._cache) == 0
+
+    def test_token_type_mismatch_raises_even_when_cached(self, verify_calls):
+        """refresh로 캐시된 토큰도 access로 검증하면 거부"""
+        token = create_refresh_token(CLAIMS)
+        jwt_cache.verify_token_cached(token, token_type="refresh")
+
+        with pytest.raises(UnauthorizedException) as exc_info:
+            jwt_cache.verify_token_cached(token, token_type="access")
+
+        assert exc_info.value.details == {"expected": "access", "actual": "refresh"}
+
+    def test_failed_verification_is_not_cached(self):
+        """검증 실패 토큰은 캐시에 남지 않음"""
+        header_and_claims, _ = create_access_token(CLAIMS).rsplit(".", 1)
+        token = f"{header_and_claims}.{'A' * 43}"
+
+        with pytest.raises(UnauthorizedException):
+            jwt_cache.verify_token_cached(token)
+
+        assert len(jwt_cache._cache) == 0
@@ -0,0 +1,152 @@
+"""
+로그인 이력 기록기 단위 테스트
+
+배치 크기에 따른 기록 경로(executemany INSERT / COPY)와 기록 실패 시 로깅을 검증합니다.
+DB 대신 세션과 asyncpg 원시 커넥션을 가짜 객체로 대체합니다.
+"""
+
+import logging
+from typing import Any
+
+import pytest
+
+from server.app.domain.auth import login_audit
+from server.app.domain.auth.models import LoginHistory
+
+
+def make_rows(count: int) -> list[dict[str, Any]]:
+    """enqueue_login_attempt가 만드는 것과 같은 형태의 행"""
+    rows: list[dict[str, Any]] = []
+    for i in range(count):
+        login_audit.enqueue_login_attempt(
+            company_code=100,
+            email=f"user{i}@example.com",
+            login_method="PASSWORD",
+            success=i % 2 == 0,
+            emp_id=i,
+        )
+        rows.append(login_audit._audit_queue.get_nowait())
+    return rows
+
+
+class FakeSession:
+    """AsyncSessionLocal() 대체: execute 인자와 commit 여부를 기록"""
+
+    def __init__(self, calls: dict[str, Any]):
+        self.calls = calls
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        self.calls["statement"] = statement
+        self.calls["params"] = params
+
+    async def commit(self):
+        self.calls["committed"] = True
+
+
+class FakeDriverConnection:
+    """asyncpg 커넥션 대체: copy_records_to_table 인자를 기록"""
+
+    def __init__(self, calls: dict[str, Any]):
+        self.calls = calls
+
+    async def copy_records_to_table(self, table_name, *, records, columns):
+        self.calls["table_name"] = table_name
+        self.calls["records"] = records
+        self.calls["columns"] = columns
+
+
+class FakeRawConnection:
+    def __init__(self, calls: dict[str, Any]):
+        self.driver_connection = FakeDriverConnection(calls)
+
+
+class FakeConnection:
+    def __init__(self, calls: dict[str, Any]):
+        self.calls = calls
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get_raw_connection(self):
+        return FakeRawConnection(self.calls)
+
+
+class FakeEngine:
+    """engine.connect() 대체"""
+
+    def __init__(self, calls: dict[str, Any]):
+        self.calls = calls
+
+    def connect(self):
+        return FakeConnection(self.calls)
+
+
+@pytest.fixture
+def session_calls(monkeypatch) -> dict[str, Any]:
+    """executemany 경로의 세션 호출 기록"""
+    calls: dict[str, Any] = {}
+    monkeypatch.setattr(login_audit, "AsyncSessionLocal", lambda: FakeSession(calls))
+    return calls
+
+
+@pytest.fixture
+def copy_calls(monkeypatch) -> dict[str, Any]:
+    """COPY 경로의 원시 커넥션 호출 기록"""
+    calls: dict[str, Any] = {}
+    monkeypatch.setattr(login_audit, "engine", FakeEngine(calls))
+    return calls
+
+
+@pytest.mark.unit
+class TestWriteBatch:
+    """_write_batch"""
+
+    async def test_small_batch_uses_executemany(self, session_calls, copy_calls):
+        """AUDIT_COPY_THRESHOLD 미만이면 한 번의 executemany INSERT 후 커밋"""
+        rows = make_rows(login_audit.AUDIT_COPY_THRESHOLD - 1)
+
+        await login_audit._write_batch(rows)
+
+        assert session_calls["statement"].table.name == LoginHistory.__tablename__
+        assert session_calls["params"] == rows
+        assert session_calls["committed"] is True
+        assert copy_calls == {}
+
+    async def test_large_batch_uses_copy(self, session_calls, copy_calls):
+        """AUDIT_COPY_THRESHOLD 이상이면 COPY로 기록 (컬럼 순서대로 튜플 변환)"""
+        rows = make_rows(login_audit.AUDIT_COPY_THRESHOLD)
+
+        await login_audit._write_batch(rows)
+
+        assert copy_calls["table_name"] == LoginHistory.__tablename__
+        assert copy_calls["columns"] == login_audit._COPY_COLUMNS
+        assert len(copy_calls["records"]) == len(rows)
+        assert copy_calls["records"][0] == tuple(
+            rows[0][column] for column in login_audit._COPY_COLUMNS
+        )
+        assert session_calls == {}
+
+    async def test_failure_is_logged_with_traceback(self, monkeypatch, caplog):
+        """기록 실패는 예외를 올리지 않고 traceback과 함께 로깅"""
+
+        async def failing_copy(batch):
+            raise RuntimeError("connection lost")
+
+        monkeypatch.setattr(login_audit, "_copy_batch", failing_copy)
+        rows = make_rows(login_audit.AUDIT_COPY_THRESHOLD)
+
+        with caplog.at_level(logging.ERROR, logger=login_audit.logger.name):
+            await login_audit._write_batch(rows)
+
+        record = caplog.records[-1]
+        assert record.getMessage() == f"Failed to write {len(rows)} login audit entries"
+        assert record.exc_info is not None
@@ -0,0 +1,103 @@
+"""
+비밀번호 유틸리티 단위 테스트
+
+Argon2id 해싱/검증, 기존 BCRYPT 해시 검증과 재해싱 판단, 잘못된 해시 거부를 검증합니다.
+"""
+
+import bcrypt
+import pytest
+from argon2 import PasswordHasher
+
+from server.app.shared.utils.password import (
+    hash_password,
+    hash_password_async,
+    is_password_hash,
+    needs_update,
+    verify_password,
+    verify_password_async,
+)
+
+PASSWORD = "correct horse battery staple"
+
+
+@pytest.fixture(scope="module")
+def argon2_hash() -> str:
+    """현재 설정으로 만든 Argon2id 해시"""
+    return hash_password(PASSWORD)
+
+
+@pytest.fixture(scope="module")
+def bcrypt_hash() -> str:
+    """기존 방식(BCRYPT)으로 저장된 해시 (테스트 속도를 위해 최소 cost)"""
+    return bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(rounds=4)).decode()
+
+
+@pytest.mark.unit
+class TestArgon2:
+    """Argon2id 해시"""
+
+    def test_hash_is_argon2id(self, argon2_hash):
+        """새 해시는 Argon2id 형식"""
+        assert argon2_hash.startswith("$argon2id$")
+        assert is_password_hash(argon2_hash)
+
+    def test_verify(self, argon2_hash):
+        """일치/불일치 검증"""
+        assert verify_password(PASSWORD, argon2_hash) is True
+        assert verify_password("wrong password", argon2_hash) is False
+
+    def test_current_parameters_need_no_update(self, argon2_hash):
+        """현재 파라미터 해시는 재해싱 대상이 아님"""
+        assert needs_update(argon2_hash) is False
+
+    def test_old_parameters_need_update(self):
+        """파라미터가 다른 Argon2id 해시는 재해싱 대상"""
+        old_hash = PasswordHasher(time_cost=1, memory_cost=8, parallelism=1).hash(PASSWORD)
+
+        assert verify_password(PASSWORD, old_hash) is True
+        assert needs_update(old_hash) is True
+
+    async def test_async_variants(self):
+        """전용 스레드 풀에서 해싱/검증"""
+        hashed = await hash_password_async(PASSWORD)
+
+        assert await verify_password_async(PASSWORD, hashed) is True
+        assert await verify_password_async("wrong password", hashed) is False
+
+
+@pytest.mark.unit
+class TestBcryptLegacy:
+    """기존 BCRYPT 해시"""
+
+    def test_verify(self, bcrypt_hash):
+        """기존 해시도 검증 가능"""
+        assert is_password_hash(bcrypt_hash)
+        assert verify_password(PASSWORD, bcrypt_hash) is True
+        assert verify_password("wrong password", bcrypt_hash) is False
+
+    def test_needs_update(self, bcrypt_hash):
+        """BCRYPT 해시는 항상 Argon2id 재해싱 대상"""
+        assert needs_update(bcrypt_hash) is True
+
+
+@pytest.mark.unit
+class TestMalformedHash:
+    """잘못된 형식의 해시"""
+
+    @pytest.mark.parametrize(
+        "stored",
+        [
+            "$argon2id$v=19$m=47104,t=1,p=1$not-a-valid-hash",
+            "$2b$12$tooshort",
+            "$2b$12$" + "!" * 53,
+            "not a hash at all",
+            "",
+        ],
+    )
+    def test_garbage_hash_is_rejected(self, stored):
+        """예외 없이 False 반환"""
+        assert verify_password(PASSWORD, stored) is False
+
+    def test_garbage_argon2_hash_needs_update(self):
+        """파싱할 수 없는 Argon2id 해시는 재해싱 대상"""
+        assert needs_update("$argon2id$garbage") is True